@@ -0,0 +1,132 @@
+"""
+Planner Calibration: Measure the query planner's cost coefficients on this machine.
+
+This script times word-list loading, index builds, index loads and sample
+queries for every method, divides each measurement by the feature the planner's
+cost model scales it with, and stores the median ratios as the calibration file
+read by `src.query_planner`. Methods are opened through the solver registry, as
+the CLI opens them: index builds and loads go through the shared word table and
+ID-based indexes. They are written to a scratch data directory, so the saved
+indexes are left alone. Other registered methods (e.g. plugins) have their open
+and query times divided by the dictionary size.
+
+Example Usage:
+    python -m benchmarks.calibrate_planner --word-list data/words_alpha.txt
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+from utils.data_loader import WordListLoader, load_word_list
+from utils.word_table import open_word_table
+from src.query_planner import CALIBRATION_PATH, MODELED_METHODS
+from src.solver_registry import SolverEngine, available_solvers, get_solver_factory
+
+DEFAULT_QUERIES: List[str] = ["cat", "listen", "bookkeeper", "mississippi", "abcdefghijklmno"]
+
+
+def timed(function: Callable[[], object]) -> float:
+    """
+    Run a function once and return its duration.
+
+    Args:
+        function (Callable[[], object]): The function to run.
+
+    Returns:
+        float: The duration in seconds.
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def calibrate(word_list_path: str, queries: List[str]) -> Dict[str, float]:
+    """
+    Measure the planner's cost coefficients.
+
+    Args:
+        word_list_path (str): Path to the word list file.
+        queries (List[str]): Sample query words.
+
+    Returns:
+        Dict[str, float]: The calibrated coefficients.
+    """
+    word_list_path = os.path.abspath(word_list_path)  # The methods are opened from a scratch directory
+    start = time.perf_counter()
+    word_list = load_word_list(word_list_path)
+    n = len(word_list)
+    coefficients: Dict[str, float] = {
+        "load_words_per_word": (time.perf_counter() - start) / n,
+        "bytes_per_word": os.path.getsize(word_list_path) / n,
+    }
+    del word_list
+
+    load_words = WordListLoader(word_list_path)
+    engines: Dict[str, SolverEngine] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        previous_directory = os.getcwd()
+        os.chdir(directory)
+        try:
+            os.mkdir("data")  # The registered index paths are relative to the data directory
+            open_word_table(load_words)  # Built once; later CLI runs find it saved
+            for method in available_solvers(include_server_only=False):
+                factory = get_solver_factory(method)
+                if method == "brute_force":
+                    engines[method] = factory(load_words)
+                elif method in MODELED_METHODS:
+                    # The first open builds and saves the index, the second loads it
+                    coefficients[f"{method}_build_per_word"] = timed(lambda: factory(load_words)) / n
+                    start = time.perf_counter()
+                    engines[method] = factory(load_words)
+                    coefficients[f"{method}_load_per_word"] = (time.perf_counter() - start) / n
+                else:
+                    start = time.perf_counter()
+                    engines[method] = factory(load_words)
+                    coefficients[f"{method}_open_per_word"] = (time.perf_counter() - start) / n
+
+            # Each query cost is divided by the feature the planner scales it with
+            features: Dict[str, Tuple[str, Callable[[str], float]]] = {
+                "brute_force": ("brute_force_per_word", lambda word: n),
+                "hashmap_sorted": ("hashmap_sorted_per_subset_letter", lambda word: (2.0 ** len(word)) * len(word)),
+                "hashmap_frequency": ("hashmap_frequency_per_key", lambda word: n),
+                "trie_frequency": (
+                    "trie_frequency_per_path",
+                    lambda word: min(math.prod(word.count(c) + 1 for c in set(word)), n),
+                ),
+            }
+            for method, engine in engines.items():
+                coefficient, feature = features.get(method, (f"{method}_per_word", lambda word: n))
+                ratios = [timed(lambda: engine.solve(word)) / feature(word) for word in queries]
+                coefficients[coefficient] = statistics.median(ratios)
+        finally:
+            os.chdir(previous_directory)  # Leave the directory before it is removed
+    return coefficients
+
+
+def main() -> None:
+    """
+    Parse command-line arguments, run the calibration and store the result.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Calibrate the query planner's cost model.")
+    parser.add_argument("--word-list", default="data/words_alpha.txt", help="Path to the word list file")
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES, help="Sample query words")
+    parser.add_argument("--output", default=CALIBRATION_PATH, help="Path of the calibration file to write")
+    args = parser.parse_args()
+
+    coefficients = calibrate(args.word_list, args.queries)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(coefficients, f, indent=2, sort_keys=True)
+    for name, value in sorted(coefficients.items()):
+        print(f"{name:<36} {value:.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Scaling Benchmark: Measure every method on large synthetic dictionaries.
+
+For each dictionary size, this script generates a seeded synthetic word list
+that matches the letter distribution and length histogram of a source list,
+then measures every registered method in a fresh child process, opened through
+the solver registry as the CLI opens it (shared word table and ID-based indexes,
+written to a scratch data directory). Server-only engines such as sharded are
+measured too:
+- Build time: the first open, which builds the word table and the index
+  (word list load time for brute_force).
+- Index size on disk: the files the method saved, word table included (the word
+  list file size for brute_force).
+- Peak resident memory of the measuring process (for sharded, the coordinator;
+  the shard nodes run in their own processes).
+- Query latency for random queries of increasing length (median per length).
+
+A method that crashes, runs out of memory or exceeds the timeout is reported
+as failed, which marks where it falls off a cliff.
+
+Example Usage:
+    python -m benchmarks.scaling --sizes 1000000 10000000 50000000 --output data/scaling.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+from multiprocessing.connection import wait
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+from utils.data_loader import load_word_list
+from utils.word_list_generator import WordListGenerator
+from src.solver_registry import available_solvers
+
+DEFAULT_SIZES: List[int] = [1_000_000, 10_000_000, 50_000_000]
+DEFAULT_QUERY_LENGTHS: List[int] = [4, 8, 12, 16]
+EXIT_TIMEOUT: float = 30.0  # Seconds a child that sent its figures may take to exit
+
+
+def measure_method(
+    method: str, word_list_path: str, index_dir: str, queries: Dict[int, List[str]], results: Any
+) -> None:
+    """
+    Measure one method in the current (child) process and put the figures on a queue.
+
+    Args:
+        method (str): The method name.
+        word_list_path (str): Absolute path to the synthetic word list.
+        index_dir (str): Directory whose data/ subdirectory receives the method's saved files.
+        queries (Dict[int, List[str]]): Query words keyed by their length.
+        results (Any): The sending end of a multiprocessing pipe receiving the figures.
+    """
+    # Engine modules are imported here so that the parent process stays small
+    from utils.data_loader import WordListLoader
+    from src.solver_registry import get_solver_factory
+
+    data_dir = os.path.join(index_dir, "data")
+    os.makedirs(data_dir)
+    previous_directory = os.getcwd()
+    os.chdir(index_dir)  # The registered index paths are relative to the data directory
+    try:
+        factory = get_solver_factory(method)
+        start = time.perf_counter()
+        engine = factory(WordListLoader(word_list_path))
+        build_seconds = time.perf_counter() - start
+        saved = [os.path.join(data_dir, name) for name in os.listdir(data_dir)]
+        index_bytes = sum(map(os.path.getsize, saved)) if saved else os.path.getsize(word_list_path)
+        shutil.rmtree(data_dir)  # Open files (e.g. the mapped word table) stay readable
+
+        latencies: Dict[int, float] = {}
+        for length, words in queries.items():
+            timings = []
+            for word in words:
+                query_start = time.perf_counter()
+                engine.solve(word)
+                timings.append(time.perf_counter() - query_start)
+            latencies[length] = statistics.median(timings)
+    finally:
+        os.chdir(previous_directory)
+
+    # Engines with helper processes (e.g. sharded) must stop them before the parent may kill this one
+    shard_cluster = sys.modules.get("src.shard_cluster")
+    if shard_cluster is not None:
+        shard_cluster.close_local_clusters()
+
+    results.send({
+        "build_s": build_seconds,
+        "index_mb": index_bytes / 1e6,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,  # ru_maxrss is in KiB on Linux
+        "latency_ms": {length: seconds * 1e3 for length, seconds in latencies.items()},
+    })
+
+
+def run_method(
+    method: str, word_list_path: str, index_dir: str, queries: Dict[int, List[str]], timeout: float
+) -> Dict[str, Any]:
+    """
+    Measure one method in a fresh process so that memory figures do not mix.
+
+    Args:
+        method (str): The method name.
+        word_list_path (str): Path to the synthetic word list.
+        index_dir (str): Directory for the method's saved files.
+        queries (Dict[int, List[str]]): Query words keyed by their length.
+        timeout (float): Seconds to wait before the run is reported as failed.
+
+    Returns:
+        Dict[str, Any]: The measured figures, or {"failed": reason}.
+    """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=measure_method, args=(method, word_list_path, index_dir, queries, sender))
+    process.start()
+    sender.close()  # Only the child writes, so a dead child shows up as EOF
+    try:
+        # Wake up on the figures or on the child's exit, whichever comes first
+        if not wait([receiver, process.sentinel], timeout=timeout):
+            return {"failed": "timeout"}
+        try:
+            figures = receiver.recv()
+        except EOFError:
+            process.join()
+            return {"failed": f"exit code {process.exitcode}"}  # Crashed or killed, e.g. out of memory
+        process.join(EXIT_TIMEOUT)  # Let it run its exit handlers; only a child that hangs is killed
+        return figures
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+
+def main() -> None:
+    """
+    Parse command-line arguments, run the benchmark and report the results.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark every method on large synthetic dictionaries.")
+    parser.add_argument("--word-list", default="data/words_alpha.txt", help="Source list whose shape is matched")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="Dictionary sizes in words")
+    methods = available_solvers()
+    parser.add_argument("--methods", nargs="+", choices=methods, default=methods, help="Methods to measure")
+    parser.add_argument("--query-lengths", nargs="+", type=int, default=DEFAULT_QUERY_LENGTHS, help="Query lengths")
+    parser.add_argument("--queries-per-length", type=int, default=5, help="Random queries per length")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for words and queries")
+    parser.add_argument("--timeout", type=float, default=3600, help="Seconds allowed per method and size")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    generator = WordListGenerator(load_word_list(args.word_list), seed=args.seed)
+    queries = {
+        length: [generator.random_word(length) for _ in range(args.queries_per_length)]
+        for length in args.query_lengths
+    }
+
+    report: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            word_list_path = os.path.join(work_dir, f"synthetic_{size}.txt")
+            start = time.perf_counter()
+            generator.write_word_list(word_list_path, size)
+            print(f"\nGenerated {size:,} words in {time.perf_counter() - start:.1f}s")
+
+            report[size] = {}
+            latency_columns = "".join(f"{f'q{length} ms':>10}" for length in args.query_lengths)
+            print(f"{'method':<20}{'build s':>10}{'index MB':>10}{'RSS MB':>10}{latency_columns}")
+            for method in args.methods:
+                index_dir = os.path.join(work_dir, f"{method}_{size}")
+                figures = run_method(method, word_list_path, index_dir, queries, args.timeout)
+                shutil.rmtree(index_dir, ignore_errors=True)  # Left behind by a failed run
+                report[size][method] = figures
+                if "failed" in figures:
+                    print(f"{method:<20}failed ({figures['failed']})")
+                    continue
+                latencies = "".join(f"{figures['latency_ms'][length]:>10.2f}" for length in args.query_lengths)
+                print(
+                    f"{method:<20}{figures['build_s']:>10.2f}{figures['index_mb']:>10.1f}"
+                    f"{figures['peak_rss_mb']:>10.1f}{latencies}"
+                )
+            os.remove(word_list_path)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
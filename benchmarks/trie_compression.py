@@ -0,0 +1,139 @@
+"""
+Trie Compression Benchmark: Compare the per-letter, count-compressed and minimized Frequency Tries.
+
+This script builds each trie variant from a word list and reports, for each one:
+- Node count (distinct nodes for the DAWG) and maximum depth.
+- Build time.
+- Pickle size.
+- Query time for a set of sample words.
+
+Example Usage:
+    python -m benchmarks.trie_compression --word-list data/words_alpha.txt
+"""
+
+import argparse
+import pickle
+import time
+from typing import Callable, Dict, List, Tuple, Union
+from utils.data_loader import load_word_list
+from utils.data_manager import DataManager
+from utils.frequency_dawg import DawgNode, FrequencyDawg
+from utils.frequency_trie import FrequencyTrie, TrieNode
+from src.trie_frequency_solver import TrieFrequencySolver
+
+DEFAULT_QUERIES: List[str] = ["cat", "listen", "bookkeeper", "mississippi", "supercalifragilistic"]
+
+
+def child_nodes(node: Union[TrieNode, DawgNode]) -> List[Union[TrieNode, DawgNode]]:
+    """
+    List the children of a trie or DAWG node.
+
+    Args:
+        node (Union[TrieNode, DawgNode]): The node to expand.
+
+    Returns:
+        List[Union[TrieNode, DawgNode]]: The child nodes.
+    """
+    if isinstance(node, DawgNode):
+        return [child for _, child, _ in node.edges]
+    return list(node.children.values())
+
+
+def count_nodes_and_depth(root: Union[TrieNode, DawgNode]) -> Tuple[int, int]:
+    """
+    Count the distinct nodes of a trie or DAWG and measure its maximum depth.
+
+    Heights are memoized by node identity, so shared DAWG nodes are counted and
+    expanded only once.
+
+    Args:
+        root (Union[TrieNode, DawgNode]): The root node of the trie or DAWG.
+
+    Returns:
+        Tuple[int, int]: The number of distinct nodes and the maximum depth (in edges).
+    """
+    heights: Dict[int, int] = {}
+
+    def height(node: Union[TrieNode, DawgNode]) -> int:
+        if id(node) not in heights:
+            heights[id(node)] = max((height(child) + 1 for child in child_nodes(node)), default=0)
+        return heights[id(node)]
+
+    max_depth = height(root)
+    return len(heights), max_depth
+
+
+def measure(
+    build: Callable[[List[str]], Union[FrequencyTrie, FrequencyDawg]], word_list: List[str], queries: List[str], repeat: int
+) -> Dict[str, float]:
+    """
+    Build a trie variant and collect its shape, size and timing figures.
+
+    Args:
+        build (Callable[[List[str]], Union[FrequencyTrie, FrequencyDawg]]): The DataManager factory for the variant.
+        word_list (List[str]): The words to index.
+        queries (List[str]): The sample query words.
+        repeat (int): How many times to run each query; the best time is kept.
+
+    Returns:
+        Dict[str, float]: The measured figures keyed by name.
+    """
+    start = time.perf_counter()
+    trie = build(word_list)
+    build_seconds = time.perf_counter() - start
+
+    node_count, max_depth = count_nodes_and_depth(trie.root)
+    pickle_bytes = len(pickle.dumps(trie, protocol=pickle.HIGHEST_PROTOCOL))
+
+    solver = TrieFrequencySolver(trie)
+    query_seconds = 0.0
+    for query in queries:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            solver.find_anagrams_and_subanagrams(query)
+            timings.append(time.perf_counter() - start)
+        query_seconds += min(timings)
+
+    return {
+        "nodes": node_count,
+        "depth": max_depth,
+        "build_s": build_seconds,
+        "pickle_mb": pickle_bytes / 1e6,
+        "query_ms": query_seconds * 1e3,
+    }
+
+
+def main() -> None:
+    """
+    Parse command-line arguments, run the benchmark and print a comparison table.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Compare per-letter, count-compressed and minimized Frequency Tries.")
+    parser.add_argument("--word-list", default="data/words_alpha.txt", help="Path to the word list file")
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES, help="Sample query words")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (best time is reported)")
+    args = parser.parse_args()
+
+    word_list = load_word_list(args.word_list)
+    variants = {
+        "FrequencyTrie": DataManager.create_frequency_trie,
+        "CountFrequencyTrie": DataManager.create_count_frequency_trie,
+        "FrequencyDawg": DataManager.create_frequency_dawg,
+    }
+    results = {name: measure(build, word_list, args.queries, args.repeat) for name, build in variants.items()}
+
+    columns = ["nodes", "depth", "build_s", "pickle_mb", "query_ms"]
+    print(f"{'variant':<20}" + "".join(f"{column:>12}" for column in columns))
+    for name, figures in results.items():
+        cells = [
+            f"{figures[column]:>12.2f}" if isinstance(figures[column], float) else f"{figures[column]:>12}"
+            for column in columns
+        ]
+        print(f"{name:<20}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,28 +3,198 @@ Anagram Solver: A script to find anagrams and sub-anagrams of a given word or wo
 
 This script supports multiple methods for solving anagrams and sub-anagrams:
 - brute_force: Uses a brute-force approach to find anagrams and sub-anagrams.
-- trie_frequency: Uses a FrequencyTrie data structure to find anagrams and sub-anagrams.
+- trie_frequency: Uses a minimized, count-compressed FrequencyTrie (DAWG) to find anagrams and sub-anagrams.
 - hashmap_sorted: Uses a hash map with sorted letters as keys.
 - hashmap_frequency: Uses a hash map with letter frequency counts.
+The sharded engine (the frequency hash map split by word length across local shard
+processes, see `src.shard_cluster`) is server-only: starting its cluster for a single
+run costs seconds, so it is not offered here.
 
 Command-line Arguments:
 - word(s): The word(s) for which to find anagrams and sub-anagrams.
-- method: The solving method to use (default: brute_force).
+- method: The solving method to use, or "auto" to let the query planner pick the
+  cheapest method per word (default: brute_force).
 - word-list: Path to the word list file (default: "data/words_alpha.txt").
+- format: Output format, one of text, ndjson, tsv or binary (default: text).
+- order: Word ordering within each result, one of none, alpha or length (default: none).
+- plan-log: File to append the planner's decisions to when --method is auto (default: stderr).
+- mode: What to report per word: list (the words), count (anagram count and
+  sub-anagram counts per length) or exists (whether any anagram / sub-anagram
+  exists). count and exists never build result strings (default: list).
+- timing: Print a startup timing report (imports, arg-parse, index open, solve) and the
+  slowest module imports, timed like `python -X importtime`, to stderr.
+
+Subcommands:
+- stats: Report node/key counts, depth, fan-out and bucket size histograms, memory and serialized
+  sizes and pathological buckets of the saved indexes, e.g. `python main.py stats --json`.
+- bulk: Solve a query file (one word per line, or "-" for stdin) on a process pool,
+  in input order, with checkpoints for resuming and progress on stderr, e.g.
+  `python main.py bulk queries.txt --output results.ndjson --workers 8 --resume`.
+A subcommand is only recognized as the first argument; `python main.py -- stats`
+looks up the word "stats" itself.
+
+Solvers are resolved through `src.solver_registry`, so only the selected method's
+module (and its index dependencies) is imported.
 
 Example Usage:
     python main.py "cat bat" --method hashmap_frequency --word-list data/words_alpha.txt
+    python main.py "cat bat" --method trie_frequency --format ndjson --order alpha
+    python main.py "cat supercalifragilistic" --method auto --plan-log data/planner_decisions.log
+    python main.py "listen" --method trie_frequency --mode count
 """
 
-import argparse
-from typing import List
-from utils.data_loader import load_word_list
-from utils.data_manager import DataManager
-from utils.input_validator import validate_input_word
-from src.brute_force_solver import BruteForceAnagramSolver
-from src.trie_frequency_solver import TrieFrequencySolver
-from src.hashmap_sorted_solver import HashMapSolver
-from src.hashmap_frequency_solver import HashMapFrequencySolver
+import time
+import sys
+
+# Taken before the remaining imports so that --timing can report them
+STARTUP_TIME: float = time.perf_counter()
+STARTUP_MODULE_COUNT: int = len(sys.modules)
+
+from utils.startup_timer import ImportTimer, StartupTimer  # noqa: E402
+
+# Times every following import, including the engine modules imported on demand
+IMPORT_TIMER: ImportTimer = ImportTimer()
+if "--timing" in sys.argv[1:]:
+    IMPORT_TIMER.install()
+
+import argparse  # noqa: E402
+from typing import Callable, Dict, List  # noqa: E402
+from utils.data_loader import WordListLoader  # noqa: E402
+from utils.input_validator import validate_input_word  # noqa: E402
+from utils.output_writers import ORDERINGS, WRITERS, create_writer, open_stdout, silence_broken_pipe  # noqa: E402
+from src.solver_registry import SolverEngine, available_solvers, get_index_path, get_solver_factory  # noqa: E402
+
+
+def stats(argv: List[str]) -> None:
+    """
+    Run the `stats` subcommand: report the statistics of the saved indexes.
+
+    Args:
+        argv (List[str]): The command-line arguments following `stats`.
+
+    Returns:
+        None
+    """
+    import json
+    from utils.data_manager import DataManager
+    from utils.word_table import WORD_TABLE_PATH, WordTable
+
+    indexed_methods = [method for method in available_solvers() if get_index_path(method) is not None]
+    parser = argparse.ArgumentParser(prog="main.py stats", description="Report index size and shape statistics.")
+    parser.add_argument(
+        "--method",
+        nargs="+",
+        choices=indexed_methods,
+        default=indexed_methods,
+        help="Methods whose saved index should be inspected",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the statistics as JSON")
+    args = parser.parse_args(argv)
+
+    # Indexes store IDs into the shared word table; it resolves the bucket samples
+    word_table = WordTable.load(WORD_TABLE_PATH) if DataManager.is_data_saved(WORD_TABLE_PATH) else None
+    report: Dict[str, Dict] = {}
+    for method in args.method:
+        index_path = get_index_path(method)
+        if not DataManager.is_data_saved(index_path):
+            print(f"{method}: no saved index at {index_path} (run a query with --method {method} first)",
+                  file=sys.stderr)
+            continue
+        if word_table is None or not DataManager.is_data_current(index_path, WORD_TABLE_PATH):
+            # Its word IDs refer to an older (or missing) word table and would resolve to the wrong words
+            print(f"{method}: saved index at {index_path} predates the word table "
+                  f"(run a query with --method {method} to rebuild it)", file=sys.stderr)
+            continue
+        report[method] = DataManager.index_stats(DataManager.load_data(index_path), index_path, word_table)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for method, index_stats in report.items():
+        print(f"\n{method} ({index_stats['type']})")
+        print("=" * (len(method) + len(index_stats["type"]) + 3))
+        if "nodes" in index_stats:
+            print(f"Nodes: {index_stats['nodes']}")
+        print(f"Keys: {index_stats['keys']}, words: {index_stats['words']}, "
+              f"avg words per key: {index_stats['avg_words_per_key']:.2f}")
+        print(f"Max depth: {index_stats['max_depth']}")
+        print(f"Depth histogram: {index_stats['depth_histogram']}")
+        if "fanout_histogram" in index_stats:
+            print(f"Fan-out histogram: {index_stats['fanout_histogram']}")
+        print(f"Bucket size histogram: {index_stats['bucket_size_histogram']}")
+        print(f"In-memory size: {index_stats['deep_bytes'] / 1e6:.1f} MB, "
+              f"serialized size: {index_stats['serialized_bytes'] / 1e6:.1f} MB")
+        for bucket in index_stats["large_buckets"]:
+            print(f"Large anagram group: {bucket['words']} words, e.g. {', '.join(bucket['sample'])}")
+        for chain in index_stats["deep_chains"]:
+            print(f"Deep chain: {chain['nodes']} unary nodes along '{chain['letters']}'")
+
+
+def bulk(argv: List[str]) -> None:
+    """
+    Run the `bulk` subcommand: solve a query file with a pool of worker processes.
+
+    Args:
+        argv (List[str]): The command-line arguments following `bulk`.
+
+    Returns:
+        None
+    """
+    from src.bulk_runner import BulkJobRunner, CHECKPOINT_INTERVAL, DEFAULT_BATCH_SIZE, bulk_methods
+
+    parser = argparse.ArgumentParser(prog="main.py bulk", description="Solve a query file in parallel.")
+    parser.add_argument("input", help="Query file with one word per line, or - for stdin")
+    parser.add_argument("--output", default=None, help="Output file (default: stdout, without checkpoints)")
+    parser.add_argument("--method", choices=bulk_methods(), default="hashmap_frequency", help="Method to use")
+    parser.add_argument("--word-list", default="data/words_alpha.txt", help="Path to the word list file")
+    parser.add_argument("--mode", choices=["list", "count", "exists"], default="list", help="What to report")
+    parser.add_argument("--format", choices=list(WRITERS), default="ndjson", help="Output format")
+    parser.add_argument("--order", choices=list(ORDERINGS), default="none", help="Ordering of the words")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Queries per worker batch")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (default: <output>.checkpoint)")
+    parser.add_argument(
+        "--checkpoint-interval", type=float, default=CHECKPOINT_INTERVAL, help="Seconds between checkpoints"
+    )
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint of a previous run")
+    args = parser.parse_args(argv)
+    if (args.checkpoint or args.resume) and args.output is None:
+        parser.error("--checkpoint and --resume need --output (results written to stdout cannot be resumed)")
+
+    runner = BulkJobRunner(
+        args.method,
+        args.word_list,
+        mode=args.mode,
+        output_format=args.format,
+        order=args.order,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        checkpoint_interval=args.checkpoint_interval,
+    )
+    try:
+        runner.run(args.input, args.output, args.checkpoint, args.resume)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    except KeyboardInterrupt:
+        resume_hint = ", resume with --resume" if args.output is not None else ""
+        print(f"Interrupted{resume_hint}.", file=sys.stderr)
+        sys.exit(130)
+    except BrokenPipeError:
+        silence_broken_pipe()  # The reader (e.g. `head`) has all it wants
+        sys.exit(1)
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+# Subcommands, dispatched on the first argument; "--" before a word looks up the word itself
+SUBCOMMANDS: Dict[str, Callable[[List[str]], None]] = {"stats": stats, "bulk": bulk}
+
+SUBCOMMAND_HELP: str = """subcommands:
+  stats    report the size and shape of the saved indexes (main.py stats --help)
+  bulk     solve a query file in parallel (main.py bulk --help)
+
+To look up the word "stats" or "bulk" itself, put -- before it: main.py -- stats"""
 
 
 def main() -> None:
@@ -35,20 +205,60 @@ def main() -> None:
     Returns:
         None
     """
+    subcommand = SUBCOMMANDS.get(sys.argv[1]) if len(sys.argv) > 1 else None
+    if subcommand is not None:
+        subcommand(sys.argv[2:])
+        return
+
+    timer = StartupTimer(STARTUP_TIME, STARTUP_MODULE_COUNT)
+    timer.mark("import")
+
     # Parse command-line arguments
-    parser = argparse.ArgumentParser(description="Find anagrams and sub-anagrams.")
+    parser = argparse.ArgumentParser(
+        description="Find anagrams and sub-anagrams.",
+        epilog=SUBCOMMAND_HELP,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
     parser.add_argument("words", help="The word(s) to analyze, separated by spaces")
     parser.add_argument(
         "--method",
-        choices=["brute_force", "trie_frequency", "hashmap_sorted", "hashmap_frequency"],
+        choices=available_solvers(include_server_only=False) + ["auto"],
         default="brute_force",
-        help="Method to use for solving",
+        help="Method to use for solving (auto: cost-based choice per word)",
     )
     parser.add_argument(
         "--word-list",
         default="data/words_alpha.txt",
         help="Path to the word list file",
     )
+    parser.add_argument(
+        "--format",
+        choices=list(WRITERS),
+        default="text",
+        help="Output format (one record per input word)",
+    )
+    parser.add_argument(
+        "--order",
+        choices=list(ORDERINGS),
+        default="none",
+        help="Ordering of the words within each result",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["list", "count", "exists"],
+        default="list",
+        help="Report the words, only their counts, or only whether any exist",
+    )
+    parser.add_argument(
+        "--plan-log",
+        default=None,
+        help="File to append query planner decisions to (default: stderr)",
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Print a startup timing report to stderr",
+    )
     args = parser.parse_args()
 
     # Split and validate input words
@@ -59,87 +269,57 @@ def main() -> None:
             sanitized_word = validate_input_word(word)
             sanitized_words.append(sanitized_word)
         except ValueError as e:
-            print(f"Error with input word '{word}': {e}")
+            # Machine-readable formats keep errors out of the data stream
+            print(f"Error with input word '{word}': {e}", file=sys.stdout if args.format == "text" else sys.stderr)
             return
+    timer.mark("arg-parse")
 
-    # Load the word list
-    try:
-        word_list: List[str] = load_word_list(args.word_list)
-    except FileNotFoundError:
-        print(f"Error: Word list file not found at {args.word_list}.")
-        return
+    load_words = WordListLoader(args.word_list)  # Only called by solvers that need the words
 
-    if not word_list:
-        print("Error: Word list is empty. Please provide a valid dataset.")
-        return
+    solvers: Dict[str, SolverEngine] = {}
 
-    # Paths for serialized data
-    hash_map_save_path: str = "data/hash_map_data.pkl"
-    frequency_trie_save_path: str = "data/frequency_trie_data.pkl"
-    frequency_hash_map_save_path: str = "data/frequency_hash_map_data.pkl"
+    def open_solver(method: str) -> SolverEngine:
+        """Import the method's engine and open (or build) its index on first use."""
+        if method not in solvers:
+            solver_factory = get_solver_factory(method)
+            timer.mark(f"engine-import:{method}")
+            solvers[method] = solver_factory(load_words)
+            timer.mark(f"index-open:{method}")
+            if planner is not None:
+                planner.mark_opened(method)  # Only once the open succeeded
+        return solvers[method]
 
-    # Process each sanitized word
-    for word in sanitized_words:
-        try:
-            if args.method == "brute_force":
-                solver = BruteForceAnagramSolver(word_list)
-                anagrams, sub_anagrams = solver.find_anagrams_and_subanagrams(word)
+    planner = None
+    if args.method == "auto":
+        import logging
+        from src.query_planner import QueryPlanner  # Only needed for auto routing
 
-            elif args.method == "trie_frequency":
-                if DataManager.is_data_saved(frequency_trie_save_path):
-                    frequency_trie = DataManager.load_data(frequency_trie_save_path)
-                else:
-                    frequency_trie = DataManager.create_frequency_trie(word_list)
-                    DataManager.save_data(frequency_trie, frequency_trie_save_path)
-                solver = TrieFrequencySolver(frequency_trie)
-                anagrams, sub_anagrams = solver.find_anagrams_and_subanagrams(word)
-
-            elif args.method == "hashmap_sorted":
-                if DataManager.is_data_saved(hash_map_save_path):
-                    hash_map = DataManager.load_data(hash_map_save_path)
-                else:
-                    hash_map = DataManager.create_hash_map(word_list)
-                    DataManager.save_data(hash_map, hash_map_save_path)
-                solver = HashMapSolver(hash_map)
-                anagrams, sub_anagrams = solver.find_anagrams_and_subanagrams(word)
-
-            elif args.method == "hashmap_frequency":
-                if DataManager.is_data_saved(frequency_hash_map_save_path):
-                    frequency_hash_map = DataManager.load_data(frequency_hash_map_save_path)
+        logging.basicConfig(filename=args.plan_log, level=logging.INFO, format="%(asctime)s %(message)s")
+        planner = QueryPlanner(args.word_list)
+
+    # Process each sanitized word, streaming results through a buffered writer
+    writer = create_writer(args.format, open_stdout(), args.order)
+    try:
+        for word in sanitized_words:
+            try:
+                engine = open_solver(planner.choose(word) if planner else args.method)
+                if args.mode == "count":
+                    writer.write_count(word, *engine.count(word))
+                elif args.mode == "exists":
+                    writer.write_exists(word, *engine.exists(word))
                 else:
-                    frequency_hash_map = DataManager.create_hash_map_with_frequencies(word_list)
-                    DataManager.save_data(frequency_hash_map, frequency_hash_map_save_path)
-                solver = HashMapFrequencySolver(frequency_hash_map)
-                anagrams, sub_anagrams = solver.find_anagrams_and_sub_anagrams(word)
-
-            else:
-                raise ValueError(f"Unsupported method: {args.method}")
-
-            # Output results for the current word in a readable format
-            print(f"\nResults for the word: '{word}'")
-            print("=" * (len(word) + 20))  # Adds a separator line for better readability
-
-            # Display anagrams
-            if anagrams:
-                print(f"Anagrams ({len(anagrams)}):")
-                print(", ".join(anagrams))
-            else:
-                print("Anagrams: None")
-
-            # Display sub-anagrams
-            if sub_anagrams:
-                print(f"Sub-anagrams ({len(sub_anagrams)}):")
-                print(", ".join(sub_anagrams))
-            else:
-                print("Sub-anagrams: None")
-
-            # Add explanatory text
-            print("\nNote: All these anagrams and sub-anagrams are from the dataset therefore are considered to be valid English words.")
-
-            print("-" * 40)  # Adds a bottom separator
-
-        except (FileNotFoundError, ValueError, KeyError) as e:
-            print(f"Error during solving for word '{word}': {e}")
+                    writer.write_result(word, *engine.solve(word))
+            except (FileNotFoundError, ValueError, KeyError) as e:
+                writer.write_error(word, str(e))
+        writer.close()
+    except BrokenPipeError:
+        silence_broken_pipe()  # The reader (e.g. `head`) has all it wants
+        sys.exit(1)
+    timer.mark("solve")
+
+    if args.timing:
+        print(timer.report(), file=sys.stderr)
+        print(IMPORT_TIMER.report(), file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,297 @@
+"""
+Async Solver: An asyncio facade over a solver engine with request coalescing.
+
+Async servers should not block their event loop on a search, and bursts of
+identical letter racks should not each pay for a full search. This module
+wraps a SolverEngine for use from asyncio code:
+- Single-flight coalescing: concurrent requests for the same operation and the
+  same sorted letters share one computation. Results only depend on the
+  letters, so every caller gets the same answer. Callers receive the same
+  result objects and must not modify them.
+- Searches run on a configurable executor (the loop's default thread pool
+  unless one is given), so the event loop stays responsive. A process pool
+  from `create_process_engine` runs searches in parallel across cores.
+- Backpressure: at most `max_concurrency` computations run at once (further
+  ones wait their turn), and requests beyond `max_pending` outstanding ones
+  are rejected immediately with SolverBusyError.
+- Deadlines: each request can time out. A caller that gives up only stops
+  waiting; a computation still shared with other callers keeps running, and
+  one that no caller waits for any more is dropped if it has not started yet.
+
+Example Usage:
+    from src.async_solver import AsyncSolver
+    from src.solver_registry import get_solver_factory
+
+    engine = get_solver_factory("hashmap_frequency")(WordListLoader("data/words_alpha.txt"))
+    solver = AsyncSolver(engine, max_concurrency=4, timeout=2.0)
+    anagrams, sub_anagrams = await solver.solve("listen")
+    results = await asyncio.gather(solver.solve("listen"), solver.solve("silent"))  # One search
+"""
+
+import asyncio
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Collection, Dict, Optional, Tuple
+from utils.data_loader import WordListLoader
+from utils.input_validator import validate_input_word
+from src.solver_registry import SolverEngine, get_solver_factory
+
+DEFAULT_MAX_CONCURRENCY: int = 4
+DEFAULT_MAX_PENDING: int = 1024
+
+_worker_engine: Optional[SolverEngine] = None  # The worker process's engine, opened by _init_worker
+
+
+class SolverBusyError(RuntimeError):
+    """Raised when a request arrives while `max_pending` requests are already outstanding."""
+
+
+class _Flight:
+    """
+    A computation shared by every request for the same operation and letters.
+
+    Attributes:
+        task (Optional[asyncio.Task]): The computation.
+        waiters (int): The number of requests waiting for it.
+        dispatched (bool): Whether it has been handed to the executor.
+    """
+
+    __slots__ = ("task", "waiters", "dispatched")
+
+    def __init__(self) -> None:
+        self.task: Optional[asyncio.Task] = None
+        self.waiters: int = 0
+        self.dispatched: bool = False
+
+
+class AsyncSolver:
+    """
+    Answers solve, count and exists requests from asyncio code.
+
+    Attributes:
+        engine (SolverEngine): The engine whose functions are run.
+        executor (Optional[Executor]): The executor searches run on, or None for the loop's default.
+        max_pending (int): The number of outstanding requests beyond which requests are rejected.
+        timeout (Optional[float]): The default deadline of a request in seconds, or None for no deadline.
+        stats (Counter): Counts of "requests", "computations", "coalesced", "rejected" and "timeouts".
+    """
+
+    def __init__(
+        self,
+        engine: SolverEngine,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the facade.
+
+        Args:
+            engine (SolverEngine): The engine whose functions are run.
+            executor (Optional[Executor]): The executor searches run on, or None for the loop's default.
+            max_concurrency (int): The number of computations allowed to run at once.
+            max_pending (int): The number of outstanding requests beyond which requests are rejected.
+            timeout (Optional[float]): The default deadline of a request in seconds, or None for no deadline.
+
+        Raises:
+            ValueError: If `max_concurrency` or `max_pending` is not positive.
+        """
+        if max_concurrency < 1 or max_pending < 1:
+            raise ValueError("max_concurrency and max_pending must be positive.")
+        self.engine: SolverEngine = engine
+        self.executor: Optional[Executor] = executor
+        self.max_pending: int = max_pending
+        self.timeout: Optional[float] = timeout
+        self.stats: Counter = Counter()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self._pending: int = 0
+
+    async def solve(self, word: str, timeout: Optional[float] = None) -> Tuple[Collection[str], Collection[str]]:
+        """
+        Find all anagrams and sub-anagrams of the word.
+
+        Args:
+            word (str): The input word.
+            timeout (Optional[float]): The deadline in seconds, or None for the solver's default.
+
+        Returns:
+            Tuple[Collection[str], Collection[str]]:
+                - The anagrams of the input word.
+                - The sub-anagrams of the input word.
+
+        Raises:
+            ValueError: If the word has no alphabetic characters.
+            SolverBusyError: If too many requests are outstanding.
+            asyncio.TimeoutError: If the deadline passes first.
+        """
+        return await self._request("solve", word, timeout)
+
+    async def count(self, word: str, timeout: Optional[float] = None) -> Tuple[int, Dict[int, int]]:
+        """
+        Count anagrams and sub-anagrams of the word.
+
+        Args:
+            word (str): The input word.
+            timeout (Optional[float]): The deadline in seconds, or None for the solver's default.
+
+        Returns:
+            Tuple[int, Dict[int, int]]:
+                - The number of anagrams of the input word.
+                - The number of sub-anagrams keyed by their length.
+
+        Raises:
+            ValueError: If the word has no alphabetic characters.
+            SolverBusyError: If too many requests are outstanding.
+            asyncio.TimeoutError: If the deadline passes first.
+        """
+        return await self._request("count", word, timeout)
+
+    async def exists(self, word: str, timeout: Optional[float] = None) -> Tuple[bool, bool]:
+        """
+        Check whether the word has any anagram and any sub-anagram.
+
+        Args:
+            word (str): The input word.
+            timeout (Optional[float]): The deadline in seconds, or None for the solver's default.
+
+        Returns:
+            Tuple[bool, bool]: Whether an anagram exists, and whether a sub-anagram exists.
+
+        Raises:
+            ValueError: If the word has no alphabetic characters.
+            SolverBusyError: If too many requests are outstanding.
+            asyncio.TimeoutError: If the deadline passes first.
+        """
+        return await self._request("exists", word, timeout)
+
+    async def _request(self, operation: str, word: str, timeout: Optional[float]) -> Any:
+        """
+        Join the computation for the word's letters, starting it if none is in flight.
+
+        Steps:
+        1. Reject the request if `max_pending` requests are outstanding.
+        2. Look up the flight keyed by the operation and the sorted letters, or start one.
+        3. Wait for the flight's result, shielded so that a caller timing out or being
+           cancelled does not cancel the computation for the others.
+        4. Drop the flight if no caller waits for it any more and it has not started.
+
+        Args:
+            operation (str): "solve", "count" or "exists".
+            word (str): The input word.
+            timeout (Optional[float]): The deadline in seconds, or None for the solver's default.
+
+        Returns:
+            Any: The engine's answer.
+        """
+        word = validate_input_word(word)
+        if self._pending >= self.max_pending:
+            self.stats["rejected"] += 1
+            raise SolverBusyError(f"{self._pending} requests are already pending.")
+
+        self.stats["requests"] += 1
+        key = (operation, "".join(sorted(word)))
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight()
+            flight.task = asyncio.ensure_future(self._compute(flight, operation, word))
+            flight.task.add_done_callback(partial(self._land, key, flight))
+            self.stats["computations"] += 1
+        else:
+            self.stats["coalesced"] += 1
+
+        flight.waiters += 1
+        self._pending += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight.task), self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise
+        finally:
+            self._pending -= 1
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.dispatched and not flight.task.done():
+                self._land(key, flight)  # Forget it now so that new requests start afresh
+                flight.task.cancel()
+
+    async def _compute(self, flight: _Flight, operation: str, word: str) -> Any:
+        """
+        Run one engine function on the executor once a concurrency slot is free.
+
+        Args:
+            flight (_Flight): The flight being computed.
+            operation (str): "solve", "count" or "exists".
+            word (str): The validated input word.
+
+        Returns:
+            Any: The engine's answer.
+        """
+        async with self._semaphore:
+            flight.dispatched = True  # The executor cannot stop it any more
+            function = getattr(self.engine, operation)
+            return await asyncio.get_running_loop().run_in_executor(self.executor, function, word)
+
+    def _land(self, key: Tuple[str, str], flight: _Flight, task: Optional[asyncio.Task] = None) -> None:
+        """
+        Forget a finished or abandoned flight.
+
+        Args:
+            key (Tuple[str, str]): The flight's operation and sorted letters.
+            flight (_Flight): The flight.
+            task (Optional[asyncio.Task]): The finished task, when called as its done callback.
+        """
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if task is not None and not task.cancelled():
+            task.exception()  # Mark an error as retrieved even if every caller gave up
+
+
+def _init_worker(method: str, word_list_path: str) -> None:
+    """
+    Open the method's engine once per worker process.
+
+    Args:
+        method (str): The method name.
+        word_list_path (str): Path to the word list file.
+    """
+    global _worker_engine
+    _worker_engine = get_solver_factory(method)(WordListLoader(word_list_path))
+
+
+def _query_in_worker(operation: str, word: str) -> Any:
+    """
+    Run one engine function in a worker process.
+
+    Args:
+        operation (str): "solve", "count" or "exists".
+        word (str): The validated input word.
+
+    Returns:
+        Any: The engine's answer.
+    """
+    return getattr(_worker_engine, operation)(word)
+
+
+def create_process_engine(
+    method: str, word_list_path: str, workers: int
+) -> Tuple[SolverEngine, ProcessPoolExecutor]:
+    """
+    Create a process pool whose workers each open the method's engine, and an engine that runs on it.
+
+    Searches are pure Python, so threads take turns on one core; worker processes run them in
+    parallel. Pass both to AsyncSolver and shut the executor down when done.
+
+    Args:
+        method (str): The method name.
+        word_list_path (str): Path to the word list file.
+        workers (int): The number of worker processes.
+
+    Returns:
+        Tuple[SolverEngine, ProcessPoolExecutor]: The engine, whose functions only work on the
+            executor, and the executor.
+    """
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(method, word_list_path))
+    engine = SolverEngine(*(partial(_query_in_worker, operation) for operation in SolverEngine._fields))
+    return engine, executor
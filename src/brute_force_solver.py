@@ -18,7 +18,8 @@ Date: 11-15-2024
 """
 
 from collections import Counter
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Tuple
+from src.solver_registry import SolverEngine
 
 
 class BruteForceAnagramSolver:
@@ -55,6 +56,35 @@ class BruteForceAnagramSolver:
         """
         return Counter(word)
 
+    def _iter_matches(self, word_input: str) -> Iterator[Tuple[str, bool]]:
+        """
+        Lazily scan the word list for anagrams and sub-anagrams of the input word.
+
+        Args:
+            word_input (str): The lowercase input word.
+
+        Yields:
+            Tuple[str, bool]: A matching word and True if it is an anagram (False for a sub-anagram).
+        """
+        # Calculate the letter frequency of the input word
+        input_letter_counts = self._get_letter_count(word_input)
+
+        for word in self.words:
+            # Normalize each word in the list
+            word = word.lower()
+            word_letter_counts = self._get_letter_count(word)
+
+            # Check if the word is an anagram
+            if len(word) == len(word_input) and word_letter_counts == input_letter_counts:
+                yield word, True
+
+            # Check if the word is a sub-anagram
+            elif len(word) < len(word_input) and all(
+                word_letter_counts[letter] <= input_letter_counts[letter]
+                for letter in word_letter_counts
+            ):
+                yield word, False
+
     def find_anagrams_and_subanagrams(self, word_input: str) -> Tuple[List[str], List[str]]:
         """
         Find anagrams and sub-anagrams of the input word.
@@ -72,30 +102,70 @@ class BruteForceAnagramSolver:
                 - A list of anagrams of the input word.
                 - A list of sub-anagrams of the input word.
         """
-        # Normalize the input word to lowercase
-        word_input = word_input.lower()
-
-        # Calculate the letter frequency of the input word
-        input_letter_counts = self._get_letter_count(word_input)
-
         # Initialize lists to store results
         anagrams: List[str] = []
         sub_anagrams: List[str] = []
 
-        for word in self.words:
-            # Normalize each word in the list
-            word = word.lower()
-            word_letter_counts = self._get_letter_count(word)
+        for word, is_anagram in self._iter_matches(word_input.lower()):
+            (anagrams if is_anagram else sub_anagrams).append(word)
 
-            # Check if the word is an anagram
-            if len(word) == len(word_input) and word_letter_counts == input_letter_counts:
-                anagrams.append(word)
+        return anagrams, sub_anagrams
 
-            # Check if the word is a sub-anagram
-            elif len(word) < len(word_input) and all(
-                word_letter_counts[letter] <= input_letter_counts[letter]
-                for letter in word_letter_counts
-            ):
-                sub_anagrams.append(word)
+    def count_anagrams_and_subanagrams(self, word_input: str) -> Tuple[int, Dict[int, int]]:
+        """
+        Count anagrams and sub-anagrams of the input word without collecting them.
 
-        return anagrams, sub_anagrams
+        Args:
+            word_input (str): The input word to analyze.
+
+        Returns:
+            Tuple[int, Dict[int, int]]:
+                - The number of anagrams of the input word.
+                - The number of sub-anagrams keyed by their length.
+        """
+        anagram_count = 0
+        sub_anagram_counts: Dict[int, int] = {}
+        for word, is_anagram in self._iter_matches(word_input.lower()):
+            if is_anagram:
+                anagram_count += 1
+            else:
+                sub_anagram_counts[len(word)] = sub_anagram_counts.get(len(word), 0) + 1
+        return anagram_count, dict(sorted(sub_anagram_counts.items()))
+
+    def anagrams_and_subanagrams_exist(self, word_input: str) -> Tuple[bool, bool]:
+        """
+        Check whether the input word has any anagram and any sub-anagram.
+
+        The scan stops as soon as one of each has been found.
+
+        Args:
+            word_input (str): The input word to analyze.
+
+        Returns:
+            Tuple[bool, bool]: Whether an anagram exists, and whether a sub-anagram exists.
+        """
+        has_anagram = has_sub_anagram = False
+        for _, is_anagram in self._iter_matches(word_input.lower()):
+            has_anagram = has_anagram or is_anagram
+            has_sub_anagram = has_sub_anagram or not is_anagram
+            if has_anagram and has_sub_anagram:
+                break
+        return has_anagram, has_sub_anagram
+
+
+def create_solver(load_words: Callable[[], List[str]]) -> SolverEngine:
+    """
+    Create the brute-force engine for the solver registry.
+
+    Args:
+        load_words (Callable[[], List[str]]): Loads the word list on demand.
+
+    Returns:
+        SolverEngine: The solve, count and exists functions of the solver.
+    """
+    solver = BruteForceAnagramSolver(load_words())
+    return SolverEngine(
+        solver.find_anagrams_and_subanagrams,
+        solver.count_anagrams_and_subanagrams,
+        solver.anagrams_and_subanagrams_exist,
+    )
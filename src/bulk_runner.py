@@ -0,0 +1,447 @@
+"""
+Bulk Runner: Resumable, parallel solving of query files.
+
+This module answers large query files (one query word per line, from a file or
+stdin) with a pool of worker processes:
+- Each worker opens the selected method's index once, in its initializer, and
+  then solves batches of queries.
+- Batches complete out of order; a reorder buffer holds finished batches until
+  every earlier batch has been written, so the output keeps the input order.
+- At most a fixed window of batches is in flight, so the input is streamed and
+  memory stays bounded however long the file is.
+- When writing to a file, a checkpoint records how many input lines have been
+  written and the output size at that point. A crashed run started again with
+  `resume=True` truncates the output to that size and skips those lines.
+- Throughput (and, for files, ETA) is reported periodically on stderr.
+
+Example Usage:
+    from src.bulk_runner import BulkJobRunner
+
+    runner = BulkJobRunner("hashmap_frequency", "data/words_alpha.txt", workers=8)
+    runner.run("queries.txt", "results.ndjson", resume=True)
+
+    python main.py bulk queries.txt --output results.ndjson --method hashmap_frequency --workers 8 --resume
+"""
+
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+from utils.data_loader import WordListLoader
+from utils.data_manager import DataManager
+from utils.input_validator import validate_input_word
+from utils.output_writers import BUFFER_SIZE, ResultWriter, create_writer, open_stdout
+from utils.word_table import WORD_TABLE_PATH, open_word_table
+from src.solver_registry import SolverEngine, available_solvers, get_index_path, get_solver_factory, is_server_only
+
+DEFAULT_BATCH_SIZE: int = 256
+BATCHES_PER_WORKER: int = 4  # In-flight batches per worker
+CHECKPOINT_INTERVAL: float = 30.0
+PROGRESS_INTERVAL: float = 5.0
+
+# (status, query, payload): status is "ok" with the engine's answer, or "error" with a message
+QueryRecord = Tuple[str, str, Any]
+
+_engine: Optional[SolverEngine] = None  # The worker process's engine, opened by _init_worker
+_init_error: Optional[str] = None  # Why _init_worker could not open the engine
+
+
+def bulk_methods() -> List[str]:
+    """
+    List the methods that can solve query files.
+
+    Server-only methods cannot run in a worker pool: every sharded worker would start
+    its own shard cluster.
+
+    Returns:
+        List[str]: The registered method names, except the server-only ones.
+    """
+    return available_solvers(include_server_only=False)
+
+
+def _init_worker(method: str, word_list_path: str) -> None:
+    """
+    Open the method's engine once per worker process.
+
+    A failure is recorded and reported by the worker's first batch, instead of
+    breaking the pool with a traceback and no cause. Workers ignore Ctrl-C, which
+    the parent process handles, so that an interrupted run prints no worker tracebacks.
+
+    Args:
+        method (str): The method name.
+        word_list_path (str): Path to the word list file.
+    """
+    global _engine, _init_error
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        _engine = get_solver_factory(method)(WordListLoader(word_list_path))
+    except (Exception, SystemExit) as e:  # The word list loader exits when the file is missing
+        _init_error = f"could not open the {method} engine: {type(e).__name__}: {e}"
+
+
+def _solve_batch(mode: str, queries: List[str]) -> List[QueryRecord]:
+    """
+    Solve a batch of queries in a worker process.
+
+    Args:
+        mode (str): One of "list", "count" or "exists".
+        queries (List[str]): The raw query words.
+
+    Returns:
+        List[QueryRecord]: One record per query, in input order.
+
+    Raises:
+        RuntimeError: If the worker could not open its engine.
+    """
+    if _engine is None:
+        raise RuntimeError(f"Worker {os.getpid()} {_init_error}")
+    solve = {"list": _engine.solve, "count": _engine.count, "exists": _engine.exists}[mode]
+    records: List[QueryRecord] = []
+    for query in queries:
+        try:
+            word = validate_input_word(query)
+            records.append(("ok", word, solve(word)))
+        except (FileNotFoundError, ValueError, KeyError) as e:
+            records.append(("error", query, str(e)))
+    return records
+
+
+def _count_lines(file_path: str) -> int:
+    """
+    Count the lines of a file without decoding it.
+
+    Args:
+        file_path (str): The file path.
+
+    Returns:
+        int: The number of lines (a last line without a newline counts too).
+    """
+    lines = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        while chunk := f.read(BUFFER_SIZE):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    return lines + (last != b"\n")
+
+
+def _format_duration(seconds: float) -> str:
+    """
+    Format a duration as hours, minutes and seconds.
+
+    Args:
+        seconds (float): The duration in seconds.
+
+    Returns:
+        str: The duration, e.g. "1h02m05s".
+    """
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{secs:02d}s" if hours else f"{minutes}m{secs:02d}s"
+
+
+class BulkJobRunner:
+    """
+    Solves query files in parallel with ordered, resumable output.
+
+    Attributes:
+        method (str): The solving method.
+        word_list_path (str): Path to the word list file.
+        mode (str): One of "list", "count" or "exists".
+        output_format (str): One of the output writer formats.
+        order (str): Word ordering within each result.
+        workers (int): Number of worker processes.
+        batch_size (int): Queries per batch sent to a worker.
+        checkpoint_interval (float): Seconds between checkpoints.
+        progress_interval (float): Seconds between progress reports.
+        progress (TextIO): Stream receiving progress reports.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        word_list_path: str,
+        mode: str = "list",
+        output_format: str = "ndjson",
+        order: str = "none",
+        workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        checkpoint_interval: float = CHECKPOINT_INTERVAL,
+        progress_interval: float = PROGRESS_INTERVAL,
+        progress: TextIO = sys.stderr,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            method (str): The solving method.
+            word_list_path (str): Path to the word list file.
+            mode (str): One of "list", "count" or "exists".
+            output_format (str): One of the output writer formats.
+            order (str): Word ordering within each result.
+            workers (Optional[int]): Number of worker processes (default: CPU count).
+            batch_size (int): Queries per batch sent to a worker.
+            checkpoint_interval (float): Seconds between checkpoints.
+            progress_interval (float): Seconds between progress reports.
+            progress (TextIO): Stream receiving progress reports.
+
+        Raises:
+            ValueError: If the method cannot run in a worker pool.
+        """
+        if is_server_only(method):
+            raise ValueError(f"Method {method} cannot solve query files; choose one of {', '.join(bulk_methods())}.")
+        self.method: str = method
+        self.word_list_path: str = word_list_path
+        self.mode: str = mode
+        self.output_format: str = output_format
+        self.order: str = order
+        self.workers: int = workers or os.cpu_count() or 1
+        self.batch_size: int = batch_size
+        self.checkpoint_interval: float = checkpoint_interval
+        self.progress_interval: float = progress_interval
+        self.progress: TextIO = progress
+
+    def run(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+    ) -> int:
+        """
+        Solve every query of the input and write the records in input order.
+
+        Steps:
+        1. Load the checkpoint when resuming, and open the output accordingly.
+        2. Build the method's index once in this process if it is not saved yet,
+           so that the workers only load it.
+        3. Stream batches to the pool, keeping a bounded window in flight.
+        4. Write finished batches through the reorder buffer, checkpointing periodically.
+
+        Args:
+            input_path (str): The query file, or "-" for stdin.
+            output_path (Optional[str]): The output file (default: stdout, without checkpoints).
+                Checkpoints need a regular file: records already written to a pipe or
+                device cannot be truncated or re-read when resuming.
+            checkpoint_path (Optional[str]): The checkpoint file (default: output path + ".checkpoint").
+            resume (bool): Continue from the checkpoint if there is one.
+
+        Returns:
+            int: The number of queries answered by this run.
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different job, or checkpoints are
+                requested without a regular output file.
+            RuntimeError: If a worker process fails.
+        """
+        regular_output = output_path is not None and (not os.path.exists(output_path) or os.path.isfile(output_path))
+        if (checkpoint_path is not None or resume) and not regular_output:
+            raise ValueError("Checkpoints and resuming need an output path that is a regular file.")
+        if regular_output and checkpoint_path is None:
+            checkpoint_path = output_path + ".checkpoint"
+        job = {
+            "input": os.path.abspath(input_path) if input_path != "-" else "-",
+            "word_list": os.path.abspath(self.word_list_path),
+            "method": self.method,
+            "mode": self.mode,
+            "format": self.output_format,
+            "order": self.order,
+        }
+        checkpoint = self._load_checkpoint(checkpoint_path, job) if resume and checkpoint_path else None
+        lines_done = checkpoint["lines_done"] if checkpoint else 0
+        queries_done = checkpoint["queries_done"] if checkpoint else 0
+
+        # Counting the input first also fails on a missing input before the output is touched
+        total_lines = _count_lines(input_path) if input_path != "-" else None
+        if output_path is None:
+            stream = open_stdout()
+        elif checkpoint:
+            stream = open(output_path, "r+b", buffering=BUFFER_SIZE)
+            stream.truncate(checkpoint["output_bytes"])  # Drop records written after the checkpoint
+            stream.seek(0, os.SEEK_END)
+        else:
+            stream = open(output_path, "wb", buffering=BUFFER_SIZE)
+        # A checkpoint taken before the first record (e.g. while batch 0 was still running) precedes the header
+        header = checkpoint is None or checkpoint["output_bytes"] == 0
+        writer = create_writer(self.output_format, stream, self.order, header=header)
+
+        index_path = get_index_path(self.method)
+        if index_path is not None:
+            # Bring the word table and the index up to date once, instead of in every worker
+            load_words = WordListLoader(self.word_list_path)
+            open_word_table(load_words)
+            if not DataManager.is_data_current(index_path, WORD_TABLE_PATH):
+                get_solver_factory(self.method)(load_words)
+
+        input_stream = sys.stdin if input_path == "-" else open(input_path, "r", encoding="utf-8")
+        start = time.perf_counter()
+        start_lines = lines_done
+        last_checkpoint = last_progress = start
+        try:
+            window = self.workers * BATCHES_PER_WORKER
+            batches = self._read_batches(input_stream, lines_done)
+            pending: Dict[Future, int] = {}  # Future -> batch index
+            batch_lines: Dict[int, int] = {}  # Batch index -> input lines it covers
+            reorder_buffer: Dict[int, List[QueryRecord]] = {}
+            next_batch = next_write = 0
+            exhausted = False
+            with ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                     initargs=(self.method, self.word_list_path)) as pool:
+                while True:
+                    # Keep the window full without reading the whole input
+                    while not exhausted and len(pending) + len(reorder_buffer) < window:
+                        batch = next(batches, None)
+                        if batch is None:
+                            exhausted = True
+                            break
+                        lines, queries = batch
+                        pending[pool.submit(_solve_batch, self.mode, queries)] = next_batch
+                        batch_lines[next_batch] = lines
+                        next_batch += 1
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            reorder_buffer[pending.pop(future)] = future.result()
+                        except BrokenExecutor as e:
+                            raise RuntimeError(f"A worker process died unexpectedly ({e}).") from e
+
+                    # Write every batch whose predecessors have all been written
+                    while next_write in reorder_buffer:
+                        records = reorder_buffer.pop(next_write)
+                        self._write_records(writer, records)
+                        lines_done += batch_lines.pop(next_write)
+                        queries_done += len(records)
+                        next_write += 1
+
+                    now = time.perf_counter()
+                    if checkpoint_path and now - last_checkpoint >= self.checkpoint_interval:
+                        self._save_checkpoint(checkpoint_path, job, writer, lines_done, queries_done)
+                        last_checkpoint = now
+                    if now - last_progress >= self.progress_interval:
+                        self._report_progress(queries_done, lines_done - start_lines, total_lines, lines_done, now - start)
+                        last_progress = now
+            writer.close()
+        finally:
+            if input_stream is not sys.stdin:
+                input_stream.close()
+            if output_path is not None:
+                stream.close()
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)  # The job is complete
+        self._report_progress(
+            queries_done, lines_done - start_lines, total_lines, lines_done, time.perf_counter() - start
+        )
+        return queries_done - (checkpoint["queries_done"] if checkpoint else 0)
+
+    def _read_batches(self, input_stream: TextIO, skip_lines: int) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Stream batches of queries, one query per non-blank line.
+
+        Args:
+            input_stream (TextIO): The query stream.
+            skip_lines (int): Lines already answered by a previous run.
+
+        Yields:
+            Tuple[int, List[str]]: The number of input lines a batch covers and its queries.
+        """
+        lines = 0
+        queries: List[str] = []
+        for line_number, line in enumerate(input_stream):
+            if line_number < skip_lines:
+                continue
+            lines += 1
+            query = line.strip()
+            if query:
+                queries.append(query)
+            if len(queries) == self.batch_size:
+                yield lines, queries
+                lines, queries = 0, []
+        if lines:
+            yield lines, queries
+
+    def _write_records(self, writer: ResultWriter, records: List[QueryRecord]) -> None:
+        """
+        Write the records of one batch.
+
+        Args:
+            writer (ResultWriter): The output writer.
+            records (List[QueryRecord]): The batch's records.
+        """
+        write = {"list": writer.write_result, "count": writer.write_count, "exists": writer.write_exists}[self.mode]
+        for status, word, payload in records:
+            if status == "ok":
+                write(word, *payload)
+            else:
+                writer.write_error(word, payload)
+
+    def _load_checkpoint(self, checkpoint_path: str, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Load a checkpoint and check that it belongs to this job.
+
+        Args:
+            checkpoint_path (str): The checkpoint file.
+            job (Dict[str, Any]): The job's input and settings.
+
+        Returns:
+            Optional[Dict[str, Any]]: The checkpoint, or None if there is none.
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different job.
+        """
+        if not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        mismatched = [key for key, value in job.items() if checkpoint.get(key) != value]
+        if mismatched:
+            raise ValueError(f"Checkpoint {checkpoint_path} belongs to a different job ({', '.join(mismatched)} differ).")
+        return checkpoint
+
+    def _save_checkpoint(
+        self, checkpoint_path: str, job: Dict[str, Any], writer: ResultWriter, lines_done: int, queries_done: int
+    ) -> None:
+        """
+        Make the written records durable, then atomically record how far the job got.
+
+        Args:
+            checkpoint_path (str): The checkpoint file.
+            job (Dict[str, Any]): The job's input and settings.
+            writer (ResultWriter): The output writer.
+            lines_done (int): Input lines whose records have been written.
+            queries_done (int): Queries whose records have been written.
+        """
+        writer.stream.flush()
+        os.fsync(writer.stream.fileno())
+        checkpoint = dict(job, lines_done=lines_done, queries_done=queries_done, output_bytes=writer.stream.tell())
+        temporary_path = checkpoint_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(temporary_path, checkpoint_path)
+
+    def _report_progress(
+        self, queries_done: int, run_lines: int, total_lines: Optional[int], lines_done: int, elapsed: float
+    ) -> None:
+        """
+        Print throughput and, when the input size is known, progress and ETA.
+
+        Args:
+            queries_done (int): Queries answered so far, including previous runs.
+            run_lines (int): Input lines processed by this run.
+            total_lines (Optional[int]): Input lines in total, if known.
+            lines_done (int): Input lines processed so far, including previous runs.
+            elapsed (float): Seconds since this run started.
+        """
+        rate = run_lines / elapsed if elapsed > 0 else 0.0
+        message = f"{queries_done:,} queries, {rate:,.0f} lines/s, elapsed {_format_duration(elapsed)}"
+        if total_lines:
+            eta = (total_lines - lines_done) / rate if rate > 0 else float("inf")
+            eta_text = _format_duration(eta) if eta != float("inf") else "unknown"
+            message += f", {100 * lines_done / total_lines:.1f}% of {total_lines:,} lines, ETA {eta_text}"
+        print(message, file=self.progress, flush=True)
@@ -10,12 +10,21 @@ Features:
 
 Limitations:
 - The preloaded hash map must be generated externally and passed during initialization.
+- A hash map of WordTable IDs needs its WordTable to resolve the results to words.
+- Only the letters 'a'-'z' are indexed: dictionary words with other letters (accents,
+  apostrophes) or more than 127 copies of a letter are left out of the hash map.
+- Saved hash maps with the legacy tuple keys are not migrated in place: they hold
+  words rather than WordTable IDs, so they are detected and rebuilt.
 
 Author: Sai Sharan Thirunagari
 Date: 11-15-2024
 """
 
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from utils.data_manager import DataManager
+from utils.letter_signature import iter_sub_signatures, pack_query_letter_counts, signature_length
+from utils.word_table import WORD_TABLE_PATH, WordTable, open_word_table
+from src.solver_registry import SolverEngine, get_index_path
 
 
 class HashMapFrequencySolver:
@@ -23,23 +32,40 @@ class HashMapFrequencySolver:
     A solver to find anagrams and sub-anagrams using a hash map with letter frequency counts.
 
     Attributes:
-        word_letter_counts (Dict[Tuple[Tuple[str, int], ...], List[str]]): 
-            A dictionary mapping sorted letter frequency tuples to corresponding words.
+        word_letter_counts (Dict[int, Sequence[Union[str, int]]]):
+            A dictionary mapping packed letter-count signatures to corresponding words (or their IDs).
+        word_table (Optional[WordTable]): Resolves the word IDs, if the hash map stores IDs.
 
     Methods:
         find_anagrams_and_sub_anagrams(word: str) -> Tuple[List[str], List[str]]:
             Finds anagrams and sub-anagrams for a given input word.
     """
 
-    def __init__(self, word_letter_counts: Dict[Tuple[Tuple[str, int], ...], List[str]]) -> None:
+    def __init__(
+        self, word_letter_counts: Dict[int, Sequence[Union[str, int]]], word_table: Optional[WordTable] = None
+    ) -> None:
         """
         Initialize the HashMapFrequencySolver with a preloaded hash map.
 
         Args:
-            word_letter_counts (Dict[Tuple[Tuple[str, int], ...], List[str]]): 
-                A dictionary mapping sorted letter frequency tuples to corresponding words.
+            word_letter_counts (Dict[int, Sequence[Union[str, int]]]):
+                A dictionary mapping packed letter-count signatures to corresponding words (or their IDs).
+            word_table (Optional[WordTable]): Resolves the word IDs, if the hash map stores IDs.
         """
-        self.word_letter_counts: Dict[Tuple[Tuple[str, int], ...], List[str]] = word_letter_counts
+        self.word_letter_counts: Dict[int, Sequence[Union[str, int]]] = word_letter_counts
+        self.word_table: Optional[WordTable] = word_table
+
+    def _resolve(self, words: Iterable[Union[str, int]]) -> List[str]:
+        """
+        Resolve stored words or word IDs to words.
+
+        Args:
+            words (Iterable[Union[str, int]]): Words, or WordTable IDs if the solver has a word table.
+
+        Returns:
+            List[str]: The words.
+        """
+        return self.word_table.lookup(words) if self.word_table is not None else list(words)
 
     def find_anagrams_and_sub_anagrams(self, word: str) -> Tuple[List[str], List[str]]:
         """
@@ -50,9 +76,9 @@ class HashMapFrequencySolver:
 
         Steps:
         1. Normalize the input word to lowercase.
-        2. Generate the letter frequency dictionary for the input word.
-        3. Find exact anagrams by matching the sorted frequency tuple.
-        4. Iterate through the hash map to find sub-anagrams by comparing frequency subsets.
+        2. Pack the letter counts of the input word into an integer signature.
+        3. Find exact anagrams by matching the signature.
+        4. Iterate through the hash map to find sub-anagrams with a subtract-and-mask subset test.
 
         Args:
             word (str): The input word to analyze.
@@ -63,39 +89,111 @@ class HashMapFrequencySolver:
                 - A list of sub-anagrams of the input word (excluding exact anagrams).
         """
         word = word.lower()  # Normalize input to lowercase
-        input_letter_counts = self._get_letter_counts(word)  # Frequency of input word letters
-        input_letter_counts_tuple = tuple(sorted(input_letter_counts.items()))  # Convert to sorted tuple
+        input_signature, exact = pack_query_letter_counts(word)
 
-        # Find exact anagrams (exact key match)
-        anagrams = self.word_letter_counts.get(input_letter_counts_tuple, [])
+        # Find exact anagrams (exact key match); a clamped signature cannot match exactly
+        anagrams = self.word_letter_counts.get(input_signature, []) if exact else []
 
-        sub_anagrams: List[str] = []
+        sub_anagrams: List[Union[str, int]] = []
         # Find sub-anagrams (subset matches)
-        for candidate_counts_tuple, candidate_words in self.word_letter_counts.items():
-            candidate_letter_counts = dict(candidate_counts_tuple)
-            # Check if candidate is a subset of the input word
-            if all(
-                input_letter_counts.get(letter, 0) >= count
-                for letter, count in candidate_letter_counts.items()
-            ):
-                # Exclude exact anagrams
-                if candidate_counts_tuple != input_letter_counts_tuple:
-                    sub_anagrams.extend(candidate_words)
-
-        return anagrams, sub_anagrams
-
-    @staticmethod
-    def _get_letter_counts(word: str) -> Dict[str, int]:
+        for candidate_signature in self._iter_sub_anagram_signatures(input_signature, exact):
+            sub_anagrams.extend(self.word_letter_counts[candidate_signature])
+
+        return self._resolve(anagrams), self._resolve(sub_anagrams)
+
+    def count_anagrams_and_sub_anagrams(self, word: str) -> Tuple[int, Dict[int, int]]:
+        """
+        Count anagrams and sub-anagrams of the input word from the hash map's word lists.
+
+        Args:
+            word (str): The input word to analyze.
+
+        Returns:
+            Tuple[int, Dict[int, int]]:
+                - The number of anagrams of the input word.
+                - The number of sub-anagrams keyed by their length.
+        """
+        word = word.lower()  # Normalize input to lowercase
+        input_signature, exact = pack_query_letter_counts(word)
+        anagram_count = len(self.word_letter_counts.get(input_signature, [])) if exact else 0
+
+        sub_anagram_counts: Dict[int, int] = {}
+        for candidate_signature in self._iter_sub_anagram_signatures(input_signature, exact):
+            length = signature_length(candidate_signature)
+            sub_anagram_counts[length] = sub_anagram_counts.get(length, 0) + len(
+                self.word_letter_counts[candidate_signature]
+            )
+        return anagram_count, dict(sorted(sub_anagram_counts.items()))
+
+    def anagrams_and_sub_anagrams_exist(self, word: str) -> Tuple[bool, bool]:
+        """
+        Check whether the input word has any anagram and any sub-anagram.
+
+        The key scan stops at the first sub-anagram found.
+
+        Args:
+            word (str): The input word to analyze.
+
+        Returns:
+            Tuple[bool, bool]: Whether an anagram exists, and whether a sub-anagram exists.
+        """
+        word = word.lower()  # Normalize input to lowercase
+        input_signature, exact = pack_query_letter_counts(word)
+        has_anagram = exact and bool(self.word_letter_counts.get(input_signature))
+        has_sub_anagram = next(self._iter_sub_anagram_signatures(input_signature, exact), None) is not None
+        return has_anagram, has_sub_anagram
+
+    def _iter_sub_anagram_signatures(self, input_signature: int, exact: bool) -> Iterator[int]:
         """
-        Count the frequency of each letter in the input word.
+        Yield the hash map keys of the sub-anagrams of a query, with a subtract-and-mask subset test per key.
 
         Args:
-            word (str): The input word.
+            input_signature (int): The packed (possibly clamped) signature of the query.
+            exact (bool): Whether the signature describes the query exactly; only then is its
+                own key an anagram, and excluded.
 
         Returns:
-            Dict[str, int]: A dictionary mapping each letter to its frequency in the word.
+            Iterator[int]: The signatures of the sub-anagram keys.
         """
-        letter_counts: Dict[str, int] = {}
-        for letter in word:
-            letter_counts[letter] = letter_counts.get(letter, 0) + 1  # Increment the count for each letter
-        return letter_counts
+        excluded_signature = input_signature if exact else None
+        return (
+            candidate_signature
+            for candidate_signature in iter_sub_signatures(input_signature, self.word_letter_counts)
+            if candidate_signature != excluded_signature
+        )
+
+
+# Path of the serialized frequency hash map, as registered in the solver registry
+INDEX_PATH: str = get_index_path("hashmap_frequency")
+
+
+def create_solver(load_words: Callable[[], List[str]]) -> SolverEngine:
+    """
+    Create the frequency hash map engine for the solver registry.
+
+    Opens the shared word table and loads the serialized hash map of word IDs, or
+    builds and saves it if it does not exist yet, predates the word table, or has a
+    legacy layout (tuple keys or word lists). Legacy pickles hold words rather than
+    IDs, so they are rebuilt from the word table instead of having their keys migrated.
+
+    Args:
+        load_words (Callable[[], List[str]]): Loads the word list on demand.
+
+    Returns:
+        SolverEngine: The solve, count and exists functions of the solver.
+    """
+    word_table = open_word_table(load_words)
+    frequency_hash_map = None
+    if DataManager.is_data_current(INDEX_PATH, WORD_TABLE_PATH):
+        frequency_hash_map = DataManager.load_data(INDEX_PATH)
+        if DataManager.needs_signature_migration(frequency_hash_map):
+            frequency_hash_map = None
+    if frequency_hash_map is None:
+        frequency_hash_map = DataManager.create_hash_map_with_frequencies(word_table, range(len(word_table)))
+        DataManager.save_data(frequency_hash_map, INDEX_PATH)
+    solver = HashMapFrequencySolver(frequency_hash_map, word_table)
+    return SolverEngine(
+        solver.find_anagrams_and_sub_anagrams,
+        solver.count_anagrams_and_sub_anagrams,
+        solver.anagrams_and_sub_anagrams_exist,
+    )
@@ -3,7 +3,8 @@ HashMapSolver: Find anagrams and sub-anagrams using a hash map.
 
 This class provides a solution for efficiently finding anagrams and sub-anagrams
 of a given word by leveraging a hash map where keys are sorted letters of words,
-and values are lists of corresponding words.
+and values are lists of corresponding words (or arrays of their WordTable IDs,
+resolved to words only for the results).
 
 Features:
 1. Creates a hash map from a word list.
@@ -17,7 +18,10 @@ Author: Sai Sharan Thirunagari
 Date: 11-15-2024
 """
 
-from typing import List, Tuple, Dict, Set
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Dict, Set, Union
+from utils.data_manager import DataManager
+from utils.word_table import WORD_TABLE_PATH, WordTable, open_word_table
+from src.solver_registry import SolverEngine, get_index_path
 
 
 class HashMapSolver:
@@ -30,15 +34,31 @@ class HashMapSolver:
     - A method to generate all subsets of a string for sub-anagrams.
     """
 
-    def __init__(self, words_map: Dict[str, List[str]]) -> None:
+    def __init__(
+        self, words_map: Dict[str, Sequence[Union[str, int]]], word_table: Optional[WordTable] = None
+    ) -> None:
         """
         Initialize the solver with a hash map of words.
 
         Args:
-            words_map (Dict[str, List[str]]): A dictionary mapping sorted letters
-                                              to lists of corresponding words.
+            words_map (Dict[str, Sequence[Union[str, int]]]): A dictionary mapping sorted letters
+                                              to lists of corresponding words (or their IDs).
+            word_table (Optional[WordTable]): Resolves the word IDs, if the hash map stores IDs.
         """
-        self.word_map: Dict[str, List[str]] = words_map
+        self.word_map: Dict[str, Sequence[Union[str, int]]] = words_map
+        self.word_table: Optional[WordTable] = word_table
+
+    def _resolve(self, words: Iterable[Union[str, int]]) -> List[str]:
+        """
+        Resolve stored words or word IDs to words.
+
+        Args:
+            words (Iterable[Union[str, int]]): Words, or WordTable IDs if the solver has a word table.
+
+        Returns:
+            List[str]: The words.
+        """
+        return self.word_table.lookup(words) if self.word_table is not None else list(words)
 
     def _sort_string(self, word: str) -> str:
         """
@@ -52,9 +72,9 @@ class HashMapSolver:
         """
         return ''.join(sorted(word))  # Use Python's built-in sorted for efficiency
 
-    def _get_combinations(self, letters: str) -> List[str]:
+    def _iter_combinations(self, letters: str) -> Iterator[str]:
         """
-        Generate all non-empty subsets of the input letters.
+        Lazily generate all non-empty subsets of the input letters.
 
         This method uses bitwise operations to generate subsets:
         - Each bit in a number represents whether to include a letter in the subset.
@@ -63,16 +83,44 @@ class HashMapSolver:
         Args:
             letters (str): Input string of letters.
 
-        Returns:
-            List[str]: A list of all non-empty subsets of the letters.
+        Yields:
+            str: Each non-empty subset of the letters.
         """
-        combinations = []
         n = len(letters)
         total_combinations = 2 ** n
         for i in range(1, total_combinations):  # Skip 0 to avoid the empty subset
-            combo = ''.join(letters[j] for j in range(n) if i & (1 << j))
-            combinations.append(combo)
-        return combinations
+            yield ''.join(letters[j] for j in range(n) if i & (1 << j))
+
+    def _get_combinations(self, letters: str) -> List[str]:
+        """
+        Generate all non-empty subsets of the input letters.
+
+        Args:
+            letters (str): Input string of letters.
+
+        Returns:
+            List[str]: A list of all non-empty subsets of the letters.
+        """
+        return list(self._iter_combinations(letters))
+
+    def _iter_sub_anagram_keys(self, word: str) -> Iterator[str]:
+        """
+        Lazily find the distinct hash map keys of the sub-anagrams of a word.
+
+        Args:
+            word (str): The lowercase input word.
+
+        Yields:
+            str: Each sorted-letter key (other than the word's own) present in the hash map, once.
+        """
+        sorted_input_word = self._sort_string(word)
+        seen: Set[str] = {sorted_input_word}  # Exclude exact matches
+        for combo in self._iter_combinations(word):
+            sorted_combo = self._sort_string(combo)
+            if sorted_combo not in seen:
+                seen.add(sorted_combo)
+                if sorted_combo in self.word_map:
+                    yield sorted_combo
 
     def find_anagrams_and_subanagrams(self, word: str) -> Tuple[Set[str], Set[str]]:
         """
@@ -95,10 +143,10 @@ class HashMapSolver:
         sorted_input_word = self._sort_string(word)
 
         # Find exact anagrams
-        anagrams: Set[str] = set(self.word_map.get(sorted_input_word, []))
+        anagrams: Set[str] = set(self._resolve(self.word_map.get(sorted_input_word, [])))
 
         # Find sub-anagrams
-        sub_anagrams: Set[str] = set()
+        sub_anagrams: Set[Union[str, int]] = set()
         combos = self._get_combinations(word)  # Generate all subsets
 
         for combo in combos:
@@ -109,4 +157,71 @@ class HashMapSolver:
             if sorted_combo in self.word_map:
                 sub_anagrams.update(self.word_map[sorted_combo])
 
-        return anagrams, sub_anagrams
+        return anagrams, set(self._resolve(sub_anagrams))
+
+    def count_anagrams_and_subanagrams(self, word: str) -> Tuple[int, Dict[int, int]]:
+        """
+        Count anagrams and sub-anagrams of the input word from the hash map's word lists.
+
+        Args:
+            word (str): The input word to analyze.
+
+        Returns:
+            Tuple[int, Dict[int, int]]:
+                - The number of anagrams of the input word.
+                - The number of sub-anagrams keyed by their length.
+        """
+        word = word.lower()  # Normalize input to lowercase
+        anagram_count = len(self.word_map.get(self._sort_string(word), []))
+        sub_anagram_counts: Dict[int, int] = {}
+        for key in self._iter_sub_anagram_keys(word):
+            sub_anagram_counts[len(key)] = sub_anagram_counts.get(len(key), 0) + len(self.word_map[key])
+        return anagram_count, dict(sorted(sub_anagram_counts.items()))
+
+    def anagrams_and_subanagrams_exist(self, word: str) -> Tuple[bool, bool]:
+        """
+        Check whether the input word has any anagram and any sub-anagram.
+
+        The subset enumeration stops at the first sub-anagram key found.
+
+        Args:
+            word (str): The input word to analyze.
+
+        Returns:
+            Tuple[bool, bool]: Whether an anagram exists, and whether a sub-anagram exists.
+        """
+        word = word.lower()  # Normalize input to lowercase
+        has_anagram = bool(self.word_map.get(self._sort_string(word)))
+        has_sub_anagram = next(self._iter_sub_anagram_keys(word), None) is not None
+        return has_anagram, has_sub_anagram
+
+
+# Path of the serialized sorted-letter hash map, as registered in the solver registry
+INDEX_PATH: str = get_index_path("hashmap_sorted")
+
+
+def create_solver(load_words: Callable[[], List[str]]) -> SolverEngine:
+    """
+    Create the sorted hash map engine for the solver registry.
+
+    Opens the shared word table and loads the serialized hash map of word IDs, or
+    builds and saves it if it does not exist yet or predates the word table.
+
+    Args:
+        load_words (Callable[[], List[str]]): Loads the word list on demand.
+
+    Returns:
+        SolverEngine: The solve, count and exists functions of the solver.
+    """
+    word_table = open_word_table(load_words)
+    if DataManager.is_data_current(INDEX_PATH, WORD_TABLE_PATH):
+        hash_map = DataManager.load_data(INDEX_PATH)
+    else:
+        hash_map = DataManager.create_hash_map(word_table, range(len(word_table)))
+        DataManager.save_data(hash_map, INDEX_PATH)
+    solver = HashMapSolver(hash_map, word_table)
+    return SolverEngine(
+        solver.find_anagrams_and_subanagrams,
+        solver.count_anagrams_and_subanagrams,
+        solver.anagrams_and_subanagrams_exist,
+    )
@@ -0,0 +1,219 @@
+"""
+Query Planner: Cost-based selection of the solving method for each query.
+
+The planner estimates the cost (in seconds) of answering a query with each
+method and routes the query to the cheapest one. Estimates combine:
+- Query shape: input length, distinct-letter count and repeated-letter structure
+  (the number of distinct sub-multisets of the input letters).
+- Dictionary size, estimated from the word list's file size.
+- Whether a method's index is already built, already open in this process, or
+  would have to be built from the word list first.
+
+Cost model (N = dictionary size, L = input length, S = sub-multisets of the input):
+- brute_force: brute_force_per_word * N, after loading the word list.
+- hashmap_sorted: hashmap_sorted_per_subset_letter * 2^L * L (infinite once L exceeds
+  MAX_SUBSET_LETTERS, so long inputs never overflow the estimate).
+- hashmap_frequency: hashmap_frequency_per_key * N.
+- trie_frequency: trie_frequency_per_path * min(S, N).
+- Any other registered method (e.g. a plugin): <method>_per_word * N.
+Opening an index costs <method>_load_per_word * N if it is saved and not older
+than the shared word table, otherwise (load_words_per_word + <method>_build_per_word) * N.
+Other registered methods cost <method>_open_per_word * N to open. The candidates are the registered
+methods except the server-only ones (see `src.solver_registry`); one without a cost model or a <method>_per_word coefficient (from the
+defaults or the calibration file) is not considered.
+
+The coefficients are read from a calibration file written by
+`python -m benchmarks.calibrate_planner`; built-in defaults are used otherwise.
+Every decision is logged as one JSON object so that misroutes can be audited.
+
+Example Usage:
+    from src.query_planner import QueryPlanner
+
+    planner = QueryPlanner("data/words_alpha.txt")
+    method = planner.choose("listen")
+"""
+
+import json
+import logging
+import math
+import os
+from typing import Dict, List, Optional, Set
+from utils.data_manager import DataManager
+from utils.word_table import WORD_TABLE_PATH
+from src.solver_registry import available_solvers, get_index_path
+
+CALIBRATION_PATH: str = "data/planner_calibration.json"
+
+DEFAULT_COEFFICIENTS: Dict[str, float] = {
+    "bytes_per_word": 10.4,
+    "query_overhead": 5e-5,
+    "load_words_per_word": 8.8e-8,
+    "brute_force_per_word": 2.7e-6,
+    "hashmap_sorted_per_subset_letter": 2.2e-7,
+    "hashmap_sorted_load_per_word": 3.4e-6,
+    "hashmap_sorted_build_per_word": 1.1e-5,
+    "hashmap_frequency_per_key": 1.1e-7,
+    "hashmap_frequency_load_per_word": 4.4e-6,
+    "hashmap_frequency_build_per_word": 1.3e-5,
+    "trie_frequency_per_path": 3.5e-6,
+    "trie_frequency_load_per_word": 1.7e-6,
+    "trie_frequency_build_per_word": 2.5e-5,
+}
+
+# Inputs longer than this are never routed to hashmap_sorted (2^L subsets)
+MAX_SUBSET_LETTERS: int = 60
+
+# Methods with a dedicated query cost model; other methods scale with the dictionary size
+MODELED_METHODS: List[str] = ["brute_force", "hashmap_sorted", "hashmap_frequency", "trie_frequency"]
+
+logger = logging.getLogger(__name__)
+
+
+def load_calibration(calibration_path: str = CALIBRATION_PATH) -> Dict[str, float]:
+    """
+    Load planner coefficients, falling back to the defaults for missing entries.
+
+    Args:
+        calibration_path (str): Path of the JSON calibration file.
+
+    Returns:
+        Dict[str, float]: The cost model coefficients.
+    """
+    coefficients = dict(DEFAULT_COEFFICIENTS)
+    if os.path.exists(calibration_path):
+        with open(calibration_path, "r", encoding="utf-8") as f:
+            coefficients.update(json.load(f))
+    return coefficients
+
+
+class QueryPlanner:
+    """
+    Routes each query to the method with the lowest estimated cost.
+
+    Attributes:
+        coefficients (Dict[str, float]): The cost model coefficients.
+        dictionary_size (int): Estimated number of words in the word list.
+        opened (Set[str]): Methods whose index is already open in this process.
+    """
+
+    def __init__(self, word_list_path: str, calibration_path: str = CALIBRATION_PATH) -> None:
+        """
+        Initialize the planner.
+
+        Args:
+            word_list_path (str): Path to the word list file.
+            calibration_path (str): Path of the JSON calibration file.
+        """
+        self.coefficients: Dict[str, float] = load_calibration(calibration_path)
+        self.dictionary_size: int = self._estimate_dictionary_size(word_list_path)
+        self.opened: Set[str] = set()
+
+    def _estimate_dictionary_size(self, word_list_path: str) -> int:
+        """
+        Estimate the number of words from the word list's file size.
+
+        Args:
+            word_list_path (str): Path to the word list file.
+
+        Returns:
+            int: The estimated word count (at least 1).
+        """
+        if not os.path.exists(word_list_path):
+            return 1
+        return max(1, int(os.path.getsize(word_list_path) / self.coefficients["bytes_per_word"]))
+
+    def _open_cost(self, method: str) -> float:
+        """
+        Estimate the cost of making a method ready to answer queries.
+
+        Args:
+            method (str): The method name.
+
+        Returns:
+            float: The estimated cost in seconds (0 if the method is already open).
+        """
+        if method in self.opened:
+            return 0.0
+        c = self.coefficients
+        n = self.dictionary_size
+        if method == "brute_force":
+            return c["load_words_per_word"] * n
+        if method not in MODELED_METHODS:
+            return c.get(f"{method}_open_per_word", 0.0) * n
+        index_path = get_index_path(method)
+        if (
+            index_path is not None
+            and DataManager.is_data_saved(WORD_TABLE_PATH)
+            and DataManager.is_data_current(index_path, WORD_TABLE_PATH)
+        ):
+            return c[f"{method}_load_per_word"] * n
+        return (c["load_words_per_word"] + c[f"{method}_build_per_word"]) * n
+
+    def estimate_costs(self, word: str) -> Dict[str, float]:
+        """
+        Estimate the cost of answering a query with each registered method that has a cost model.
+
+        Args:
+            word (str): The sanitized input word.
+
+        Returns:
+            Dict[str, float]: Estimated cost in seconds, keyed by method name.
+        """
+        c = self.coefficients
+        n = self.dictionary_size
+        length = len(word)
+        sub_multisets = math.prod(word.count(letter) + 1 for letter in set(word))
+        subsets = 2.0 ** length if length <= MAX_SUBSET_LETTERS else math.inf
+        query_costs = {
+            "brute_force": c["brute_force_per_word"] * n,
+            "hashmap_sorted": c["hashmap_sorted_per_subset_letter"] * subsets * length,
+            "hashmap_frequency": c["hashmap_frequency_per_key"] * n,
+            "trie_frequency": c["trie_frequency_per_path"] * min(sub_multisets, n),
+        }
+        candidates = available_solvers(include_server_only=False)
+        for method in candidates:
+            if method not in query_costs and f"{method}_per_word" in c:
+                query_costs[method] = c[f"{method}_per_word"] * n
+        return {
+            method: c["query_overhead"] + query_cost + self._open_cost(method)
+            for method, query_cost in query_costs.items()
+            if method in candidates
+        }
+
+    def choose(self, word: str, methods: Optional[List[str]] = None) -> str:
+        """
+        Choose the cheapest method for a query and log the decision.
+
+        The caller opens the chosen method and reports it with `mark_opened`, so that
+        later queries no longer pay its open cost.
+
+        Args:
+            word (str): The sanitized input word.
+            methods (Optional[List[str]]): Restrict the choice to these methods.
+
+        Returns:
+            str: The chosen method name.
+        """
+        costs = self.estimate_costs(word)
+        if methods is not None:
+            costs = {method: cost for method, cost in costs.items() if method in methods}
+        choice = min(costs, key=costs.get)
+        logger.info(json.dumps({
+            "word": word,
+            "length": len(word),
+            "distinct_letters": len(set(word)),
+            "dictionary_size": self.dictionary_size,
+            "opened": sorted(self.opened),
+            "estimated_costs": {method: round(cost, 6) for method, cost in costs.items()},
+            "choice": choice,
+        }))
+        return choice
+
+    def mark_opened(self, method: str) -> None:
+        """
+        Record that a method was opened successfully, so its open cost is no longer charged.
+
+        Args:
+            method (str): The method name.
+        """
+        self.opened.add(method)
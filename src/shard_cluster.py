@@ -0,0 +1,519 @@
+"""
+Shard Cluster: Serve a length-partitioned index from several local processes.
+
+A single process holding the whole index is the scaling ceiling for large
+dictionaries. This module splits the dictionary into shards by word length
+(contiguous length ranges holding roughly equal numbers of words) and serves
+each shard's index from its own process:
+- Shard nodes listen on local sockets (`multiprocessing.connection`, Unix
+  domain sockets by default; (host, port) addresses work the same way) and
+  answer solve, count and exists requests for their part of the dictionary.
+- The coordinator scatters each query only to the shards whose shortest word
+  is not longer than the query (no other shard can hold a match), then
+  gathers and merges the partial results.
+- Each shard's index is saved under SHARD_INDEX_PATH, together with its
+  shortest word length, and loaded on the next start, like the single-process
+  indexes. Shard indexes store WordTable IDs, and every node maps the same
+  shared word table file.
+
+Example Usage:
+    from src.shard_cluster import LocalShardCluster
+
+    with LocalShardCluster(shard_count=4) as cluster:
+        coordinator = cluster.start(WordListLoader("data/words_alpha.txt"))
+        anagrams, sub_anagrams = coordinator.solve("listen")
+
+    # Registered as a server-only engine, e.g. for an AsyncSolver
+    engine = get_solver_factory("sharded")(WordListLoader("data/words_alpha.txt"))
+"""
+
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.util import Finalize
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from utils.data_manager import DataManager
+from utils.letter_signature import signature_length
+from utils.word_table import WORD_TABLE_PATH, WordTable, open_word_table
+from src.solver_registry import SolverEngine
+
+DEFAULT_SHARD_COUNT: int = 4
+DEFAULT_SHARD_METHOD: str = "hashmap_frequency"
+SHARD_INDEX_PATH: str = "data/{method}_shard_{index}_of_{count}.pkl"
+STARTUP_TIMEOUT: float = 600.0
+REPLY_TIMEOUT: float = 120.0
+
+# A Unix socket path, or a (host, port) pair
+Address = Union[str, Tuple[str, int]]
+
+# Finalizers of the clusters started by create_solver in this process
+_cluster_finalizers: List[Finalize] = []
+
+_BUILDERS: Dict[str, Callable[[List[str], Sequence[int]], Any]] = {
+    "hashmap_frequency": DataManager.create_hash_map_with_frequencies,
+    "trie_frequency": DataManager.create_frequency_dawg,
+}
+
+
+def partition_by_length(words: List[str], shard_count: int) -> List[Tuple[int, int]]:
+    """
+    Split the word lengths into contiguous ranges holding roughly equal numbers of words.
+
+    Args:
+        words (List[str]): The word list.
+        shard_count (int): The number of shards.
+
+    Returns:
+        List[Tuple[int, int]]: The (shortest, longest) word length of each shard.
+
+    Raises:
+        ValueError: If there are fewer distinct word lengths than shards.
+    """
+    length_counts = sorted(Counter(map(len, words)).items())
+    if len(length_counts) < shard_count:
+        raise ValueError(f"Cannot split {len(length_counts)} distinct word lengths into {shard_count} shards.")
+
+    ranges: List[Tuple[int, int]] = []
+    total = len(words)
+    cumulative = 0
+    start = length_counts[0][0]
+    for position, (length, count) in enumerate(length_counts):
+        cumulative += count
+        remaining_shards = shard_count - len(ranges) - 1
+        remaining_lengths = len(length_counts) - position - 1
+        # Close the shard once it holds its share, keeping one length per remaining shard
+        if remaining_shards and (
+            cumulative >= total * (len(ranges) + 1) / shard_count or remaining_lengths == remaining_shards
+        ):
+            ranges.append((start, length))
+            start = length_counts[position + 1][0]
+    ranges.append((start, length_counts[-1][0]))
+    return ranges
+
+
+def shard_index_path(method: str, index: int, count: int) -> str:
+    """
+    Return the serialized index path of one shard.
+
+    Args:
+        method (str): The method serving the shard.
+        index (int): The shard number.
+        count (int): The number of shards.
+
+    Returns:
+        str: The index path.
+    """
+    return SHARD_INDEX_PATH.format(method=method, index=index, count=count)
+
+
+def _open_engine(method: str, index: Any, word_table: WordTable) -> SolverEngine:
+    """
+    Wrap a loaded shard index in its solver's query functions.
+
+    Args:
+        method (str): "hashmap_frequency" or "trie_frequency".
+        index (Any): The shard's index.
+        word_table (WordTable): Resolves the index's word IDs.
+
+    Returns:
+        SolverEngine: The solve, count and exists functions of the shard.
+    """
+    if method == "trie_frequency":
+        from src.trie_frequency_solver import TrieFrequencySolver
+
+        solver = TrieFrequencySolver(index, word_table)
+        return SolverEngine(
+            solver.find_anagrams_and_subanagrams,
+            solver.count_anagrams_and_subanagrams,
+            solver.anagrams_and_subanagrams_exist,
+        )
+    from src.hashmap_frequency_solver import HashMapFrequencySolver
+
+    solver = HashMapFrequencySolver(index, word_table)
+    return SolverEngine(
+        solver.find_anagrams_and_sub_anagrams,
+        solver.count_anagrams_and_sub_anagrams,
+        solver.anagrams_and_sub_anagrams_exist,
+    )
+
+
+def _shortest_word_length(method: str, index: Any, word_table: WordTable) -> int:
+    """
+    Find the length of the shortest word in a shard's index by scanning it.
+
+    Only needed for shard indexes saved before the length was recorded with them;
+    for the trie this decodes every word.
+
+    Args:
+        method (str): "hashmap_frequency" or "trie_frequency".
+        index (Any): The shard's index.
+        word_table (WordTable): Resolves the index's word IDs.
+
+    Returns:
+        int: The shortest word length.
+    """
+    if method == "trie_frequency":
+        return min(map(len, word_table.lookup(index.words)))
+    return min(map(signature_length, index))  # All words under a key share its length
+
+
+def serve_shard(
+    address: Address,
+    method: str,
+    index_path: str,
+    authkey: bytes,
+    word_ids: Optional[Sequence[int]] = None,
+    ready: Optional[Any] = None,
+) -> None:
+    """
+    Run a shard node: open its index, then answer requests until the process is stopped.
+
+    Steps:
+    1. Map the shared word table, then load the shard's index, or build it from
+       `word_ids` and save it. The index is saved with the length of its shortest
+       word, so that opening it does not have to scan every word.
+    2. Listen on the address and signal readiness on the `ready` queue.
+    3. Serve each connection on its own thread. Requests are (op, word) pairs with op
+       one of "describe", "solve", "count" or "exists"; replies are ("ok", result)
+       or ("error", message).
+
+    Args:
+        address (Address): The socket address to listen on.
+        method (str): "hashmap_frequency" or "trie_frequency".
+        index_path (str): Path of the shard's serialized index.
+        authkey (bytes): The key clients must authenticate with.
+        word_ids (Optional[Sequence[int]]): The word table IDs of the shard's words, needed only
+            if its index is not saved yet.
+        ready (Optional[Any]): A queue receiving the address once the node is listening.
+    """
+    word_table = WordTable.load(WORD_TABLE_PATH)
+    if word_ids is None:
+        saved = DataManager.load_data(index_path)
+        if isinstance(saved, tuple):
+            shortest, index = saved
+        else:  # Saved without its shortest word length
+            index = saved
+            shortest = _shortest_word_length(method, index, word_table)
+            DataManager.save_data((shortest, index), index_path)
+    else:
+        words = word_table.lookup(word_ids)
+        index = _BUILDERS[method](words, word_ids)
+        shortest = min(map(len, words))
+        DataManager.save_data((shortest, index), index_path)
+    engine = _open_engine(method, index, word_table)
+
+    with Listener(address, authkey=authkey) as listener:
+        if ready is not None:
+            ready.put(address)
+        while True:
+            connection = listener.accept()
+            threading.Thread(target=_handle_connection, args=(connection, engine, shortest), daemon=True).start()
+
+
+def _handle_connection(connection: Connection, engine: SolverEngine, shortest: int) -> None:
+    """
+    Answer the requests of one client connection until it is closed.
+
+    Args:
+        connection (Connection): The client connection.
+        engine (SolverEngine): The shard's query functions.
+        shortest (int): The shard's shortest word length, reported by "describe".
+    """
+    operations = {"solve": engine.solve, "count": engine.count, "exists": engine.exists}
+    with connection:
+        while True:
+            try:
+                operation, word = connection.recv()
+            except EOFError:
+                return  # The client disconnected
+            if operation == "describe":
+                connection.send(("ok", shortest))
+                continue
+            try:
+                connection.send(("ok", operations[operation](word)))
+            except (KeyError, ValueError) as e:
+                connection.send(("error", str(e)))
+            except Exception as e:  # Any request left unanswered would leave the coordinator waiting
+                connection.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class ShardCoordinator:
+    """
+    Scatters queries to the shard nodes that can hold matches and merges their results.
+
+    Attributes:
+        shards (List[Tuple[Connection, int]]): Each node's connection and shortest word length.
+    """
+
+    def __init__(self, addresses: List[Address], authkey: bytes) -> None:
+        """
+        Connect to the shard nodes and ask each for the shortest word it holds.
+
+        Args:
+            addresses (List[Address]): The nodes' socket addresses.
+            authkey (bytes): The key to authenticate with.
+        """
+        self.shards: List[Tuple[Connection, int]] = []
+        for address in addresses:
+            connection = Client(address, authkey=authkey)
+            connection.send(("describe", ""))
+            _, shortest = connection.recv()
+            self.shards.append((connection, shortest))
+        # A connection carries one request at a time; requests for other shards do not wait
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in self.shards]
+
+    def _scatter(self, operation: str, word: str) -> List[Any]:
+        """
+        Send a request to every shard that can hold a match and gather the replies.
+
+        All requests are sent before any reply is read, so the shards work in parallel.
+        Each shard's lock is held only from sending to it until its reply is read, and
+        locks are taken in shard order, so concurrent requests pipeline across shards.
+        If a shard does not reply within REPLY_TIMEOUT seconds or disconnects, the
+        coordinator closes, since a late reply would otherwise answer a later request.
+
+        Args:
+            operation (str): "solve", "count" or "exists".
+            word (str): The query word.
+
+        Returns:
+            List[Any]: The partial results of the contacted shards.
+
+        Raises:
+            ValueError: If a shard reports an error.
+            RuntimeError: If the coordinator is closed, or a shard does not reply.
+        """
+        shards = self.shards
+        if not shards:
+            raise RuntimeError("The shard coordinator is closed.")
+        targets = [(connection, lock) for (connection, shortest), lock in zip(shards, self._locks) if shortest <= len(word)]
+        held: List[threading.Lock] = []
+        replies: List[Any] = []
+        try:
+            for connection, lock in targets:
+                lock.acquire()
+                held.append(lock)
+                connection.send((operation, word))
+            deadline = time.monotonic() + REPLY_TIMEOUT
+            for connection, lock in targets:  # Read every reply to stay in sync
+                if not connection.poll(max(deadline - time.monotonic(), 0.0)):
+                    raise TimeoutError(f"no reply within {REPLY_TIMEOUT:g} seconds")
+                replies.append(connection.recv())
+                held.remove(lock)
+                lock.release()
+        except (EOFError, OSError) as e:  # TimeoutError and BrokenPipeError are OSErrors
+            self.close()
+            raise RuntimeError(f"Lost a shard node ({e or 'connection closed'}).") from e
+        finally:
+            for lock in held:
+                lock.release()
+        errors = [payload for status, payload in replies if status == "error"]
+        if errors:
+            raise ValueError(errors[0])
+        return [payload for _, payload in replies]
+
+    def solve(self, word: str) -> Tuple[List[str], List[str]]:
+        """
+        Find all anagrams and sub-anagrams of the word across the shards.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Tuple[List[str], List[str]]:
+                - A list of anagrams of the input word.
+                - A list of sub-anagrams of the input word.
+        """
+        anagrams: List[str] = []
+        sub_anagrams: List[str] = []
+        for shard_anagrams, shard_sub_anagrams in self._scatter("solve", word):
+            anagrams.extend(shard_anagrams)
+            sub_anagrams.extend(shard_sub_anagrams)
+        return anagrams, sub_anagrams
+
+    def count(self, word: str) -> Tuple[int, Dict[int, int]]:
+        """
+        Count anagrams and sub-anagrams of the word across the shards.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Tuple[int, Dict[int, int]]:
+                - The number of anagrams of the input word.
+                - The number of sub-anagrams keyed by their length.
+        """
+        anagram_count = 0
+        sub_anagram_counts: Counter = Counter()
+        for shard_anagram_count, shard_sub_anagram_counts in self._scatter("count", word):
+            anagram_count += shard_anagram_count
+            sub_anagram_counts.update(shard_sub_anagram_counts)
+        return anagram_count, dict(sorted(sub_anagram_counts.items()))
+
+    def exists(self, word: str) -> Tuple[bool, bool]:
+        """
+        Check whether the word has any anagram and any sub-anagram in any shard.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Tuple[bool, bool]: Whether an anagram exists, and whether a sub-anagram exists.
+        """
+        replies = self._scatter("exists", word)
+        return any(has_anagram for has_anagram, _ in replies), any(has_sub for _, has_sub in replies)
+
+    def engine(self) -> SolverEngine:
+        """
+        Return the coordinator's query functions.
+
+        Returns:
+            SolverEngine: The solve, count and exists functions.
+        """
+        return SolverEngine(self.solve, self.count, self.exists)
+
+    def close(self) -> None:
+        """Close the connections to the shard nodes."""
+        shards, self.shards = self.shards, []
+        for connection, _ in shards:
+            connection.close()
+
+
+class LocalShardCluster:
+    """
+    Runs every shard node as a process on this host, talking over Unix sockets.
+
+    Attributes:
+        shard_count (int): The number of shards.
+        method (str): The method serving each shard.
+        coordinator (Optional[ShardCoordinator]): The coordinator, once started.
+    """
+
+    def __init__(self, shard_count: int = DEFAULT_SHARD_COUNT, method: str = DEFAULT_SHARD_METHOD) -> None:
+        """
+        Initialize the cluster.
+
+        Args:
+            shard_count (int): The number of shards.
+            method (str): "hashmap_frequency" or "trie_frequency".
+
+        Raises:
+            ValueError: If the method cannot serve shards.
+        """
+        if method not in _BUILDERS:
+            raise ValueError(f"Unsupported shard method: {method}")
+        self.shard_count: int = shard_count
+        self.method: str = method
+        self.coordinator: Optional[ShardCoordinator] = None
+        self._processes: List[multiprocessing.Process] = []
+        self._directory: Optional[str] = None
+
+    def start(self, load_words: Callable[[], List[str]]) -> ShardCoordinator:
+        """
+        Start the shard nodes and connect a coordinator to them.
+
+        The shared word table is opened (and built from the word list if needed) first. It
+        is only partitioned if a shard's index is not saved yet or predates the table.
+
+        Args:
+            load_words (Callable[[], List[str]]): Loads the word list on demand.
+
+        Returns:
+            ShardCoordinator: The connected coordinator.
+
+        Raises:
+            RuntimeError: If a shard node exits or does not start in time.
+        """
+        index_paths = [shard_index_path(self.method, i, self.shard_count) for i in range(self.shard_count)]
+        shard_word_ids: List[Optional[List[int]]] = [None] * self.shard_count
+        word_table = open_word_table(load_words)
+        if not all(DataManager.is_data_current(path, WORD_TABLE_PATH) for path in index_paths):
+            words = list(word_table)
+            for i, (shortest, longest) in enumerate(partition_by_length(words, self.shard_count)):
+                shard_word_ids[i] = [
+                    word_id for word_id, word in enumerate(words) if shortest <= len(word) <= longest
+                ]
+
+        self._directory = tempfile.mkdtemp(prefix="anagram_shards_")
+        addresses = [os.path.join(self._directory, f"shard_{i}.sock") for i in range(self.shard_count)]
+        authkey = os.urandom(16)
+        ready = multiprocessing.Queue()
+        for address, index_path, word_ids in zip(addresses, index_paths, shard_word_ids):
+            process = multiprocessing.Process(
+                target=serve_shard, args=(address, self.method, index_path, authkey, word_ids, ready), daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        started = 0
+        while started < self.shard_count:
+            try:
+                ready.get(timeout=1.0)
+                started += 1
+            except queue.Empty:
+                exited = [process.exitcode for process in self._processes if not process.is_alive()]
+                if exited or time.monotonic() > deadline:
+                    self.close()
+                    raise RuntimeError(f"Shard nodes failed to start (exit codes: {exited or 'timeout'}).")
+
+        self.coordinator = ShardCoordinator(addresses, authkey)
+        return self.coordinator
+
+    def __enter__(self) -> "LocalShardCluster":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Disconnect the coordinator, stop the shard nodes and remove their sockets."""
+        if self.coordinator is not None:
+            self.coordinator.close()
+            self.coordinator = None
+        for process in self._processes:
+            process.terminate()
+            process.join()
+        self._processes = []
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+
+def close_local_clusters() -> None:
+    """
+    Stop every cluster started by `create_solver` in this process.
+
+    Call it before a process may be killed (e.g. by a parent that waits only briefly
+    for it to exit), since a killed process runs no finalizers and would leave its
+    shard nodes and socket directory behind.
+    """
+    while _cluster_finalizers:
+        _cluster_finalizers.pop()()  # A finalizer runs its callback at most once
+
+
+def create_solver(load_words: Callable[[], List[str]]) -> SolverEngine:
+    """
+    Create the sharded engine for the solver registry.
+
+    Starts a local cluster of DEFAULT_SHARD_COUNT nodes, which is stopped when the process exits
+    or by `close_local_clusters`. The cluster is closed by a multiprocessing finalizer rather
+    than atexit, because multiprocessing children (such as process pool workers) leave through
+    os._exit and skip atexit handlers, but do run finalizers.
+
+    Args:
+        load_words (Callable[[], List[str]]): Loads the word list on demand.
+
+    Returns:
+        SolverEngine: The coordinator's solve, count and exists functions.
+    """
+    cluster = LocalShardCluster()
+    coordinator = cluster.start(load_words)
+    _cluster_finalizers.append(Finalize(cluster, cluster.close, exitpriority=0))
+    return coordinator.engine()
@@ -0,0 +1,185 @@
+"""
+Solver Registry: Lazily resolved mapping from method names to solver factories.
+
+Each solving method is registered under a name together with its factory. A factory
+is either a callable or an "module:attribute" reference string. Reference strings
+are only imported when the method is actually requested, so choosing one method
+never pays the import cost of the others (or of `pickle`, the Tries and the
+DataManager when the method does not need them).
+
+A factory receives a zero-argument callable that loads the word list on demand and
+returns a SolverEngine bundling the method's query functions:
+- solve: maps an input word to (anagrams, sub-anagrams).
+- count: maps an input word to (anagram count, {length: sub-anagram count}).
+- exists: maps an input word to (any anagram exists, any sub-anagram exists).
+Index based methods only call the loader when no serialized index exists yet; a
+WordListLoader also tells them which file the words come from, so they rebuild when
+it changes. Their index path is registered alongside the factory, so callers can
+check whether an index is already built without importing the method's module.
+
+Server-only engines (e.g. sharded, which starts a cluster of shard processes) are
+too expensive to open for a single command-line run. They stay available through
+`get_solver_factory` for long-running servers, but are left out of
+`available_solvers(include_server_only=False)`, which lists the command-line choices.
+
+Engines outside this package register themselves: list their modules in the
+PLUGINS_ENV_VAR environment variable (comma-separated), and each module calls
+`register_solver` when it is imported. Plugin modules are imported on the first
+registry lookup, and only when the variable is set.
+
+Example Usage:
+    from src.solver_registry import get_solver_factory, register_solver
+
+    # Register a new engine without touching main()
+    register_solver("my_engine", "my_package.my_engine:create_solver")
+
+    # Or let my_package.my_engine register itself on import
+    ANAGRAM_SOLVER_PLUGINS=my_package.my_engine python main.py "cat" --method my_engine
+
+    engine = get_solver_factory("hashmap_frequency")(WordListLoader("data/words_alpha.txt"))
+    anagrams, sub_anagrams = engine.solve("cat")
+    anagram_count, sub_anagram_counts = engine.count("cat")
+"""
+
+import os
+from importlib import import_module
+from typing import Callable, Collection, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+SolveFunction = Callable[[str], Tuple[Collection[str], Collection[str]]]
+CountFunction = Callable[[str], Tuple[int, Dict[int, int]]]
+ExistsFunction = Callable[[str], Tuple[bool, bool]]
+
+
+class SolverEngine(NamedTuple):
+    """The query functions of an opened solving method."""
+
+    solve: SolveFunction
+    count: CountFunction
+    exists: ExistsFunction
+
+
+SolverFactory = Callable[[Callable[[], List[str]]], SolverEngine]
+
+_REGISTRY: Dict[str, Union[str, SolverFactory]] = {
+    "brute_force": "src.brute_force_solver:create_solver",
+    "trie_frequency": "src.trie_frequency_solver:create_solver",
+    "hashmap_sorted": "src.hashmap_sorted_solver:create_solver",
+    "hashmap_frequency": "src.hashmap_frequency_solver:create_solver",
+    "sharded": "src.shard_cluster:create_solver",
+}
+
+_INDEX_PATHS: Dict[str, str] = {
+    "trie_frequency": "data/frequency_dawg_data.pkl",
+    "hashmap_sorted": "data/hash_map_data.pkl",
+    "hashmap_frequency": "data/frequency_hash_map_data.pkl",
+}
+
+# Engines meant for long-running servers rather than one-shot command-line runs
+_SERVER_ONLY: Set[str] = {"sharded"}
+
+# Comma-separated modules that register their engines when imported
+PLUGINS_ENV_VAR: str = "ANAGRAM_SOLVER_PLUGINS"
+
+_plugins_loaded: bool = False
+
+
+def _load_plugins() -> None:
+    """Import the plugin modules listed in PLUGINS_ENV_VAR once, letting them register their engines."""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    for module_name in os.environ.get(PLUGINS_ENV_VAR, "").split(","):
+        if module_name.strip():
+            import_module(module_name.strip())
+
+
+def register_solver(
+    name: str, factory: Union[str, SolverFactory], index_path: Optional[str] = None, server_only: bool = False
+) -> None:
+    """
+    Register a solver factory under a method name.
+
+    Args:
+        name (str): The method name used on the command line.
+        factory (Union[str, SolverFactory]): The factory, or a "module:attribute"
+            reference to it that is imported on first use.
+        index_path (Optional[str]): Path of the method's serialized index, if it uses one.
+        server_only (bool): Whether opening the engine is too expensive for one-shot
+            command-line runs (it is then left out of the command-line choices).
+    """
+    _REGISTRY[name] = factory
+    if index_path is not None:
+        _INDEX_PATHS[name] = index_path
+    else:
+        _INDEX_PATHS.pop(name, None)
+    if server_only:
+        _SERVER_ONLY.add(name)
+    else:
+        _SERVER_ONLY.discard(name)
+
+
+def get_index_path(name: str) -> Optional[str]:
+    """
+    Return the serialized index path of a method.
+
+    Args:
+        name (str): The method name.
+
+    Returns:
+        Optional[str]: The index path, or None if the method does not use a serialized index.
+    """
+    _load_plugins()
+    return _INDEX_PATHS.get(name)
+
+
+def is_server_only(name: str) -> bool:
+    """
+    Check whether a method is meant for long-running servers only.
+
+    Args:
+        name (str): The method name.
+
+    Returns:
+        bool: True if the method was registered as server-only.
+    """
+    _load_plugins()
+    return name in _SERVER_ONLY
+
+
+def available_solvers(include_server_only: bool = True) -> List[str]:
+    """
+    List the registered method names.
+
+    Args:
+        include_server_only (bool): Whether to list server-only methods too.
+
+    Returns:
+        List[str]: The method names in registration order.
+    """
+    _load_plugins()
+    return [name for name in _REGISTRY if include_server_only or name not in _SERVER_ONLY]
+
+
+def get_solver_factory(name: str) -> SolverFactory:
+    """
+    Resolve the factory of a registered method, importing its module if needed.
+
+    Args:
+        name (str): The method name.
+
+    Returns:
+        SolverFactory: The resolved factory.
+
+    Raises:
+        ValueError: If no method is registered under the name.
+    """
+    _load_plugins()
+    if name not in _REGISTRY:
+        raise ValueError(f"Unsupported method: {name}")
+    factory = _REGISTRY[name]
+    if isinstance(factory, str):
+        module_name, _, attribute = factory.partition(":")
+        factory = getattr(import_module(module_name), attribute)
+        _REGISTRY[name] = factory  # Cache the resolved factory
+    return factory
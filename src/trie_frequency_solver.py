@@ -5,16 +5,32 @@ This module implements a solver to efficiently find anagrams and sub-anagrams
 of a given word using a frequency-based Trie.
 
 Features:
-1. Initializes a Frequency Trie with preloaded data.
+1. Initializes a Frequency Trie (its count-compressed variant, or a minimized
+   FrequencyDawg) with preloaded data.
 2. Searches for anagrams (words that match all letters in the input exactly).
 3. Searches for sub-anagrams (words that use a subset of the input letters).
+4. Counts, or checks the existence of, anagrams and sub-anagrams without
+   building result strings.
+5. Incremental sessions that update the results as single letters are added
+   or removed, for interactive clients.
+6. Indexes may store WordTable IDs instead of words; they are resolved to
+   words only for the results.
+
+Example Usage:
+    session = TrieFrequencySolver(frequency_dawg).start_session("cat")
+    new_words = session.add_letter("s")
+    anagrams, sub_anagrams = session.results()
 
 Author: Sai Sharan Thirunagari
 Date: 11-15-2024
 """
 
-from typing import List, Tuple, Dict, Set
-from utils.frequency_trie import TrieNode, FrequencyTrie
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Dict, Set, Union
+from utils.data_manager import DataManager
+from utils.frequency_dawg import DawgNode, FrequencyDawg
+from utils.frequency_trie import TrieNode, FrequencyTrie, CountFrequencyTrie
+from utils.word_table import WORD_TABLE_PATH, WordTable, open_word_table
+from src.solver_registry import SolverEngine, get_index_path
 
 
 class TrieFrequencySolver(FrequencyTrie):
@@ -26,15 +42,35 @@ class TrieFrequencySolver(FrequencyTrie):
     structure to limit the search space based on letter frequencies.
     """
 
-    def __init__(self, frequency_trie: FrequencyTrie) -> None:
+    def __init__(
+        self, frequency_trie: Union[FrequencyTrie, FrequencyDawg], word_table: Optional[WordTable] = None
+    ) -> None:
         """
         Initialize the solver with a preloaded Frequency Trie.
 
         Args:
-            frequency_trie (FrequencyTrie): A preloaded Frequency Trie instance.
+            frequency_trie (Union[FrequencyTrie, FrequencyDawg]): A preloaded Frequency Trie
+                instance, either per-letter, count-compressed (CountFrequencyTrie) or
+                minimized (FrequencyDawg).
+            word_table (Optional[WordTable]): Resolves the word IDs, if the Trie stores IDs.
         """
         super().__init__()
         self.root = frequency_trie.root
+        self.count_compressed: bool = isinstance(frequency_trie, CountFrequencyTrie)
+        self.dawg: Optional[FrequencyDawg] = frequency_trie if isinstance(frequency_trie, FrequencyDawg) else None
+        self.word_table: Optional[WordTable] = word_table
+
+    def _resolve(self, words: Iterable[Union[str, int]]) -> List[str]:
+        """
+        Resolve stored words or word IDs to words.
+
+        Args:
+            words (Iterable[Union[str, int]]): Words, or WordTable IDs if the solver has a word table.
+
+        Returns:
+            List[str]: The words.
+        """
+        return self.word_table.lookup(words) if self.word_table is not None else list(words)
 
     def find_anagrams_and_subanagrams(self, word: str) -> Tuple[List[str], List[str]]:
         """
@@ -55,23 +91,43 @@ class TrieFrequencySolver(FrequencyTrie):
         """
         word = word.lower()  # Normalize input to lowercase
         freq = self._get_frequency_dict(word)  # Generate letter frequency dictionary
-        anagrams: Set[str] = set()
-        sub_anagrams: Set[str] = set()
+        anagrams: Set[Union[str, int]] = set()  # Words, or word IDs if the Trie stores IDs
+        sub_anagrams: Set[Union[str, int]] = set()
 
         # Start recursive search from the root
-        self._search_anagrams_and_sub_anagrams(
-            current=self.root,
-            freq=freq,
-            prefix="",
-            anagrams=anagrams,
-            sub_anagrams=sub_anagrams,
-            word_length=len(word)
-        )
+        if self.dawg is not None:
+            self._search_dawg_anagrams_and_sub_anagrams(
+                current=self.root,
+                key_id=0,
+                freq=freq,
+                length=0,
+                anagrams=anagrams,
+                sub_anagrams=sub_anagrams,
+                word_length=len(word)
+            )
+        elif self.count_compressed:
+            self._search_counted_anagrams_and_sub_anagrams(
+                current=self.root,
+                freq=freq,
+                length=0,
+                anagrams=anagrams,
+                sub_anagrams=sub_anagrams,
+                word_length=len(word)
+            )
+        else:
+            self._search_anagrams_and_sub_anagrams(
+                current=self.root,
+                freq=freq,
+                prefix="",
+                anagrams=anagrams,
+                sub_anagrams=sub_anagrams,
+                word_length=len(word)
+            )
 
         # Exclude the original word from sub-anagrams
         sub_anagrams.discard(word)
 
-        return list(anagrams), list(sub_anagrams)
+        return self._resolve(anagrams), self._resolve(sub_anagrams)
 
     def _search_anagrams_and_sub_anagrams(
         self,
@@ -120,3 +176,463 @@ class TrieFrequencySolver(FrequencyTrie):
                     word_length=word_length
                 )
                 freq[letter] += 1  # Backtrack to restore the frequency
+
+    def _search_counted_anagrams_and_sub_anagrams(
+        self,
+        current: TrieNode,
+        freq: Dict[str, int],
+        length: int,
+        anagrams: Set[str],
+        sub_anagrams: Set[str],
+        word_length: int
+    ) -> None:
+        """
+        Recursively search for anagrams and sub-anagrams in a count-compressed Trie.
+
+        Each edge is labeled (letter, count) and consumes all repeats of a letter at once.
+        Letters strictly increase along a path, so a letter is never revisited below its
+        edge and the frequency state needs no backtracking.
+
+        Args:
+            current (TrieNode): The current node in the Trie.
+            freq (Dict[str, int]): Frequency of the input word's letters.
+            length (int): The number of letters consumed along the current path.
+            anagrams (Set[str]): A set to store found anagrams.
+            sub_anagrams (Set[str]): A set to store found sub-anagrams.
+            word_length (int): The length of the input word.
+        """
+        # Check if the current node ends a word
+        if current.is_end_of_word:
+            if length == word_length:
+                anagrams.update(current.words)  # Exact match -> anagram
+            else:
+                sub_anagrams.update(current.words)  # Subset match -> sub-anagram
+
+        # Traverse child nodes whose whole letter count is available
+        for (letter, count), child in current.children.items():
+            if freq.get(letter, 0) >= count:
+                self._search_counted_anagrams_and_sub_anagrams(
+                    current=child,
+                    freq=freq,
+                    length=length + count,
+                    anagrams=anagrams,
+                    sub_anagrams=sub_anagrams,
+                    word_length=word_length
+                )
+
+    def _search_dawg_anagrams_and_sub_anagrams(
+        self,
+        current: DawgNode,
+        key_id: int,
+        freq: Dict[str, int],
+        length: int,
+        anagrams: Set[str],
+        sub_anagrams: Set[str],
+        word_length: int
+    ) -> None:
+        """
+        Recursively search for anagrams and sub-anagrams in a minimized FrequencyDawg.
+
+        Nodes are shared between paths, so words are not stored on them. Instead the
+        search carries the ID of the first key below the current node and adds each
+        edge's offset on the way down; an end-of-word node resolves its words through
+        the DAWG's side table.
+
+        Args:
+            current (DawgNode): The current node in the graph.
+            key_id (int): The ID of the first key in the current node's subtree.
+            freq (Dict[str, int]): Frequency of remaining letters.
+            length (int): The number of letters consumed along the current path.
+            anagrams (Set[str]): A set to store found anagrams.
+            sub_anagrams (Set[str]): A set to store found sub-anagrams.
+            word_length (int): The length of the input word.
+        """
+        # Check if the current node ends a word
+        if current.is_end_of_word:
+            if length == word_length:
+                anagrams.update(self.dawg.words_for_key(key_id))  # Exact match -> anagram
+            else:
+                sub_anagrams.update(self.dawg.words_for_key(key_id))  # Subset match -> sub-anagram
+
+        # Traverse edges whose letter count is available
+        for (letter, count), child, offset in current.edges:
+            available = freq.get(letter, 0)
+            if available >= count:
+                freq[letter] = available - count  # Use the letters
+                self._search_dawg_anagrams_and_sub_anagrams(
+                    current=child,
+                    key_id=key_id + offset,
+                    freq=freq,
+                    length=length + count,
+                    anagrams=anagrams,
+                    sub_anagrams=sub_anagrams,
+                    word_length=word_length
+                )
+                freq[letter] = available  # Backtrack to restore the frequency
+
+    def count_anagrams_and_subanagrams(self, word: str) -> Tuple[int, Dict[int, int]]:
+        """
+        Count anagrams and sub-anagrams of the given word without building result strings.
+
+        The search visits the same keys as `find_anagrams_and_subanagrams`, but only
+        adds up the number of words stored under each key.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Tuple[int, Dict[int, int]]:
+                - The number of anagrams of the input word.
+                - The number of sub-anagrams keyed by their length.
+        """
+        word = word.lower()  # Normalize input to lowercase
+        freq = self._get_frequency_dict(word)  # Generate letter frequency dictionary
+        anagram_count = 0
+        sub_anagram_counts: Dict[int, int] = {}
+
+        for length, word_count in self._iter_key_sizes(self.root, 0, freq, 0):
+            if length == len(word):
+                anagram_count += word_count  # Exact match -> anagrams
+            else:
+                sub_anagram_counts[length] = sub_anagram_counts.get(length, 0) + word_count
+
+        return anagram_count, dict(sorted(sub_anagram_counts.items()))
+
+    def anagrams_and_subanagrams_exist(self, word: str) -> Tuple[bool, bool]:
+        """
+        Check whether the given word has any anagram and any sub-anagram.
+
+        Steps:
+        1. Follow the single path spelling the sorted input letters to check for anagrams.
+        2. Search the Trie until the first key shorter than the input is reached.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Tuple[bool, bool]: Whether an anagram exists, and whether a sub-anagram exists.
+        """
+        word = word.lower()  # Normalize input to lowercase
+        freq = self._get_frequency_dict(word)  # Generate letter frequency dictionary
+
+        # The only key that can hold anagrams spells the sorted input letters
+        current = self.root
+        for letter, count in sorted(freq.items()):
+            current = self._follow_edge(current, letter, count)
+            if current is None:
+                break
+        has_anagram = current is not None and current.is_end_of_word
+
+        has_sub_anagram = any(
+            length < len(word) for length, _ in self._iter_key_sizes(self.root, 0, freq, 0)
+        )
+        return has_anagram, has_sub_anagram
+
+    def _follow_edge(
+        self, current: Union[TrieNode, DawgNode], letter: str, count: int
+    ) -> Optional[Union[TrieNode, DawgNode]]:
+        """
+        Follow the edges consuming exactly `count` repeats of `letter`.
+
+        Args:
+            current (Union[TrieNode, DawgNode]): The node to start from.
+            letter (str): The letter to consume.
+            count (int): The number of repeats to consume.
+
+        Returns:
+            Optional[Union[TrieNode, DawgNode]]: The node reached, or None if there is no such path.
+        """
+        if self.dawg is not None:
+            for label, child, _ in current.edges:
+                if label == (letter, count):
+                    return child
+            return None
+        if self.count_compressed:
+            return current.children.get((letter, count))
+        for _ in range(count):
+            current = current.children.get(letter)
+            if current is None:
+                return None
+        return current
+
+    def _iter_key_sizes(
+        self,
+        current: Union[TrieNode, DawgNode],
+        key_id: int,
+        freq: Dict[str, int],
+        length: int
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily visit every key whose letters are available, for any Trie variant.
+
+        The search is a generator, so a caller that only needs the first key stops
+        the traversal there.
+
+        Args:
+            current (Union[TrieNode, DawgNode]): The current node.
+            key_id (int): The ID of the first key in the current node's subtree (DAWG only).
+            freq (Dict[str, int]): Frequency of remaining letters.
+            length (int): The number of letters consumed along the current path.
+
+        Yields:
+            Tuple[int, int]: The key length and the number of words stored under the key.
+        """
+        if current.is_end_of_word:
+            if self.dawg is not None:
+                offsets = self.dawg.word_offsets
+                yield length, offsets[key_id + 1] - offsets[key_id]
+            else:
+                yield length, len(current.words)
+
+        for letter, count, child, offset in self._iter_edges(current):
+            available = freq.get(letter, 0)
+            if available >= count:
+                freq[letter] = available - count  # Use the letters
+                yield from self._iter_key_sizes(child, key_id + offset, freq, length + count)
+                freq[letter] = available  # Backtrack to restore the frequency
+
+    def _iter_keys(
+        self,
+        current: Union[TrieNode, DawgNode],
+        key_id: int,
+        freq: Dict[str, int],
+        prefix: str,
+        required: Optional[str] = None
+    ) -> Iterator[Tuple[str, Sequence[Union[str, int]]]]:
+        """
+        Lazily visit every key whose letters are available, with its words.
+
+        With `required` set, only keys that use every remaining copy of that letter are
+        visited. Letters increase along a path, so a path that passes the required letter
+        without using them all is pruned right there.
+
+        Args:
+            current (Union[TrieNode, DawgNode]): The current node.
+            key_id (int): The ID of the first key in the current node's subtree (DAWG only).
+            freq (Dict[str, int]): Frequency of remaining letters.
+            prefix (str): The sorted letters consumed along the current path.
+            required (Optional[str]): A letter whose remaining copies must all be used.
+
+        Yields:
+            Tuple[str, Sequence[Union[str, int]]]: The key's sorted letters and the words (or
+                word IDs) stored under it.
+        """
+        if current.is_end_of_word and (required is None or freq[required] == 0):
+            yield prefix, self.dawg.words_for_key(key_id) if self.dawg is not None else current.words
+
+        for letter, count, child, offset in self._iter_edges(current):
+            if required is not None and letter > required and freq[required] > 0:
+                continue  # The required letter was skipped on this path
+            available = freq.get(letter, 0)
+            if available >= count:
+                freq[letter] = available - count  # Use the letters
+                yield from self._iter_keys(child, key_id + offset, freq, prefix + letter * count, required)
+                freq[letter] = available  # Backtrack to restore the frequency
+
+    def _iter_edges(self, current: Union[TrieNode, DawgNode]) -> Iterator[Tuple[str, int, Any, int]]:
+        """
+        List the outgoing edges of a node of any Trie variant in one shape.
+
+        Args:
+            current (Union[TrieNode, DawgNode]): The node.
+
+        Returns:
+            Iterator[Tuple[str, int, Any, int]]: (letter, count, child, key ID offset) per edge.
+        """
+        if self.dawg is not None:
+            return ((letter, count, child, offset) for (letter, count), child, offset in current.edges)
+        if self.count_compressed:
+            return ((letter, count, child, 0) for (letter, count), child in current.children.items())
+        return ((letter, 1, child, 0) for letter, child in current.children.items())
+
+    def start_session(self, word: str = "") -> "TrieFrequencySession":
+        """
+        Start an incremental query session.
+
+        Args:
+            word (str): The initial letters of the session.
+
+        Returns:
+            TrieFrequencySession: The session.
+        """
+        return TrieFrequencySession(self, word)
+
+
+class TrieFrequencySession:
+    """
+    Incremental anagram queries over a changing set of letters.
+
+    Interactive clients add or remove one tile at a time. Instead of searching
+    from the root on every change, the session keeps every key reachable from
+    its current letters:
+    - Adding a letter only explores the paths that use all copies of that
+      letter, which are exactly the keys that were not reachable before.
+    - Removing a letter drops the keys that used its last copy, looked up
+      through an index of keys by (letter, count), without any search.
+
+    Attributes:
+        solver (TrieFrequencySolver): The solver whose Trie is searched.
+        freq (Dict[str, int]): Frequency of the session's letters.
+        keys (Dict[str, Sequence[Union[str, int]]]): Reachable keys (sorted letters) and their
+            words, or word IDs if the solver has a word table.
+    """
+
+    def __init__(self, solver: TrieFrequencySolver, word: str = "") -> None:
+        """
+        Initialize the session with a full search for the initial letters.
+
+        Args:
+            solver (TrieFrequencySolver): The solver whose Trie is searched.
+            word (str): The initial letters of the session.
+        """
+        self.solver: TrieFrequencySolver = solver
+        self.freq: Dict[str, int] = solver._get_frequency_dict(word.lower())
+        self.keys: Dict[str, Sequence[Union[str, int]]] = {}
+        self._keys_by_letter_count: Dict[Tuple[str, int], Set[str]] = {}
+        for key, words in solver._iter_keys(solver.root, 0, dict(self.freq), ""):
+            self._add_key(key, words)
+
+    @property
+    def word(self) -> str:
+        """The session's letters in sorted order."""
+        return "".join(letter * count for letter, count in sorted(self.freq.items()))
+
+    def add_letter(self, letter: str) -> List[str]:
+        """
+        Add one letter and search only the paths it enables.
+
+        Args:
+            letter (str): The letter to add.
+
+        Returns:
+            List[str]: The words that became reachable.
+
+        Raises:
+            ValueError: If `letter` is not a single character.
+        """
+        letter = self._check_letter(letter)
+        self.freq[letter] = self.freq.get(letter, 0) + 1
+        added: List[Union[str, int]] = []
+        search = self.solver._iter_keys(self.solver.root, 0, dict(self.freq), "", required=letter)
+        for key, words in search:
+            self._add_key(key, words)
+            added.extend(words)
+        return self.solver._resolve(added)
+
+    def remove_letter(self, letter: str) -> List[str]:
+        """
+        Remove one letter and drop the keys that needed it.
+
+        Args:
+            letter (str): The letter to remove.
+
+        Returns:
+            List[str]: The words that are no longer reachable.
+
+        Raises:
+            ValueError: If `letter` is not a single character or not in the session.
+        """
+        letter = self._check_letter(letter)
+        count = self.freq.get(letter, 0)
+        if count == 0:
+            raise ValueError(f"Letter '{letter}' is not in the session.")
+        if count == 1:
+            del self.freq[letter]
+        else:
+            self.freq[letter] = count - 1
+
+        removed: List[Union[str, int]] = []
+        for key in list(self._keys_by_letter_count.get((letter, count), ())):
+            removed.extend(self._remove_key(key))
+        return self.solver._resolve(removed)
+
+    def results(self) -> Tuple[List[str], List[str]]:
+        """
+        Return the anagrams and sub-anagrams of the session's current letters.
+
+        Returns:
+            Tuple[List[str], List[str]]:
+                - A list of anagrams of the current letters.
+                - A list of sub-anagrams of the current letters.
+        """
+        anagram_key = self.word
+        sub_anagrams = [word for key, words in self.keys.items() if key != anagram_key for word in words]
+        return self.solver._resolve(self.keys.get(anagram_key, [])), self.solver._resolve(sub_anagrams)
+
+    def _check_letter(self, letter: str) -> str:
+        """
+        Validate and normalize a letter.
+
+        Args:
+            letter (str): The letter.
+
+        Returns:
+            str: The lowercase letter.
+
+        Raises:
+            ValueError: If `letter` is not a single character.
+        """
+        if len(letter) != 1:
+            raise ValueError(f"Expected a single letter, got '{letter}'.")
+        return letter.lower()
+
+    def _add_key(self, key: str, words: Sequence[Union[str, int]]) -> None:
+        """
+        Record a reachable key and index it by each of its (letter, count) pairs.
+
+        Args:
+            key (str): The key's sorted letters.
+            words (Sequence[Union[str, int]]): The words (or word IDs) stored under the key.
+        """
+        self.keys[key] = words
+        for letter in set(key):
+            self._keys_by_letter_count.setdefault((letter, key.count(letter)), set()).add(key)
+
+    def _remove_key(self, key: str) -> Sequence[Union[str, int]]:
+        """
+        Forget a key that is no longer reachable.
+
+        Args:
+            key (str): The key's sorted letters.
+
+        Returns:
+            Sequence[Union[str, int]]: The words (or word IDs) stored under the key.
+        """
+        for letter in set(key):
+            bucket_key = (letter, key.count(letter))
+            bucket = self._keys_by_letter_count[bucket_key]
+            bucket.discard(key)
+            if not bucket:  # Long sessions would otherwise keep every (letter, count) ever seen
+                del self._keys_by_letter_count[bucket_key]
+        return self.keys.pop(key)
+
+
+# Path of the serialized FrequencyDawg, as registered in the solver registry
+INDEX_PATH: str = get_index_path("trie_frequency")
+
+
+def create_solver(load_words: Callable[[], List[str]]) -> SolverEngine:
+    """
+    Create the Trie-based engine for the solver registry.
+
+    Opens the shared word table and loads the serialized FrequencyDawg of word IDs, or
+    builds and saves it if it does not exist yet or predates the word table.
+
+    Args:
+        load_words (Callable[[], List[str]]): Loads the word list on demand.
+
+    Returns:
+        SolverEngine: The solve, count and exists functions of the solver.
+    """
+    word_table = open_word_table(load_words)
+    if DataManager.is_data_current(INDEX_PATH, WORD_TABLE_PATH):
+        frequency_dawg = DataManager.load_data(INDEX_PATH)
+    else:
+        frequency_dawg = DataManager.create_frequency_dawg(word_table, range(len(word_table)))
+        DataManager.save_data(frequency_dawg, INDEX_PATH)
+    solver = TrieFrequencySolver(frequency_dawg, word_table)
+    return SolverEngine(
+        solver.find_anagrams_and_subanagrams,
+        solver.count_anagrams_and_subanagrams,
+        solver.anagrams_and_subanagrams_exist,
+    )
@@ -0,0 +1,127 @@
+"""
+Tests for AsyncSolver: single-flight coalescing, deadlines, dropping abandoned
+flights that never started, and backpressure.
+"""
+
+import asyncio
+import threading
+from collections import Counter
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from src.async_solver import AsyncSolver, SolverBusyError
+from src.solver_registry import SolverEngine
+
+
+class GatedEngine:
+    """A fake engine whose searches block until released, recording every call."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.calls: Counter = Counter()
+
+    def _answer(self, operation: str, word: str) -> Any:
+        self.calls[(operation, word)] += 1
+        self.gate.wait(timeout=10)
+        answers: Dict[str, Any] = {"solve": ([word], []), "count": (1, {}), "exists": (True, False)}
+        return answers[operation]
+
+    def engine(self) -> SolverEngine:
+        return SolverEngine(*(lambda word, op=op: self._answer(op, word) for op in SolverEngine._fields))
+
+
+async def started(engine: GatedEngine, key: Tuple[str, str]) -> None:
+    """Wait until the engine was called with the key."""
+    while not engine.calls[key]:
+        await asyncio.sleep(0.001)
+
+
+def test_concurrent_requests_for_the_same_letters_share_one_search() -> None:
+    gated = GatedEngine()
+
+    async def scenario() -> None:
+        solver = AsyncSolver(gated.engine())
+        requests = [asyncio.ensure_future(solver.solve(word)) for word in ("listen", "Silent", "enlist")]
+        await started(gated, ("solve", "listen"))
+        gated.gate.set()
+        results = await asyncio.gather(*requests)
+        assert results[0] is results[1] is results[2]
+        assert solver.stats["computations"] == 1 and solver.stats["coalesced"] == 2
+        assert (await solver.count("listen")) == (1, {})  # Other operations do not share the flight
+
+    asyncio.run(scenario())
+    assert sum(gated.calls.values()) == 2
+
+
+def test_timeout_leaves_a_shared_search_running() -> None:
+    gated = GatedEngine()
+
+    async def scenario() -> None:
+        solver = AsyncSolver(gated.engine())
+        patient = asyncio.ensure_future(solver.solve("cat"))
+        await started(gated, ("solve", "cat"))
+        with pytest.raises(asyncio.TimeoutError):
+            await solver.solve("act", timeout=0.05)
+        assert solver.stats["timeouts"] == 1
+        gated.gate.set()
+        assert await patient == (["cat"], [])
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        gated.gate.set()
+    assert gated.calls == Counter({("solve", "cat"): 1})
+
+
+def test_abandoned_flight_that_never_started_is_dropped() -> None:
+    gated = GatedEngine()
+
+    async def scenario() -> None:
+        solver = AsyncSolver(gated.engine(), max_concurrency=1)
+        running = asyncio.ensure_future(solver.solve("dog"))
+        await started(gated, ("solve", "dog"))
+        with pytest.raises(asyncio.TimeoutError):
+            await solver.solve("cat", timeout=0.05)  # Queued behind "dog", never dispatched
+        assert ("solve", "act") not in solver._flights
+        gated.gate.set()
+        await running
+        await solver.solve("cat")  # Starts afresh
+        assert solver.stats["computations"] == 3
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        gated.gate.set()
+    assert gated.calls[("solve", "cat")] == 1
+
+
+def test_requests_beyond_max_pending_are_rejected() -> None:
+    gated = GatedEngine()
+
+    async def scenario() -> None:
+        solver = AsyncSolver(gated.engine(), max_pending=1)
+        first = asyncio.ensure_future(solver.exists("cat"))
+        await started(gated, ("exists", "cat"))
+        with pytest.raises(SolverBusyError):
+            await solver.exists("dog")
+        assert solver.stats["rejected"] == 1
+        gated.gate.set()
+        assert await first == (True, False)
+        assert await solver.exists("dog") == (True, False)  # Accepted again once the backlog drains
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        gated.gate.set()
+
+
+def test_invalid_settings_and_words_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        AsyncSolver(GatedEngine().engine(), max_concurrency=0)
+
+    async def scenario() -> None:
+        with pytest.raises(ValueError):
+            await AsyncSolver(GatedEngine().engine()).solve("123")
+
+    asyncio.run(scenario())
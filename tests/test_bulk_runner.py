@@ -0,0 +1,112 @@
+"""
+Tests for BulkJobRunner: ordered output, and resuming a crashed run from its
+checkpoint must produce the same bytes as an uninterrupted run.
+"""
+
+import io
+import json
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.bulk_runner import BulkJobRunner
+from utils import word_table
+
+WORDS: List[str] = ["cat", "act", "tac", "at", "a", "listen", "silent", "enlist", "tin", "net", "ten", "inlets"]
+QUERIES: List[str] = ["cat", "listen", "", "tinsel", "123", "net", "a"] * 9
+
+
+@pytest.fixture
+def job_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A working directory with a word list, a query file and an empty data directory for the indexes."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(word_table, "_open_tables", {})  # Tables opened for earlier tests live elsewhere
+    (tmp_path / "data").mkdir()
+    (tmp_path / "words.txt").write_text("\n".join(WORDS) + "\n")
+    (tmp_path / "queries.txt").write_text("\n".join(QUERIES) + "\n")
+    return tmp_path
+
+
+def make_runner(output_format: str = "ndjson", mode: str = "list") -> BulkJobRunner:
+    """A runner with small batches and a checkpoint after every batch."""
+    return BulkJobRunner(
+        "hashmap_frequency",
+        "words.txt",
+        mode=mode,
+        output_format=output_format,
+        order="alpha",
+        workers=2,
+        batch_size=4,
+        checkpoint_interval=0.0,
+        progress_interval=3600.0,
+        progress=io.StringIO(),
+    )
+
+
+def test_output_keeps_input_order(job_dir: Path) -> None:
+    make_runner().run("queries.txt", "out.ndjson")
+    records = [json.loads(line) for line in (job_dir / "out.ndjson").read_text().splitlines()]
+    assert [record["word"] for record in records] == [query for query in QUERIES if query and query != "123"]
+    assert sorted(records[0]["anagrams"]) == ["act", "cat", "tac"]
+    assert not (job_dir / "out.ndjson.checkpoint").exists()
+
+
+def crash_once_checkpointed(monkeypatch: pytest.MonkeyPatch, checkpoint_path: str) -> None:
+    """Make the runner crash right after writing a batch past a saved checkpoint."""
+    write_records = BulkJobRunner._write_records
+
+    def write_then_crash(self, writer, records):
+        write_records(self, writer, records)  # Records written after the checkpoint are dropped on resume
+        if os.path.exists(checkpoint_path):
+            raise RuntimeError("simulated crash")
+
+    monkeypatch.setattr(BulkJobRunner, "_write_records", write_then_crash)
+
+
+@pytest.mark.parametrize("output_format", ["ndjson", "tsv", "binary", "text"])
+@pytest.mark.parametrize("mode", ["list", "count"])
+def test_resume_after_crash_is_byte_identical(
+    job_dir: Path, monkeypatch: pytest.MonkeyPatch, output_format: str, mode: str
+) -> None:
+    make_runner(output_format, mode).run("queries.txt", "expected.out")
+    expected = (job_dir / "expected.out").read_bytes()
+
+    with monkeypatch.context() as patch, pytest.raises(RuntimeError, match="simulated crash"):
+        crash_once_checkpointed(patch, "resumed.out.checkpoint")
+        make_runner(output_format, mode).run("queries.txt", "resumed.out")
+    assert (job_dir / "resumed.out.checkpoint").exists()
+
+    answered = make_runner(output_format, mode).run("queries.txt", "resumed.out", resume=True)
+    assert (job_dir / "resumed.out").read_bytes() == expected
+    assert 0 < answered < len(QUERIES)
+    assert not (job_dir / "resumed.out.checkpoint").exists()
+
+
+@pytest.mark.parametrize("output_format", ["tsv", "binary"])
+def test_resume_from_checkpoint_before_first_record_keeps_header(
+    job_dir: Path, monkeypatch: pytest.MonkeyPatch, output_format: str
+) -> None:
+    make_runner(output_format).run("queries.txt", "expected.out")
+    with monkeypatch.context() as patch, pytest.raises(RuntimeError, match="simulated crash"):
+        crash_once_checkpointed(patch, "resumed.out.checkpoint")
+        make_runner(output_format).run("queries.txt", "resumed.out")
+
+    # As if the checkpoint had been taken while the first batch was still running
+    checkpoint_path = job_dir / "resumed.out.checkpoint"
+    checkpoint = json.loads(checkpoint_path.read_text())
+    checkpoint.update(lines_done=0, queries_done=0, output_bytes=0)
+    checkpoint_path.write_text(json.dumps(checkpoint))
+
+    make_runner(output_format).run("queries.txt", "resumed.out", resume=True)
+    assert (job_dir / "resumed.out").read_bytes() == (job_dir / "expected.out").read_bytes()
+
+
+def test_resume_rejects_checkpoint_of_another_job(job_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    with monkeypatch.context() as patch, pytest.raises(RuntimeError, match="simulated crash"):
+        crash_once_checkpointed(patch, "out.ndjson.checkpoint")
+        make_runner().run("queries.txt", "out.ndjson")
+
+    with pytest.raises(ValueError, match="different job"):
+        make_runner(mode="count").run("queries.txt", "out.ndjson", resume=True)
@@ -0,0 +1,56 @@
+"""
+Tests for HashMapFrequencySolver: answers must match brute force, and a saved
+hash map with a legacy layout must be rebuilt instead of breaking queries.
+"""
+
+import random
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src import hashmap_frequency_solver
+from src.brute_force_solver import BruteForceAnagramSolver
+from src.hashmap_frequency_solver import HashMapFrequencySolver
+from utils import word_table
+from utils.data_loader import WordListLoader
+from utils.data_manager import DataManager
+
+
+def random_words(seed: int, count: int = 500) -> List[str]:
+    """Generate words over a small alphabet, so that queries have many matches."""
+    rng = random.Random(seed)
+    return ["".join(rng.choice("abcde") for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+
+def test_solver_matches_brute_force() -> None:
+    words = random_words(1)
+    brute_force = BruteForceAnagramSolver(words)
+    solver = HashMapFrequencySolver(DataManager.create_hash_map_with_frequencies(words))
+    rng = random.Random(1)
+    for _ in range(100):
+        word = "".join(rng.choice("abcdef") for _ in range(rng.randint(1, 7)))
+        expected_anagrams, expected_sub_anagrams = brute_force.find_anagrams_and_subanagrams(word)
+        anagrams, sub_anagrams = solver.find_anagrams_and_sub_anagrams(word)
+        assert (sorted(anagrams), sorted(sub_anagrams)) == (sorted(expected_anagrams), sorted(expected_sub_anagrams))
+        assert solver.count_anagrams_and_sub_anagrams(word) == brute_force.count_anagrams_and_subanagrams(word)
+        assert solver.anagrams_and_sub_anagrams_exist(word) == brute_force.anagrams_and_subanagrams_exist(word)
+
+
+def test_legacy_tuple_keyed_pickle_is_rebuilt(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(word_table, "_open_tables", {})
+    (tmp_path / "data").mkdir()
+    (tmp_path / "words.txt").write_text("cat\nact\nat\na\n")
+    load_words = WordListLoader("words.txt")
+    word_table.open_word_table(load_words)
+
+    # Saved after the word table, so only its layout tells that it is stale
+    legacy = {(("a", 1), ("c", 1), ("t", 1)): ["act", "cat"], (("a", 1), ("t", 1)): ["at"], (("a", 1),): ["a"]}
+    DataManager.save_data(legacy, hashmap_frequency_solver.INDEX_PATH)
+    assert DataManager.needs_signature_migration(DataManager.load_data(hashmap_frequency_solver.INDEX_PATH))
+
+    engine = hashmap_frequency_solver.create_solver(load_words)
+    anagrams, sub_anagrams = engine.solve("cat")
+    assert (sorted(anagrams), sorted(sub_anagrams)) == (["act", "cat"], ["a", "at"])
+    assert not DataManager.needs_signature_migration(DataManager.load_data(hashmap_frequency_solver.INDEX_PATH))
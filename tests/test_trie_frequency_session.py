@@ -0,0 +1,106 @@
+"""
+Tests for TrieFrequencySession: incremental add/remove-letter queries must match
+a full brute-force search after every step, for every Trie variant.
+"""
+
+import random
+from typing import Callable, List, Set, Tuple
+
+import pytest
+
+from src.brute_force_solver import BruteForceAnagramSolver
+from src.trie_frequency_solver import TrieFrequencySolver
+from utils.data_manager import DataManager
+from utils.word_table import WordTable
+
+LETTERS: str = "abcdeo"
+
+
+def random_words(seed: int, count: int = 400) -> List[str]:
+    """Generate words over a small alphabet, so that queries have many matches."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(LETTERS) for _ in range(rng.randint(1, 6)))
+        for _ in range(count)
+    ]
+
+
+BUILDERS = {
+    "frequency_trie": DataManager.create_frequency_trie,
+    "count_frequency_trie": DataManager.create_count_frequency_trie,
+    "frequency_dawg": DataManager.create_frequency_dawg,
+}
+
+
+def make_solver(words: List[str], builder: Callable, with_ids: bool) -> TrieFrequencySolver:
+    """Build a solver over the words, storing WordTable IDs if requested."""
+    if not with_ids:
+        return TrieFrequencySolver(builder(words))
+    table = WordTable.build(words)
+    return TrieFrequencySolver(builder(table, range(len(table))), table)
+
+
+def expected(brute_force: BruteForceAnagramSolver, word: str) -> Tuple[Set[str], Set[str]]:
+    """Brute-force results as sets (the word list may hold duplicates)."""
+    if not word:
+        return set(), set()
+    anagrams, sub_anagrams = brute_force.find_anagrams_and_subanagrams(word)
+    return set(anagrams), set(sub_anagrams)
+
+
+@pytest.mark.parametrize("with_ids", [False, True])
+@pytest.mark.parametrize("builder", BUILDERS.values(), ids=BUILDERS.keys())
+@pytest.mark.parametrize("seed", range(3))
+def test_session_matches_brute_force(seed: int, builder: Callable, with_ids: bool) -> None:
+    words = random_words(seed)
+    brute_force = BruteForceAnagramSolver(words)
+    rng = random.Random(seed)
+    session = make_solver(words, builder, with_ids).start_session("".join(rng.choices(LETTERS, k=3)))
+
+    for _ in range(40):
+        before = set().union(*session.results())
+        if session.freq and rng.random() < 0.4:
+            letter = rng.choice(sorted(session.freq))
+            removed = set(session.remove_letter(letter))
+            after = set().union(*session.results())
+            assert removed == before - after
+        else:
+            added = set(session.add_letter(rng.choice(LETTERS)))
+            after = set().union(*session.results())
+            assert added == after - before
+
+        anagrams, sub_anagrams = session.results()
+        assert (set(anagrams), set(sub_anagrams)) == expected(brute_force, session.word)
+        # The letter-count index holds exactly the live keys, with no empty buckets left behind
+        assert all(session._keys_by_letter_count.values())
+        assert set().union(*session._keys_by_letter_count.values()) == set(session.keys) - {""}
+
+
+@pytest.mark.parametrize("builder", BUILDERS.values(), ids=BUILDERS.keys())
+def test_solver_matches_brute_force(builder: Callable) -> None:
+    words = random_words(7)
+    brute_force = BruteForceAnagramSolver(words)
+    solver = make_solver(words, builder, with_ids=True)
+    rng = random.Random(7)
+    for _ in range(30):
+        word = "".join(rng.choices(LETTERS, k=rng.randint(1, 7)))
+        anagrams, sub_anagrams = solver.find_anagrams_and_subanagrams(word)
+        assert (set(anagrams), set(sub_anagrams)) == expected(brute_force, word)
+
+
+def test_session_rejects_missing_and_invalid_letters() -> None:
+    session = make_solver(["cat", "act", "at"], DataManager.create_frequency_dawg, with_ids=False).start_session("cat")
+    with pytest.raises(ValueError):
+        session.remove_letter("z")
+    with pytest.raises(ValueError):
+        session.add_letter("ab")
+
+
+def test_session_reports_added_and_removed_words() -> None:
+    solver = make_solver(["cat", "act", "at", "a"], DataManager.create_count_frequency_trie, with_ids=False)
+    session = solver.start_session("ca")
+    assert sorted(session.add_letter("t")) == ["act", "at", "cat"]
+    anagrams, sub_anagrams = session.results()
+    assert (sorted(anagrams), sorted(sub_anagrams)) == (["act", "cat"], ["a", "at"])
+    assert sorted(session.remove_letter("t")) == ["act", "at", "cat"]
+    assert session.word == "ac"
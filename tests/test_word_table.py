@@ -0,0 +1,43 @@
+"""
+Tests for WordTable: front-coded storage must return every word unchanged,
+whatever its length, after building and after a save/load round trip, and an
+open table must follow changes to its word list.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from utils import word_table
+from utils.data_loader import WordListLoader
+from utils.word_table import WordTable
+
+
+def test_round_trip_keeps_long_and_non_ascii_words(tmp_path: Path) -> None:
+    rng = random.Random(0)
+    words = ["x" * 300, "x" * 300 + "y", "x" * 299 + "z" * 500, "é" * 200, "a", "ab", "ab", "x" * 300]
+    words += ["".join(rng.choice("ab") for _ in range(rng.randint(1, 400))) for _ in range(300)]
+    expected = sorted(words, key=str.encode)
+
+    table = WordTable.build(words, block_size=4)
+    table.save(str(tmp_path / "table.bin"))
+    loaded = WordTable.load(str(tmp_path / "table.bin"))
+    for candidate in (table, loaded):
+        assert list(candidate) == expected
+        assert candidate.lookup(reversed(range(len(candidate)))) == expected[::-1]
+        assert candidate[len(candidate) - 1] == expected[-1]
+
+
+def test_open_word_table_reopens_when_word_list_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(word_table, "_open_tables", {})
+    word_list = tmp_path / "words.txt"
+    table_path = str(tmp_path / "table.bin")
+    word_list.write_text("cat\nact\n")
+    load_words = WordListLoader(str(word_list))
+    table = word_table.open_word_table(load_words, table_path)
+    assert list(table) == ["act", "cat"]
+    assert word_table.open_word_table(load_words, table_path) is table
+
+    word_list.write_text("cat\nact\ntac\n")
+    assert list(word_table.open_word_table(load_words, table_path)) == ["act", "cat", "tac"]
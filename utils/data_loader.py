@@ -3,6 +3,8 @@ Data Loader: Utility for loading a word list from a file.
 
 This module provides a function to load a list of words from a specified file.
 The words are assumed to be separated by whitespace (e.g., spaces, newlines).
+WordListLoader defers loading until a solver needs the words, and tells the
+shared word table which file they come from.
 
 Raises:
     FileNotFoundError: If the specified file does not exist.
@@ -11,6 +13,7 @@ Example Usage:
     from utils.data_loader import load_word_list
 
     word_list = load_word_list("data/words_alpha.txt")
+    engine = get_solver_factory("hashmap_frequency")(WordListLoader("data/words_alpha.txt"))
 """
 
 from typing import List
@@ -43,3 +46,36 @@ def load_word_list(file_path: str) -> List[str]:
             "Please ensure the file exists and the path is correct."
         )
         exit(1)
+
+
+class WordListLoader:
+    """
+    Loads a word list on demand, as solver factories expect.
+
+    Attributes:
+        file_path (str): Path to the file containing the word list.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Initialize the loader without reading the file.
+
+        Args:
+            file_path (str): Path to the file containing the word list.
+        """
+        self.file_path: str = file_path
+
+    def __call__(self) -> List[str]:
+        """
+        Load the word list.
+
+        Returns:
+            List[str]: A list of words loaded from the file.
+
+        Raises:
+            ValueError: If the word list is empty.
+        """
+        word_list = load_word_list(self.file_path)
+        if not word_list:
+            raise ValueError("Word list is empty. Please provide a valid dataset.")
+        return word_list
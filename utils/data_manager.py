@@ -4,7 +4,8 @@ Data Manager: Utility for handling serialized data structures and creating Tries
 This module provides functionality for:
 - Saving and loading serialized data (e.g., Tries, hash maps).
 - Checking the existence of serialized files.
-- Creating Tries, frequency-based Tries, and hash maps for efficient anagram and sub-anagram solving.
+- Creating Tries, frequency-based Tries, minimized DAWGs, and hash maps for efficient anagram and sub-anagram solving.
+- Storing WordTable IDs instead of words in those indexes, when the word IDs are given.
 
 Example Usage:
     from utils.data_manager import DataManager
@@ -17,14 +18,23 @@ Example Usage:
 
     # Create a Trie
     trie = DataManager.create_trie(["cat", "dog", "bat"])
+
+    # Create a hash map holding WordTable IDs
+    hash_map = DataManager.create_hash_map(word_table, range(len(word_table)))
 """
 
+import logging
 import os
 import pickle
+from array import array
 from collections import defaultdict
-from typing import Any, List, Dict
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple, Union
 from utils.trie import Trie
-from utils.frequency_trie import FrequencyTrie
+from utils.frequency_dawg import FrequencyDawg
+from utils.frequency_trie import FrequencyTrie, CountFrequencyTrie
+from utils.letter_signature import pack_letter_counts
+
+logger = logging.getLogger(__name__)
 
 
 class DataManager:
@@ -38,6 +48,10 @@ class DataManager:
         """
         Save a data structure to a file using serialization.
 
+        The data is written to a temporary file that then replaces the target, so that
+        processes saving the same index at once (e.g. shard nodes of two clusters) never
+        leave a truncated file behind.
+
         Args:
             data (Any): The data structure to serialize and save.
             file_path (str): The file path where the data will be saved.
@@ -45,8 +59,14 @@ class DataManager:
         Returns:
             None
         """
-        with open(file_path, "wb") as f:
-            pickle.dump(data, f)
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "wb") as f:
+                pickle.dump(data, f)
+            os.replace(temporary_path, file_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
 
     @staticmethod
     def load_data(file_path: str) -> Any:
@@ -75,6 +95,86 @@ class DataManager:
         """
         return os.path.exists(file_path)
 
+    @staticmethod
+    def is_data_current(file_path: str, dependency_path: str) -> bool:
+        """
+        Check if a serialized data file exists and is not older than a file it was built from.
+
+        Args:
+            file_path (str): The file path to check.
+            dependency_path (str): The file the data was built from (e.g. the word table its IDs refer to).
+
+        Returns:
+            bool: True if the file exists and is at least as recent as the dependency, False otherwise.
+        """
+        return os.path.exists(file_path) and os.path.getmtime(file_path) >= os.path.getmtime(dependency_path)
+
+    @staticmethod
+    def _with_word_ids(
+        words_data: Iterable[str], word_ids: Optional[Iterable[int]]
+    ) -> Iterator[Tuple[str, Optional[int]]]:
+        """
+        Pair each word with its WordTable ID, or with None when no IDs are given.
+
+        Args:
+            words_data (Iterable[str]): The words.
+            word_ids (Optional[Iterable[int]]): The words' IDs, in the same order.
+
+        Returns:
+            Iterator[Tuple[str, Optional[int]]]: (word, ID) pairs.
+        """
+        return zip(words_data, word_ids) if word_ids is not None else ((word, None) for word in words_data)
+
+    @staticmethod
+    def _pack_word_ids(hash_map: Dict[Any, List[int]]) -> Dict[Any, array]:
+        """
+        Convert the ID lists of a hash map to compact `array('I')` values.
+
+        Args:
+            hash_map (Dict[Any, List[int]]): A hash map with lists of word IDs as values.
+
+        Returns:
+            Dict[Any, array]: The same hash map with arrays as values.
+        """
+        return {key: array("I", word_ids) for key, word_ids in hash_map.items()}
+
+    @staticmethod
+    def needs_signature_migration(frequency_hash_map: Dict[Any, Any]) -> bool:
+        """
+        Check if a loaded frequency hash map has a legacy layout and must be rebuilt.
+
+        The current layout maps packed integer signatures to `array('I')` word IDs. Older
+        pickles keyed the map by sorted tuples of (letter, count) pairs, or held lists of
+        words. A map is written in one piece, so its first entry tells its layout.
+
+        Args:
+            frequency_hash_map (Dict[Any, Any]): A loaded frequency hash map.
+
+        Returns:
+            bool: True if the map does not have the current layout, False otherwise.
+        """
+        key, words = next(iter(frequency_hash_map.items()), (0, array("I")))
+        return not isinstance(key, int) or not isinstance(words, array)
+
+    @staticmethod
+    def index_stats(index: Any, file_path: Optional[str] = None, word_table: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Report the shape and memory statistics of an index.
+
+        See `utils.index_stats` for the reported figures.
+
+        Args:
+            index (Any): A FrequencyTrie, CountFrequencyTrie, FrequencyDawg, or sorted or frequency hash map.
+            file_path (Optional[str]): The file the index was loaded from, used for its serialized size.
+            word_table (Optional[Any]): The WordTable resolving the index's word IDs, if it stores IDs.
+
+        Returns:
+            Dict[str, Any]: The index statistics.
+        """
+        from utils.index_stats import compute_index_stats  # Only needed by `stats`; keeps it out of CLI startup
+
+        return compute_index_stats(index, file_path, word_table)
+
     @staticmethod
     def create_trie(words_data: List[str]) -> Trie:
         """
@@ -96,7 +196,9 @@ class DataManager:
         return trie
 
     @staticmethod
-    def create_hash_map(words_data: List[str]) -> Dict[str, List[str]]:
+    def create_hash_map(
+        words_data: Iterable[str], word_ids: Optional[Iterable[int]] = None
+    ) -> Dict[str, Union[List[str], array]]:
         """
         Create a hash map with sorted letters as keys.
 
@@ -104,22 +206,24 @@ class DataManager:
         1. Initialize a default dictionary to group words by sorted letters.
         2. For each word:
             - Sort its letters alphabetically.
-            - Use the sorted letters as the key and append the word to the corresponding list.
+            - Use the sorted letters as the key and append the word (or its ID) to the corresponding list.
+        3. If IDs were given, store each key's IDs in an `array('I')`.
 
         Args:
-            words_data (List[str]): List of words to populate the hash map.
+            words_data (Iterable[str]): Words to populate the hash map.
+            word_ids (Optional[Iterable[int]]): The words' WordTable IDs, stored instead of the words.
 
         Returns:
-            Dict[str, List[str]]: A dictionary mapping sorted letters to corresponding words.
+            Dict[str, Union[List[str], array]]: A dictionary mapping sorted letters to corresponding words.
         """
         hash_map = defaultdict(list)
-        for word in words_data:
+        for word, word_id in DataManager._with_word_ids(words_data, word_ids):
             sorted_word = ''.join(sorted(word))  # Sort the letters in the word.
-            hash_map[sorted_word].append(word)  # Group the word under the sorted key.
-        return hash_map
+            hash_map[sorted_word].append(word if word_id is None else word_id)  # Group the word under the sorted key.
+        return DataManager._pack_word_ids(hash_map) if word_ids is not None else hash_map
 
     @staticmethod
-    def create_frequency_trie(words_data: List[str]) -> FrequencyTrie:
+    def create_frequency_trie(words_data: Iterable[str], word_ids: Optional[Iterable[int]] = None) -> FrequencyTrie:
         """
         Create a FrequencyTrie from a list of words.
 
@@ -128,58 +232,95 @@ class DataManager:
         2. Insert each word from the list into the FrequencyTrie.
 
         Args:
-            words_data (List[str]): List of words to populate the FrequencyTrie.
+            words_data (Iterable[str]): Words to populate the FrequencyTrie.
+            word_ids (Optional[Iterable[int]]): The words' WordTable IDs, stored instead of the words.
 
         Returns:
             FrequencyTrie: A populated FrequencyTrie.
         """
         trie = FrequencyTrie()
-        for word in words_data:
-            trie.insert(word)  # Insert each word into the FrequencyTrie.
+        for word, word_id in DataManager._with_word_ids(words_data, word_ids):
+            trie.insert(word, word_id)  # Insert each word into the FrequencyTrie.
         return trie
 
     @staticmethod
-    def create_hash_map_with_frequencies(words_data: List[str]) -> Dict[str, List[str]]:
+    def create_count_frequency_trie(
+        words_data: Iterable[str], word_ids: Optional[Iterable[int]] = None
+    ) -> CountFrequencyTrie:
         """
-        Create a hash map of words grouped by letter frequencies.
+        Create a count-compressed FrequencyTrie from a list of words.
 
         Steps:
-        1. Initialize a default dictionary to group words by their letter frequency counts.
-        2. For each word:
-            - Convert it to lowercase.
-            - Calculate its letter frequencies.
-            - Use the letter frequencies (as a sorted tuple) as the key and group words.
+        1. Initialize a CountFrequencyTrie instance.
+        2. Insert each word from the list into the CountFrequencyTrie.
 
         Args:
-            words_data (List[str]): List of words to populate the hash map.
+            words_data (Iterable[str]): Words to populate the CountFrequencyTrie.
+            word_ids (Optional[Iterable[int]]): The words' WordTable IDs, stored instead of the words.
 
         Returns:
-            Dict[str, List[str]]: A dictionary mapping letter frequency counts to corresponding words.
+            CountFrequencyTrie: A populated CountFrequencyTrie.
         """
-        hash_map = defaultdict(list)
-        for word in words_data:
-            word = word.lower()  # Ensure case insensitivity.
-            letter_counts = DataManager._get_letter_counts(word)  # Get letter frequencies.
-            letter_counts_tuple = tuple(sorted(letter_counts.items()))  # Convert to sorted tuple for consistent keys.
-            hash_map[letter_counts_tuple].append(word)  # Group the word under the frequency-based key.
-        return hash_map
+        trie = CountFrequencyTrie()
+        for word, word_id in DataManager._with_word_ids(words_data, word_ids):
+            trie.insert(word, word_id)  # Insert each word into the CountFrequencyTrie.
+        return trie
+
+    @staticmethod
+    def create_frequency_dawg(words_data: Iterable[str], word_ids: Optional[Iterable[int]] = None) -> FrequencyDawg:
+        """
+        Create a minimized FrequencyDawg from a list of words.
+
+        Steps:
+        1. Build a count-compressed FrequencyTrie from the words.
+        2. Merge its structurally identical subtrees into a FrequencyDawg.
+
+        Args:
+            words_data (Iterable[str]): Words to populate the FrequencyDawg.
+            word_ids (Optional[Iterable[int]]): The words' WordTable IDs, stored instead of the words.
+
+        Returns:
+            FrequencyDawg: A minimized FrequencyDawg.
+        """
+        trie = DataManager.create_count_frequency_trie(words_data, word_ids)
+        return FrequencyDawg(trie, store_ids=word_ids is not None)  # The trie is discarded once minimized.
 
     @staticmethod
-    def _get_letter_counts(word: str) -> Dict[str, int]:
+    def create_hash_map_with_frequencies(
+        words_data: Iterable[str], word_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, Union[List[str], array]]:
         """
-        Count the frequency of each letter in the input word.
+        Create a hash map of words grouped by letter frequencies.
 
         Steps:
-        1. Initialize a dictionary to store letter frequencies.
-        2. Iterate through each letter in the word and update its count.
+        1. Initialize a default dictionary to group words by their letter frequency counts.
+        2. For each word:
+            - Convert it to lowercase.
+            - Pack its letter frequencies into an integer signature, skipping words
+              that no signature can hold (letters outside 'a'-'z' or too many repeats).
+            - Use the signature as the key and group words (or their IDs).
+        3. If IDs were given, store each key's IDs in an `array('I')`.
 
         Args:
-            word (str): The input word.
+            words_data (Iterable[str]): Words to populate the hash map.
+            word_ids (Optional[Iterable[int]]): The words' WordTable IDs, stored instead of the words.
 
         Returns:
-            Dict[str, int]: A dictionary mapping each letter to its frequency in the word.
+            Dict[int, Union[List[str], array]]: A dictionary mapping packed letter-count signatures
+                to corresponding words.
         """
-        letter_counts = defaultdict(int)
-        for letter in word:
-            letter_counts[letter] += 1  # Increment count for the current letter.
-        return dict(letter_counts)  # Convert defaultdict to a standard dictionary.
+        hash_map = defaultdict(list)
+        skipped = 0
+        for word, word_id in DataManager._with_word_ids(words_data, word_ids):
+            word = word.lower()  # Ensure case insensitivity.
+            try:
+                signature = pack_letter_counts(word)  # Pack letter frequencies into one integer.
+            except ValueError:
+                skipped += 1  # Queries are matched on 'a'-'z' only, so such words cannot be found anyway
+                continue
+            hash_map[signature].append(word if word_id is None else word_id)  # Group under the frequency-based key.
+        if skipped:
+            logger.warning(
+                "Skipped %d words with letters outside 'a'-'z' or too many repeats of a letter.", skipped
+            )
+        return DataManager._pack_word_ids(hash_map) if word_ids is not None else hash_map
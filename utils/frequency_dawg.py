@@ -0,0 +1,132 @@
+"""
+FrequencyDawg: A minimized FrequencyTrie (directed acyclic word graph).
+
+This module merges structurally identical subtrees of a `FrequencyTrie` into
+shared nodes. Merged nodes can no longer hold their own word lists, so the
+words live in a side table instead:
+- Every end-of-word node in the original trie (i.e. every sorted-letter key)
+  gets an ID in depth-first order.
+- Each DAWG node records how many keys its subtree holds, and each edge records
+  the ID offset of its child's subtree, so a traversal can compute a key's ID
+  by summing offsets along its path.
+- The words of key `i` are `words[word_offsets[i]:word_offsets[i + 1]]`.
+  When the trie was built with WordTable IDs, `words` is an `array('I')` of IDs.
+
+Edges are always labeled (letter, count). Per-letter tries are converted with a
+count of 1 per edge, so the same traversal works for both trie variants.
+
+Example Usage:
+    from utils.frequency_dawg import FrequencyDawg
+    from utils.frequency_trie import CountFrequencyTrie
+
+    trie = CountFrequencyTrie()
+    trie.insert("cat")
+    dawg = FrequencyDawg(trie)
+"""
+
+from array import array
+from typing import Dict, List, Tuple, Union
+from utils.frequency_trie import FrequencyTrie, TrieNode
+
+
+class DawgNode:
+    """A node in the FrequencyDawg, possibly shared by several trie paths."""
+
+    __slots__ = ("edges", "is_end_of_word", "terminal_count")
+
+    def __init__(
+        self, edges: Tuple[Tuple[Tuple[str, int], 'DawgNode', int], ...], is_end_of_word: bool, terminal_count: int
+    ) -> None:
+        """
+        Initialize the DawgNode.
+
+        Attributes:
+            edges (Tuple[Tuple[Tuple[str, int], DawgNode, int], ...]): Outgoing edges as
+                ((letter, count), child, key ID offset of the child's subtree).
+            is_end_of_word (bool): True if the node marks the end of a key.
+            terminal_count (int): Number of keys in the subtree rooted at this node.
+        """
+        self.edges = edges
+        self.is_end_of_word = is_end_of_word
+        self.terminal_count = terminal_count
+
+
+class FrequencyDawg:
+    """A minimized, read-only FrequencyTrie with terminal words kept in a side table."""
+
+    def __init__(self, trie: FrequencyTrie, store_ids: bool = False) -> None:
+        """
+        Build the DAWG by minimizing a populated FrequencyTrie.
+
+        Attributes:
+            root (DawgNode): The root node of the graph.
+            words (Union[List[str], array]): All words, or their WordTable IDs, grouped by key in key ID order.
+            word_offsets (array): Start offset of each key's words in `words`, plus a final end offset.
+            node_count (int): Number of distinct nodes after minimization.
+
+        Args:
+            trie (FrequencyTrie): A per-letter or count-compressed FrequencyTrie.
+            store_ids (bool): True if the trie stores WordTable IDs instead of words.
+        """
+        self.words: Union[List[str], array] = array("I") if store_ids else []
+        self.word_offsets: array = array("I", [0])
+        register: Dict[Tuple, DawgNode] = {}
+        self.root: DawgNode = self._minimize(trie.root, register, {})
+        self.node_count: int = len(register)
+
+    def _minimize(
+        self,
+        node: TrieNode,
+        register: Dict[Tuple, DawgNode],
+        shared_labels: Dict[Tuple[str, int], Tuple[str, int]]
+    ) -> DawgNode:
+        """
+        Recursively minimize a trie subtree and record its words in the side table.
+
+        Steps:
+        1. If the node ends a key, append its words to the side table (pre-order, so IDs follow DFS order).
+        2. Minimize the children in sorted edge order and compute their key ID offsets.
+        3. Reuse an already registered node with the same end-of-word flag and edges, or register this one.
+
+        Args:
+            node (TrieNode): The trie node to minimize.
+            register (Dict[Tuple, DawgNode]): Canonical nodes keyed by their structure.
+            shared_labels (Dict[Tuple[str, int], Tuple[str, int]]): Interned edge labels.
+
+        Returns:
+            DawgNode: The canonical DAWG node equivalent to the subtree.
+        """
+        if node.is_end_of_word:
+            self.words.extend(node.words)
+            self.word_offsets.append(len(self.words))
+
+        labels = {}
+        for key in node.children:
+            label = key if isinstance(key, tuple) else (key, 1)  # Per-letter edges consume one letter
+            labels[shared_labels.setdefault(label, label)] = key
+
+        edges: List[Tuple[Tuple[str, int], DawgNode, int]] = []
+        offset = 1 if node.is_end_of_word else 0
+        for label in sorted(labels):
+            child = self._minimize(node.children[labels[label]], register, shared_labels)
+            edges.append((label, child, offset))
+            offset += child.terminal_count
+
+        signature = (node.is_end_of_word, tuple((label, id(child)) for label, child, _ in edges))
+        canonical = register.get(signature)
+        if canonical is None:
+            canonical = DawgNode(tuple(edges), node.is_end_of_word, offset)
+            register[signature] = canonical
+        return canonical
+
+    def words_for_key(self, key_id: int) -> Union[List[str], array]:
+        """
+        Return the words (or their WordTable IDs) stored under a key ID.
+
+        Args:
+            key_id (int): The ID of a sorted-letter key.
+
+        Returns:
+            Union[List[str], array]: The words whose sorted letters form that key.
+        """
+        return self.words[self.word_offsets[key_id]:self.word_offsets[key_id + 1]]
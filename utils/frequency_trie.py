@@ -16,9 +16,13 @@ Example Usage:
     trie = FrequencyTrie()
     trie.insert("cat")
     trie.insert("act")
+
+    # Count-compressed variant: one edge per distinct letter and its multiplicity
+    counted_trie = CountFrequencyTrie()
+    counted_trie.insert("bookkeeper")  # b1 -> e3 -> k2 -> o2 -> p1 -> r1
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Union
 
 
 class TrieNode:
@@ -29,12 +33,13 @@ class TrieNode:
         Initialize the TrieNode with attributes for children, words, and end-of-word marking.
 
         Attributes:
-            children (Dict[Tuple[str, int], 'TrieNode']): Child nodes keyed by (character, count).
-            words (List[str]): List of words stored at this node.
+            children (Dict[Union[str, Tuple[str, int]], 'TrieNode']): Child nodes keyed by character,
+                or by (character, count) in a CountFrequencyTrie.
+            words (List[Union[str, int]]): Words (or their WordTable IDs) stored at this node.
             is_end_of_word (bool): True if the node marks the end of a valid word.
         """
-        self.children: Dict[Tuple[str, int], 'TrieNode'] = {}
-        self.words: List[str] = []
+        self.children: Dict[Union[str, Tuple[str, int]], 'TrieNode'] = {}
+        self.words: List[Union[str, int]] = []
         self.is_end_of_word: bool = False
 
 
@@ -50,17 +55,18 @@ class FrequencyTrie:
         """
         self.root: TrieNode = TrieNode()
 
-    def insert(self, word: str) -> None:
+    def insert(self, word: str, word_id: Optional[int] = None) -> None:
         """
         Insert a word into the FrequencyTrie.
 
         Steps:
         1. Sort the letters of the word alphabetically.
         2. Traverse or create nodes along the path corresponding to the sorted letters.
-        3. Mark the last node as an end-of-word and store the word.
+        3. Mark the last node as an end-of-word and store the word (or its ID).
 
         Args:
             word (str): The word to be inserted into the Trie.
+            word_id (Optional[int]): The word's ID in a WordTable, stored instead of the word if given.
         """
         current: TrieNode = self.root
         for char in sorted(word):  # Sort the word alphabetically
@@ -68,7 +74,7 @@ class FrequencyTrie:
                 current.children[char] = TrieNode()  # Create a new node if the character is missing
             current = current.children[char]  # Move to the child node
         current.is_end_of_word = True  # Mark the node as the end of a word
-        current.words.append(word)  # Store the word at this node
+        current.words.append(word if word_id is None else word_id)  # Store the word (or its ID) at this node
 
     def _get_frequency_dict(self, word: str) -> Dict[str, int]:
         """
@@ -88,3 +94,41 @@ class FrequencyTrie:
         for char in word:
             freq_dict[char] = freq_dict.get(char, 0) + 1  # Increment the count for each character
         return freq_dict
+
+
+# Shared (letter, count) edge labels, so equal edges reuse one tuple in memory and in pickles
+_EDGE_LABELS: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+
+class CountFrequencyTrie(FrequencyTrie):
+    """
+    A count-compressed FrequencyTrie whose edges are labeled with (letter, count).
+
+    All repeats of a letter in the sorted word share a single edge, so a word has
+    one edge per distinct letter instead of one edge per letter. The trie is
+    shallower and has fewer nodes, and a search can consume a letter's whole
+    count in one step.
+    """
+
+    def insert(self, word: str, word_id: Optional[int] = None) -> None:
+        """
+        Insert a word into the CountFrequencyTrie.
+
+        Steps:
+        1. Sort the distinct letters of the word alphabetically and count each one.
+        2. Traverse or create nodes along the path of (letter, count) edges.
+        3. Mark the last node as an end-of-word and store the word (or its ID).
+
+        Args:
+            word (str): The word to be inserted into the Trie.
+            word_id (Optional[int]): The word's ID in a WordTable, stored instead of the word if given.
+        """
+        current: TrieNode = self.root
+        for char in sorted(set(word)):  # One edge per distinct letter
+            edge = (char, word.count(char))
+            edge = _EDGE_LABELS.setdefault(edge, edge)
+            if edge not in current.children:
+                current.children[edge] = TrieNode()  # Create a new node if the edge is missing
+            current = current.children[edge]  # Move to the child node
+        current.is_end_of_word = True  # Mark the node as the end of a word
+        current.words.append(word if word_id is None else word_id)  # Store the word (or its ID) at this node
@@ -0,0 +1,301 @@
+"""
+Index Stats: Shape and memory statistics for the anagram indexes.
+
+This module inspects a loaded index and reports its size and shape, so that
+capacity can be planned before a box starts swapping and so that optimized
+representations can be compared against the originals.
+
+Supported indexes:
+- FrequencyTrie and CountFrequencyTrie.
+- FrequencyDawg.
+- Sorted hash map (sorted letters -> words).
+- Frequency hash map (packed signatures, or legacy tuples, -> words).
+
+Indexes may store WordTable IDs instead of words; pass the word table to show
+words in the pathological bucket samples.
+
+Reported figures:
+- Node or key counts, word counts and average words per key.
+- Key depth histogram (letters per key for hash maps, edges per key for graphs).
+- Fan-out histogram: children per node (graphs only).
+- Bucket size histogram: words per key.
+- Deep in-memory size (every reachable object counted once) and serialized size.
+- Pathological buckets: very large anagram groups and very deep unary chains.
+
+Example Usage:
+    from utils.data_manager import DataManager
+
+    stats = DataManager.index_stats(DataManager.load_data("data/frequency_dawg_data.pkl"))
+"""
+
+import os
+import pickle
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from utils.frequency_dawg import DawgNode, FrequencyDawg
+from utils.frequency_trie import FrequencyTrie, TrieNode
+from utils.letter_signature import unpack_letter_counts
+from utils.word_table import WordTable
+
+LARGE_BUCKET_WORDS: int = 10
+DEEP_CHAIN_NODES: int = 8
+MAX_REPORTED: int = 10
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Measure the in-memory size of an object and everything it references.
+
+    Every object is counted once, no matter how many times it is referenced.
+
+    Args:
+        obj (Any): The root object.
+
+    Returns:
+        int: The total size in bytes.
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+        for slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    return total
+
+
+def _edges(node: Any) -> List[Tuple[str, Any]]:
+    """
+    List the outgoing edges of a TrieNode or DawgNode as (letters, child) pairs.
+
+    Args:
+        node (Any): The node.
+
+    Returns:
+        List[Tuple[str, Any]]: The letters consumed by each edge and the child it leads to.
+    """
+    if isinstance(node, DawgNode):
+        return [(letter * count, child) for (letter, count), child, _ in node.edges]
+    return [
+        (key[0] * key[1] if isinstance(key, tuple) else key, child) for key, child in node.children.items()
+    ]
+
+
+def _graph_stats(root: Any) -> Dict[str, Any]:
+    """
+    Collect shape statistics of a trie or DAWG, visiting each distinct node once.
+
+    Args:
+        root (Any): The root TrieNode or DawgNode.
+
+    Returns:
+        Dict[str, Any]: Node and key counts, depth and fan-out histograms, and the deepest unary chains.
+    """
+    fanout: Counter = Counter()
+    key_depths: Dict[int, Counter] = {}  # Node id -> depth histogram of the keys below it
+    chain_lengths: Dict[int, int] = {}  # Node id -> number of unary nodes starting at it
+    chain_heads: Dict[int, Any] = {}  # Unary nodes entered from a branching or terminal node
+
+    def is_unary(node: Any) -> bool:
+        return not node.is_end_of_word and len(_edges(node)) == 1
+
+    if is_unary(root):
+        chain_heads[id(root)] = root
+
+    # Post-order over distinct nodes, memoizing per-node results
+    stack: List[Tuple[Any, bool]] = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in key_depths:
+            continue
+        edges = _edges(node)
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for _, child in edges if id(child) not in key_depths)
+            continue
+        fanout[len(edges)] += 1
+        histogram: Counter = Counter({0: 1}) if node.is_end_of_word else Counter()
+        for _, child in edges:
+            for depth, count in key_depths[id(child)].items():
+                histogram[depth + 1] += count
+        key_depths[id(node)] = histogram
+        unary = is_unary(node)
+        chain_lengths[id(node)] = 1 + chain_lengths[id(edges[0][1])] if unary else 0
+        if not unary:
+            chain_heads.update((id(child), child) for _, child in edges if is_unary(child))
+
+    deep_chains = []
+    for head in chain_heads.values():
+        length = chain_lengths[id(head)]
+        if length >= DEEP_CHAIN_NODES:
+            letters = []
+            node = head
+            for _ in range(length):
+                label, node = _edges(node)[0]
+                letters.append(label)
+            deep_chains.append({"nodes": length, "letters": "".join(letters)})
+    deep_chains.sort(key=lambda chain: chain["nodes"], reverse=True)
+
+    depth_histogram = key_depths[id(root)]
+    return {
+        "nodes": len(key_depths),
+        "keys": sum(depth_histogram.values()),
+        "max_depth": max(depth_histogram, default=0),
+        "depth_histogram": dict(sorted(depth_histogram.items())),
+        "fanout_histogram": dict(sorted(fanout.items())),
+        "deep_chains": deep_chains[:MAX_REPORTED],
+    }
+
+
+def _large_buckets(
+    buckets: Iterator[Tuple[Any, Sequence[Union[str, int]]]], word_table: Optional[WordTable] = None
+) -> List[Dict[str, Any]]:
+    """
+    Find the largest anagram groups.
+
+    Args:
+        buckets (Iterator[Tuple[Any, Sequence[Union[str, int]]]]): (key, words or word IDs) pairs.
+        word_table (Optional[WordTable]): Resolves the sampled word IDs, if the index stores IDs.
+
+    Returns:
+        List[Dict[str, Any]]: The largest groups with at least LARGE_BUCKET_WORDS words, largest first.
+    """
+    large = [
+        {"words": len(words), "sample": list(words[:3])}
+        for _, words in buckets
+        if len(words) >= LARGE_BUCKET_WORDS
+    ]
+    large.sort(key=lambda bucket: bucket["words"], reverse=True)
+    large = large[:MAX_REPORTED]
+    if word_table is not None:
+        for bucket in large:
+            bucket["sample"] = word_table.lookup(bucket["sample"])
+    return large
+
+
+def _trie_buckets(root: TrieNode) -> Iterator[Tuple[Any, List[str]]]:
+    """
+    Yield the word lists of every end-of-word node of a trie.
+
+    Args:
+        root (TrieNode): The root of the trie.
+
+    Yields:
+        Tuple[Any, List[str]]: (node, words) pairs.
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.is_end_of_word:
+            yield node, node.words
+        stack.extend(node.children.values())
+
+
+def _key_length(key: Any) -> int:
+    """
+    Count the letters of a hash map key.
+
+    Args:
+        key (Any): A sorted-letter string, packed signature or legacy (letter, count) tuple.
+
+    Returns:
+        int: The number of letters the key stands for.
+    """
+    if isinstance(key, str):
+        return len(key)
+    if isinstance(key, tuple):
+        return sum(count for _, count in key)
+    return sum(unpack_letter_counts(key).values())
+
+
+def _index_type(index: Any) -> str:
+    """
+    Name the type of an index.
+
+    Args:
+        index (Any): The index.
+
+    Returns:
+        str: The index type name.
+
+    Raises:
+        ValueError: If the index type is not supported.
+    """
+    if isinstance(index, (FrequencyTrie, FrequencyDawg)):
+        return type(index).__name__
+    if isinstance(index, dict):
+        first_key = next(iter(index), "")
+        return "sorted_hash_map" if isinstance(first_key, str) else "frequency_hash_map"
+    raise ValueError(f"Unsupported index type: {type(index).__name__}")
+
+
+def compute_index_stats(
+    index: Any, file_path: Optional[str] = None, word_table: Optional[WordTable] = None
+) -> Dict[str, Any]:
+    """
+    Compute shape and memory statistics of an index.
+
+    Args:
+        index (Any): A FrequencyTrie, CountFrequencyTrie, FrequencyDawg, or sorted or frequency hash map.
+        file_path (Optional[str]): The file the index was loaded from. Its size is reported as the
+            serialized size instead of pickling the index again.
+        word_table (Optional[WordTable]): Resolves the word IDs of bucket samples, if the index
+            stores IDs. The shared table is not counted in the index's sizes.
+
+    Returns:
+        Dict[str, Any]: The statistics, see the module docstring.
+
+    Raises:
+        ValueError: If the index type is not supported.
+    """
+    index_type = _index_type(index)
+    stats: Dict[str, Any] = {"type": index_type}
+
+    if isinstance(index, dict):
+        bucket_sizes = Counter(len(words) for words in index.values())
+        key_lengths = Counter(_key_length(key) for key in index)
+        stats.update({
+            "keys": len(index),
+            "words": sum(size * count for size, count in bucket_sizes.items()),
+            "max_depth": max(key_lengths, default=0),
+            "depth_histogram": dict(sorted(key_lengths.items())),
+            "bucket_size_histogram": dict(sorted(bucket_sizes.items())),
+            "deep_chains": [],
+            "large_buckets": _large_buckets(iter(index.items()), word_table),
+        })
+    elif isinstance(index, FrequencyDawg):
+        stats.update(_graph_stats(index.root))
+        offsets = index.word_offsets
+        stats["words"] = len(index.words)
+        bucket_sizes = Counter(offsets[key_id + 1] - offsets[key_id] for key_id in range(len(offsets) - 1))
+        stats["bucket_size_histogram"] = dict(sorted(bucket_sizes.items()))
+        stats["large_buckets"] = _large_buckets(
+            ((key_id, index.words_for_key(key_id)) for key_id in range(len(offsets) - 1)), word_table
+        )
+    else:
+        stats.update(_graph_stats(index.root))
+        bucket_sizes = Counter(len(words) for _, words in _trie_buckets(index.root))
+        stats["words"] = sum(size * count for size, count in bucket_sizes.items())
+        stats["bucket_size_histogram"] = dict(sorted(bucket_sizes.items()))
+        stats["large_buckets"] = _large_buckets(_trie_buckets(index.root), word_table)
+
+    stats["avg_words_per_key"] = stats["words"] / stats["keys"] if stats["keys"] else 0.0
+    stats["deep_bytes"] = deep_sizeof(index)
+    if file_path is not None:
+        stats["serialized_bytes"] = os.path.getsize(file_path)
+    else:
+        stats["serialized_bytes"] = len(pickle.dumps(index))
+    return stats
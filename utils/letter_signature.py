@@ -0,0 +1,157 @@
+"""
+Letter Signature: Packed integer letter-count signatures for anagram matching.
+
+This module encodes the letter counts of a word as a single Python integer.
+The integer holds one fixed-width field per letter of the alphabet ('a'-'z').
+Each field stores the letter count in its low bits and reserves its top bit as
+a guard bit.
+
+Because every field has a guard bit, "candidate is a subset of query" can be
+checked with one subtract-and-mask operation instead of a per-letter loop:
+setting every guard bit of the query and subtracting the candidate leaves all
+guard bits set exactly when no field borrowed, i.e. when each candidate count
+is less than or equal to the matching query count.
+
+Example Usage:
+    from utils.letter_signature import pack_letter_counts, iter_sub_signatures
+
+    query = pack_letter_counts("cat")
+    candidates = [pack_letter_counts("at"), pack_letter_counts("dog")]
+    list(iter_sub_signatures(query, candidates))  # [pack_letter_counts("at")]
+"""
+
+from typing import Dict, Iterable, Iterator, Tuple
+
+ALPHABET: str = "abcdefghijklmnopqrstuvwxyz"
+
+# Bits per letter field: 7 count bits followed by 1 guard bit.
+FIELD_BITS: int = 8
+COUNT_MAX: int = (1 << (FIELD_BITS - 1)) - 1
+
+LETTER_SHIFTS: Dict[str, int] = {
+    letter: index * FIELD_BITS for index, letter in enumerate(ALPHABET)
+}
+GUARD_MASK: int = sum(1 << (shift + FIELD_BITS - 1) for shift in LETTER_SHIFTS.values())
+
+
+def pack_counts(letter_counts: Iterable[Tuple[str, int]]) -> int:
+    """
+    Pack (letter, count) pairs into a signature.
+
+    Args:
+        letter_counts (Iterable[Tuple[str, int]]): Pairs of lowercase letters and their counts.
+
+    Returns:
+        int: The packed signature.
+
+    Raises:
+        ValueError: If a letter is outside 'a'-'z' or a count does not fit in its field.
+    """
+    signature = 0
+    for letter, count in letter_counts:
+        shift = LETTER_SHIFTS.get(letter)
+        if shift is None:
+            raise ValueError(f"Unsupported letter '{letter}': signatures only cover 'a'-'z'.")
+        if count > COUNT_MAX:
+            raise ValueError(f"Letter '{letter}' occurs {count} times; the maximum is {COUNT_MAX}.")
+        signature |= count << shift
+    return signature
+
+
+def pack_letter_counts(word: str) -> int:
+    """
+    Pack the letter counts of a word into a signature.
+
+    Args:
+        word (str): A lowercase word made of the letters 'a'-'z'.
+
+    Returns:
+        int: The packed signature of the word.
+
+    Raises:
+        ValueError: If the word contains letters outside 'a'-'z' or too many repeats of a letter.
+    """
+    return pack_counts((letter, word.count(letter)) for letter in set(word))
+
+
+def pack_query_letter_counts(word: str) -> Tuple[int, bool]:
+    """
+    Pack the letter counts of a query word, tolerating letters no signature can hold.
+
+    Letters outside 'a'-'z' are dropped and counts above COUNT_MAX are clamped.
+    The clamped signature is still a valid upper bound for subset checks against
+    dictionary signatures, but it no longer describes the query exactly.
+
+    Args:
+        word (str): The lowercase query word.
+
+    Returns:
+        Tuple[int, bool]:
+            - The packed (possibly clamped) signature of the query.
+            - True if the signature describes the query exactly, False otherwise.
+    """
+    signature = 0
+    exact = True
+    for letter in set(word):
+        shift = LETTER_SHIFTS.get(letter)
+        if shift is None:
+            exact = False
+            continue
+        count = word.count(letter)
+        if count > COUNT_MAX:
+            count = COUNT_MAX
+            exact = False
+        signature |= count << shift
+    return signature, exact
+
+
+def unpack_letter_counts(signature: int) -> Dict[str, int]:
+    """
+    Expand a signature back into a letter frequency dictionary.
+
+    Args:
+        signature (int): The packed signature.
+
+    Returns:
+        Dict[str, int]: A dictionary mapping each present letter to its count.
+    """
+    letter_counts: Dict[str, int] = {}
+    for letter, shift in LETTER_SHIFTS.items():
+        count = (signature >> shift) & COUNT_MAX
+        if count:
+            letter_counts[letter] = count
+    return letter_counts
+
+
+def signature_length(signature: int) -> int:
+    """
+    Count the letters a signature stands for, i.e. the length of its words.
+
+    Every field is one byte and guard bits are clear in a packed signature,
+    so the length is the sum of the signature's bytes.
+
+    Args:
+        signature (int): The packed signature.
+
+    Returns:
+        int: The total letter count.
+    """
+    return sum(signature.to_bytes(len(ALPHABET), "little"))
+
+
+def iter_sub_signatures(query: int, candidates: Iterable[int]) -> Iterator[int]:
+    """
+    Yield the candidates whose every letter count fits within the query.
+
+    The query's guard bits are set once, so each candidate costs one subtraction and mask.
+
+    Args:
+        query (int): The signature of the query word.
+        candidates (Iterable[int]): The signatures of the candidate words.
+
+    Returns:
+        Iterator[int]: The candidates that can be spelled from the query's letters, in input order.
+    """
+    guarded_query = query | GUARD_MASK
+    # A candidate fits when no letter field borrowed from its guard bit
+    return (candidate for candidate in candidates if (guarded_query - candidate) & GUARD_MASK == GUARD_MASK)
@@ -0,0 +1,487 @@
+"""
+Output Writers: Streaming renderers for anagram results.
+
+Each writer renders one record per query into a binary stream. Callers should
+pass a stream with a large buffer (see `open_stdout`) so that results are
+written in big chunks instead of one small write per line.
+
+Formats:
+- text: The human-readable report (banners, counts and comma-separated words).
+- ndjson: One JSON object per line: {"word": ..., "anagrams": [...], "sub_anagrams": [...]}.
+- tsv: A header line, then `word<TAB>anagrams<TAB>sub_anagrams` with comma-separated words.
+- binary: A `b"ANAG\\x03"` header and a uint8 record kind (0: list, 1: count, 2: exists),
+  then per query: the query, the anagram count, the sub-anagram count and the words. Counts are little-endian uint32; the query and
+  every word are a byte length followed by UTF-8 bytes. Lengths are unsigned LEB128 varints
+  (one byte below 128), so words of any length can be written.
+
+Count and existence records (`--mode count` / `--mode exists`) use the same formats:
+- text: `cat: 2 anagrams, 5 sub-anagrams (1: 1, 2: 4)` / `cat: anagram yes, sub-anagram yes`.
+- ndjson: {"word": ..., "anagrams": n, "sub_anagrams": {length: n}} /
+  {"word": ..., "has_anagram": bool, "has_sub_anagram": bool}.
+- tsv: `word<TAB>anagrams<TAB>sub_anagrams` with `length:count` pairs, or
+  `word<TAB>has_anagram<TAB>has_sub_anagram` with 0/1; the header matches the first record.
+- binary: the query, the uint32 anagram count, a varint number of lengths, then one
+  (varint length, uint32 count) pair per length / the query and a uint8 flags byte
+  (bit 0: anagram exists, bit 1: sub-anagram exists).
+
+Ordering:
+- none: Keep the order produced by the solver.
+- alpha: Sort words alphabetically.
+- length: Sort words by length, then alphabetically.
+
+A reader that goes away early (e.g. `| head`) makes writes raise BrokenPipeError.
+Callers catch it, call `silence_broken_pipe` and stop writing.
+
+Example Usage:
+    from utils.output_writers import create_writer, open_stdout
+
+    writer = create_writer("ndjson", open_stdout(), order="alpha")
+    writer.write_result("cat", ["act", "cat"], ["at", "a"])
+    writer.close()
+"""
+
+import json
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Callable, Collection, Dict, List, Optional, Type
+
+BUFFER_SIZE: int = 1 << 20
+
+ORDERINGS: Dict[str, Callable[[Collection[str]], List[str]]] = {
+    "none": list,
+    "alpha": sorted,
+    "length": lambda words: sorted(words, key=lambda word: (len(word), word)),
+}
+
+
+def open_stdout(buffer_size: int = BUFFER_SIZE) -> BinaryIO:
+    """
+    Open standard output as a binary stream with a large buffer.
+
+    Args:
+        buffer_size (int): The buffer size in bytes.
+
+    Returns:
+        BinaryIO: A buffered binary stream over stdout's file descriptor (left open on close).
+    """
+    sys.stdout.flush()  # Keep anything printed earlier ahead of the results
+    return open(sys.stdout.fileno(), "wb", buffering=buffer_size, closefd=False)
+
+
+def silence_broken_pipe() -> None:
+    """
+    Point stdout at the null device after its reader has gone away.
+
+    Output still buffered for the closed pipe is then discarded when it is flushed
+    (at the latest when the interpreter exits) instead of raising BrokenPipeError again.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
+class ResultWriter(ABC):
+    """
+    Base class of the output writers.
+
+    Attributes:
+        stream (BinaryIO): The binary stream records are written to.
+        order (Callable[[Collection[str]], List[str]]): Orders the words of each result.
+    """
+
+    def __init__(self, stream: BinaryIO, order: str = "none", header: bool = True) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            stream (BinaryIO): The binary stream to write to.
+            order (str): One of the ORDERINGS names.
+            header (bool): Whether to write the format's header. Disable it when
+                appending to a stream that already has one.
+        """
+        self.stream: BinaryIO = stream
+        self.order: Callable[[Collection[str]], List[str]] = ORDERINGS[order]
+
+    @abstractmethod
+    def write_result(self, word: str, anagrams: Collection[str], sub_anagrams: Collection[str]) -> None:
+        """
+        Write the record of one query.
+
+        Args:
+            word (str): The query word.
+            anagrams (Collection[str]): The anagrams of the word.
+            sub_anagrams (Collection[str]): The sub-anagrams of the word.
+        """
+
+    @abstractmethod
+    def write_count(self, word: str, anagram_count: int, sub_anagram_counts: Dict[int, int]) -> None:
+        """
+        Write the count record of one query.
+
+        Args:
+            word (str): The query word.
+            anagram_count (int): The number of anagrams of the word.
+            sub_anagram_counts (Dict[int, int]): The number of sub-anagrams keyed by their length.
+        """
+
+    @abstractmethod
+    def write_exists(self, word: str, has_anagram: bool, has_sub_anagram: bool) -> None:
+        """
+        Write the existence record of one query.
+
+        Args:
+            word (str): The query word.
+            has_anagram (bool): Whether the word has an anagram.
+            has_sub_anagram (bool): Whether the word has a sub-anagram.
+        """
+
+    def write_error(self, word: str, message: str) -> None:
+        """
+        Report a query that could not be solved.
+
+        Machine-readable formats keep errors out of the data stream and print them to stderr.
+
+        Args:
+            word (str): The query word.
+            message (str): The error message.
+        """
+        print(f"Error during solving for word '{word}': {message}", file=sys.stderr)
+
+    def close(self) -> None:
+        """Flush any buffered output."""
+        self.stream.flush()
+
+
+class TextWriter(ResultWriter):
+    """Renders the human-readable report."""
+
+    NOTE: bytes = (
+        b"\nNote: All these anagrams and sub-anagrams are from the dataset "
+        b"therefore are considered to be valid English words.\n"
+    )
+
+    def write_result(self, word: str, anagrams: Collection[str], sub_anagrams: Collection[str]) -> None:
+        """
+        Write the report block of one query: banners, counts and the comma-separated words.
+
+        Args:
+            word (str): The query word.
+            anagrams (Collection[str]): The anagrams of the word.
+            sub_anagrams (Collection[str]): The sub-anagrams of the word.
+        """
+        lines = [f"\nResults for the word: '{word}'", "=" * (len(word) + 20)]  # Separator for readability
+        for label, words in (("Anagrams", anagrams), ("Sub-anagrams", sub_anagrams)):
+            if words:
+                lines.append(f"{label} ({len(words)}):")
+                lines.append(", ".join(self.order(words)))
+            else:
+                lines.append(f"{label}: None")
+        self.stream.write("\n".join(lines).encode() + b"\n")
+        self.stream.write(self.NOTE)
+        self.stream.write(b"-" * 40 + b"\n")  # Bottom separator
+
+    def write_count(self, word: str, anagram_count: int, sub_anagram_counts: Dict[int, int]) -> None:
+        """
+        Write the count line of one query, e.g. `cat: 2 anagrams, 5 sub-anagrams (1: 1, 2: 4)`.
+
+        Args:
+            word (str): The query word.
+            anagram_count (int): The number of anagrams of the word.
+            sub_anagram_counts (Dict[int, int]): The number of sub-anagrams keyed by their length.
+        """
+        line = f"{word}: {anagram_count} anagrams, {sum(sub_anagram_counts.values())} sub-anagrams"
+        if sub_anagram_counts:
+            line += " (" + ", ".join(f"{length}: {count}" for length, count in sub_anagram_counts.items()) + ")"
+        self.stream.write(line.encode() + b"\n")
+
+    def write_exists(self, word: str, has_anagram: bool, has_sub_anagram: bool) -> None:
+        """
+        Write the existence line of one query, e.g. `cat: anagram yes, sub-anagram yes`.
+
+        Args:
+            word (str): The query word.
+            has_anagram (bool): Whether the word has an anagram.
+            has_sub_anagram (bool): Whether the word has a sub-anagram.
+        """
+        answers = ["yes" if found else "no" for found in (has_anagram, has_sub_anagram)]
+        self.stream.write(f"{word}: anagram {answers[0]}, sub-anagram {answers[1]}\n".encode())
+
+    def write_error(self, word: str, message: str) -> None:
+        """
+        Write the error in place of the query's report block.
+
+        Args:
+            word (str): The query word.
+            message (str): The error message.
+        """
+        self.stream.write(f"Error during solving for word '{word}': {message}\n".encode())
+
+
+class NdjsonWriter(ResultWriter):
+    """Renders one JSON object per line."""
+
+    def write_result(self, word: str, anagrams: Collection[str], sub_anagrams: Collection[str]) -> None:
+        """
+        Write the JSON line of one query with the ordered word lists.
+
+        Args:
+            word (str): The query word.
+            anagrams (Collection[str]): The anagrams of the word.
+            sub_anagrams (Collection[str]): The sub-anagrams of the word.
+        """
+        record = {"word": word, "anagrams": self.order(anagrams), "sub_anagrams": self.order(sub_anagrams)}
+        self._write_record(record)
+
+    def write_count(self, word: str, anagram_count: int, sub_anagram_counts: Dict[int, int]) -> None:
+        """
+        Write the count JSON line of one query with sub-anagram counts keyed by length.
+
+        Args:
+            word (str): The query word.
+            anagram_count (int): The number of anagrams of the word.
+            sub_anagram_counts (Dict[int, int]): The number of sub-anagrams keyed by their length.
+        """
+        self._write_record({"word": word, "anagrams": anagram_count, "sub_anagrams": sub_anagram_counts})
+
+    def write_exists(self, word: str, has_anagram: bool, has_sub_anagram: bool) -> None:
+        """
+        Write the existence JSON line of one query.
+
+        Args:
+            word (str): The query word.
+            has_anagram (bool): Whether the word has an anagram.
+            has_sub_anagram (bool): Whether the word has a sub-anagram.
+        """
+        self._write_record({"word": word, "has_anagram": has_anagram, "has_sub_anagram": has_sub_anagram})
+
+    def _write_record(self, record: Dict[str, object]) -> None:
+        """
+        Write one record as a compact JSON line.
+
+        Args:
+            record (Dict[str, object]): The record.
+        """
+        self.stream.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+
+
+class TsvWriter(ResultWriter):
+    """Renders tab-separated columns with comma-separated word lists."""
+
+    HEADERS: Dict[str, bytes] = {
+        "result": b"word\tanagrams\tsub_anagrams\n",
+        "count": b"word\tanagrams\tsub_anagrams\n",
+        "exists": b"word\thas_anagram\thas_sub_anagram\n",
+    }
+
+    def __init__(self, stream: BinaryIO, order: str = "none", header: bool = True) -> None:
+        """
+        Initialize the writer; the header is written with the first record, to match its kind.
+
+        Args:
+            stream (BinaryIO): The binary stream to write to.
+            order (str): One of the ORDERINGS names.
+            header (bool): Whether to write the header line.
+        """
+        super().__init__(stream, order, header)
+        self.header: Optional[bytes] = None if header else b""  # Written with the first record
+
+    def _write_line(self, kind: str, line: str) -> None:
+        """
+        Write one line, preceded by the header of the record kind if none was written yet.
+
+        Args:
+            kind (str): One of the HEADERS names.
+            line (str): The line, without its newline.
+        """
+        if self.header is None:
+            self.header = self.HEADERS[kind]
+            self.stream.write(self.header)
+        self.stream.write(line.encode() + b"\n")
+
+    def write_result(self, word: str, anagrams: Collection[str], sub_anagrams: Collection[str]) -> None:
+        """
+        Write the tab-separated line of one query with comma-separated word lists.
+
+        Args:
+            word (str): The query word.
+            anagrams (Collection[str]): The anagrams of the word.
+            sub_anagrams (Collection[str]): The sub-anagrams of the word.
+        """
+        self._write_line("result", f"{word}\t{','.join(self.order(anagrams))}\t{','.join(self.order(sub_anagrams))}")
+
+    def write_count(self, word: str, anagram_count: int, sub_anagram_counts: Dict[int, int]) -> None:
+        """
+        Write the count line of one query with `length:count` pairs.
+
+        Args:
+            word (str): The query word.
+            anagram_count (int): The number of anagrams of the word.
+            sub_anagram_counts (Dict[int, int]): The number of sub-anagrams keyed by their length.
+        """
+        lengths = ",".join(f"{length}:{count}" for length, count in sub_anagram_counts.items())
+        self._write_line("count", f"{word}\t{anagram_count}\t{lengths}")
+
+    def write_exists(self, word: str, has_anagram: bool, has_sub_anagram: bool) -> None:
+        """
+        Write the existence line of one query with 0/1 flags.
+
+        Args:
+            word (str): The query word.
+            has_anagram (bool): Whether the word has an anagram.
+            has_sub_anagram (bool): Whether the word has a sub-anagram.
+        """
+        self._write_line("exists", f"{word}\t{int(has_anagram)}\t{int(has_sub_anagram)}")
+
+    def close(self) -> None:
+        """Write the header if no record was written, then flush any buffered output."""
+        if self.header is None:  # Keep the header even when there were no records
+            self.header = self.HEADERS["result"]
+            self.stream.write(self.header)
+        super().close()
+
+
+class BinaryWriter(ResultWriter):
+    """Renders length-prefixed binary records."""
+
+    MAGIC: bytes = b"ANAG\x03"
+    KINDS: Dict[str, int] = {"result": 0, "count": 1, "exists": 2}
+
+    def __init__(self, stream: BinaryIO, order: str = "none", header: bool = True) -> None:
+        """
+        Initialize the writer; the header is written with the first record, to carry its kind.
+
+        Args:
+            stream (BinaryIO): The binary stream to write to.
+            order (str): One of the ORDERINGS names.
+            header (bool): Whether to write the MAGIC header and record kind.
+        """
+        super().__init__(stream, order, header)
+        self.header: Optional[bytes] = None if header else b""  # Written with the first record
+
+    def _write_record(self, kind: str, record: bytes) -> None:
+        """
+        Write one record, preceded by the header of the record kind if none was written yet.
+
+        Args:
+            kind (str): One of the KINDS names.
+            record (bytes): The encoded record.
+        """
+        if self.header is None:
+            self.header = self.MAGIC + struct.pack("<B", self.KINDS[kind])
+            self.stream.write(self.header)
+        self.stream.write(record)
+
+    @staticmethod
+    def _encode_length(length: int) -> bytes:
+        """
+        Encode a length as an unsigned LEB128 varint: 7 bits per byte, high bit set on all but the last.
+
+        Args:
+            length (int): The non-negative length to encode.
+
+        Returns:
+            bytes: The encoded length.
+        """
+        data = bytearray()
+        while length >= 0x80:
+            data.append(length & 0x7F | 0x80)
+            length >>= 7
+        data.append(length)
+        return bytes(data)
+
+    @classmethod
+    def _encode_word(cls, word: str) -> bytes:
+        """
+        Encode a word as its varint byte length followed by its UTF-8 bytes.
+
+        Args:
+            word (str): The word to encode.
+
+        Returns:
+            bytes: The encoded word.
+        """
+        data = word.encode()
+        return cls._encode_length(len(data)) + data
+
+    def write_result(self, word: str, anagrams: Collection[str], sub_anagrams: Collection[str]) -> None:
+        """
+        Write the binary record of one query: the query, both word counts and the words.
+
+        Args:
+            word (str): The query word.
+            anagrams (Collection[str]): The anagrams of the word.
+            sub_anagrams (Collection[str]): The sub-anagrams of the word.
+        """
+        parts = [self._encode_word(word), struct.pack("<II", len(anagrams), len(sub_anagrams))]
+        parts.extend(map(self._encode_word, self.order(anagrams)))
+        parts.extend(map(self._encode_word, self.order(sub_anagrams)))
+        self._write_record("result", b"".join(parts))
+
+    def write_count(self, word: str, anagram_count: int, sub_anagram_counts: Dict[int, int]) -> None:
+        """
+        Write the binary count record of one query: the query, the anagram count and (length, count) pairs.
+
+        Args:
+            word (str): The query word.
+            anagram_count (int): The number of anagrams of the word.
+            sub_anagram_counts (Dict[int, int]): The number of sub-anagrams keyed by their length.
+        """
+        parts = [
+            self._encode_word(word),
+            struct.pack("<I", anagram_count),
+            self._encode_length(len(sub_anagram_counts)),
+        ]
+        for length, count in sub_anagram_counts.items():
+            parts += [self._encode_length(length), struct.pack("<I", count)]
+        self._write_record("count", b"".join(parts))
+
+    def write_exists(self, word: str, has_anagram: bool, has_sub_anagram: bool) -> None:
+        """
+        Write the binary existence record of one query: the query and a flags byte.
+
+        Args:
+            word (str): The query word.
+            has_anagram (bool): Whether the word has an anagram.
+            has_sub_anagram (bool): Whether the word has a sub-anagram.
+        """
+        self._write_record("exists", self._encode_word(word) + struct.pack("<B", has_anagram | has_sub_anagram << 1))
+
+    def close(self) -> None:
+        """Write the header if no record was written, then flush any buffered output."""
+        if self.header is None:  # Keep the header even when there were no records
+            self.header = self.MAGIC + struct.pack("<B", self.KINDS["result"])
+            self.stream.write(self.header)
+        super().close()
+
+
+WRITERS: Dict[str, Type[ResultWriter]] = {
+    "text": TextWriter,
+    "ndjson": NdjsonWriter,
+    "tsv": TsvWriter,
+    "binary": BinaryWriter,
+}
+
+
+def create_writer(output_format: str, stream: BinaryIO, order: str = "none", header: bool = True) -> ResultWriter:
+    """
+    Create the writer for an output format.
+
+    Args:
+        output_format (str): One of the WRITERS names.
+        stream (BinaryIO): The binary stream to write to.
+        order (str): One of the ORDERINGS names.
+        header (bool): Whether to write the format's header.
+
+    Returns:
+        ResultWriter: The writer.
+
+    Raises:
+        ValueError: If the format or ordering is unknown.
+    """
+    if output_format not in WRITERS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if order not in ORDERINGS:
+        raise ValueError(f"Unsupported ordering: {order}")
+    return WRITERS[output_format](stream, order, header)
@@ -0,0 +1,205 @@
+"""
+Startup Timer: Utility to measure the startup phases of the command-line interface.
+
+The timer records consecutive phases (e.g. imports, argument parsing, index
+loading) as laps between marks, with the number of modules each phase imported.
+
+The import timer measures every module import like `python -X importtime`: it
+sits first on `sys.meta_path` and times each module's execution, reporting the
+module's own time and the cumulative time including the imports it triggered.
+This names the modules that make startup slow.
+
+Example Usage:
+    import sys
+    import time
+    from utils.startup_timer import ImportTimer, StartupTimer
+
+    import_timer = ImportTimer()
+    import_timer.install()
+    timer = StartupTimer(time.perf_counter(), len(sys.modules))
+    ...
+    timer.mark("arg-parse")
+    print(timer.report())
+    print(import_timer.report())
+"""
+
+import sys
+import time
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, List, Optional, Sequence, Tuple
+
+MAX_REPORTED_IMPORTS: int = 15
+
+
+class StartupTimer:
+    """
+    A lap timer for named startup phases.
+
+    Attributes:
+        phases (List[Tuple[str, float, int]]): Recorded phases as
+            (name, duration in seconds, number of modules imported during the phase).
+    """
+
+    def __init__(self, start: float, start_module_count: int) -> None:
+        """
+        Initialize the timer.
+
+        Args:
+            start (float): The `time.perf_counter()` value at which the first phase started.
+            start_module_count (int): The size of `sys.modules` when the first phase started.
+        """
+        self.phases: List[Tuple[str, float, int]] = []
+        self._last_time: float = start
+        self._last_module_count: int = start_module_count
+
+    def mark(self, phase: str) -> None:
+        """
+        End the current phase and record it under the given name.
+
+        Args:
+            phase (str): The name of the phase that just ended.
+        """
+        now = time.perf_counter()
+        module_count = len(sys.modules)
+        self.phases.append((phase, now - self._last_time, module_count - self._last_module_count))
+        self._last_time = now
+        self._last_module_count = module_count
+
+    def report(self) -> str:
+        """
+        Format the recorded phases as a table.
+
+        Returns:
+            str: One line per phase with its duration and imported module count, plus a total.
+        """
+        lines = [f"{'phase':<28} | {'time [ms]':>10} | {'modules':>7}"]
+        for phase, seconds, modules in self.phases:
+            lines.append(f"{phase:<28} | {seconds * 1e3:>10.2f} | {modules:>7}")
+        total_seconds = sum(seconds for _, seconds, _ in self.phases)
+        total_modules = sum(modules for _, _, modules in self.phases)
+        lines.append(f"{'total':<28} | {total_seconds * 1e3:>10.2f} | {total_modules:>7}")
+        return "\n".join(lines)
+
+
+class _TimedLoader:
+    """Wraps a module's loader to time its execution for an ImportTimer."""
+
+    def __init__(self, loader: Any, import_timer: "ImportTimer", name: str) -> None:
+        """
+        Initialize the wrapper.
+
+        Args:
+            loader (Any): The module's real loader.
+            import_timer (ImportTimer): The timer recording the import.
+            name (str): The module name.
+        """
+        self._loader = loader
+        self._import_timer = import_timer
+        self._name = name
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        """
+        Execute the module with its real loader and record how long it took.
+
+        Args:
+            module (ModuleType): The module to execute.
+        """
+        # The module only ever sees its real loader
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._import_timer._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._import_timer._leave(self._name)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._loader, attribute)
+
+
+class ImportTimer:
+    """
+    Times every module import while installed, like `python -X importtime`.
+
+    Attributes:
+        imports (List[Tuple[str, float, float, int]]): Completed imports in completion order as
+            (module name, self seconds, cumulative seconds, nesting depth).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an uninstalled timer."""
+        self.imports: List[Tuple[str, float, float, int]] = []
+        self._stack: List[List[float]] = []  # Per import in progress: [start time, time of nested imports]
+
+    def install(self) -> None:
+        """Start timing imports by putting the timer first on `sys.meta_path`."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self, name: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None
+    ) -> Optional[ModuleSpec]:
+        """
+        Find the module with the other finders and wrap its loader in a timing loader.
+
+        Args:
+            name (str): The full module name.
+            path (Optional[Sequence[str]]): The parent package's search path.
+            target (Optional[ModuleType]): The module being reloaded, if any.
+
+        Returns:
+            Optional[ModuleSpec]: The module's spec, or None if no other finder knows it.
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self, name)
+                return spec
+        return None
+
+    def _enter(self) -> None:
+        """Start timing a module's execution."""
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def _leave(self, name: str) -> None:
+        """
+        Finish timing a module's execution and charge it to the enclosing import.
+
+        Args:
+            name (str): The module name.
+        """
+        start, nested = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        self.imports.append((name, cumulative - nested, cumulative, len(self._stack)))
+        if self._stack:
+            self._stack[-1][1] += cumulative
+
+    def report(self, limit: int = MAX_REPORTED_IMPORTS) -> str:
+        """
+        Format the slowest imports.
+
+        Args:
+            limit (int): The number of imports to list.
+
+        Returns:
+            str: One line per import, slowest cumulative time first, in the `-X importtime`
+                layout (self and cumulative time in microseconds, indented by nesting depth).
+        """
+        slowest = sorted(self.imports, key=lambda entry: entry[2], reverse=True)[:limit]
+        lines = [f"{'self [us]':>10} | {'cumulative':>10} | imported module"]
+        for name, self_seconds, cumulative, depth in slowest:
+            lines.append(f"{self_seconds * 1e6:>10.0f} | {cumulative * 1e6:>10.0f} | {'  ' * depth}{name}")
+        return "\n".join(lines)
@@ -0,0 +1,107 @@
+"""
+Word List Generator: Seeded synthetic dictionaries shaped like a real word list.
+
+This module measures the letter distribution and length histogram of a source
+word list and generates any number of synthetic words that follow both. Output
+is deterministic for a given seed, so benchmark runs are reproducible.
+
+Words are generated in batches (one `random.choices` call for all letters of a
+batch), which keeps generation of tens of millions of words practical.
+
+Example Usage:
+    from utils.data_loader import load_word_list
+    from utils.word_list_generator import WordListGenerator
+
+    generator = WordListGenerator(load_word_list("data/words_alpha.txt"), seed=42)
+    generator.write_word_list("data/synthetic_1m.txt", 1_000_000)
+"""
+
+import random
+from collections import Counter
+from itertools import accumulate
+from typing import Iterator, List
+
+
+class WordListGenerator:
+    """
+    Generates synthetic words matching a source list's letter and length distributions.
+
+    Attributes:
+        letters (List[str]): The letters seen in the source list.
+        letter_weights (List[int]): Cumulative occurrence counts of `letters`.
+        lengths (List[int]): The word lengths seen in the source list.
+        length_weights (List[int]): Cumulative occurrence counts of `lengths`.
+    """
+
+    def __init__(self, source_words: List[str], seed: int = 0) -> None:
+        """
+        Measure the source distributions and seed the generator.
+
+        Args:
+            source_words (List[str]): The word list whose shape should be matched.
+            seed (int): The random seed.
+
+        Raises:
+            ValueError: If the source word list is empty.
+        """
+        if not source_words:
+            raise ValueError("Source word list cannot be empty.")
+        letter_counts = Counter()
+        for word in source_words:
+            letter_counts.update(word)
+        length_counts = Counter(map(len, source_words))
+
+        self.letters: List[str] = sorted(letter_counts)
+        self.letter_weights: List[int] = list(accumulate(letter_counts[letter] for letter in self.letters))
+        self.lengths: List[int] = sorted(length_counts)
+        self.length_weights: List[int] = list(accumulate(length_counts[length] for length in self.lengths))
+        self._random = random.Random(seed)
+
+    def random_word(self, length: int) -> str:
+        """
+        Generate one word of a given length from the letter distribution.
+
+        Args:
+            length (int): The word length.
+
+        Returns:
+            str: The generated word.
+        """
+        return "".join(self._random.choices(self.letters, cum_weights=self.letter_weights, k=length))
+
+    def generate(self, count: int, batch_size: int = 100_000) -> Iterator[str]:
+        """
+        Generate synthetic words.
+
+        Args:
+            count (int): The number of words to generate.
+            batch_size (int): The number of words generated per batch.
+
+        Yields:
+            str: The generated words.
+        """
+        remaining = count
+        while remaining > 0:
+            batch = min(batch_size, remaining)
+            lengths = self._random.choices(self.lengths, cum_weights=self.length_weights, k=batch)
+            letters = "".join(
+                self._random.choices(self.letters, cum_weights=self.letter_weights, k=sum(lengths))
+            )
+            start = 0
+            for length in lengths:
+                yield letters[start:start + length]
+                start += length
+            remaining -= batch
+
+    def write_word_list(self, file_path: str, count: int) -> None:
+        """
+        Write a synthetic word list file with one word per line.
+
+        Args:
+            file_path (str): The output file path.
+            count (int): The number of words to generate.
+        """
+        with open(file_path, "w", encoding="utf-8") as file:
+            for word in self.generate(count):
+                file.write(word)
+                file.write("\n")
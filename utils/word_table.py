@@ -0,0 +1,297 @@
+"""
+Word Table: A sorted, front-coded word store shared by all indexes.
+
+Every index used to keep its own copy of every word. The word table stores the
+words once, in sorted order, so that a word's integer ID is its rank. A word that
+occurs more than once in the word list keeps one ID per occurrence, so results
+list it as often as the word list does.
+Indexes then hold IDs (in `array('I')`) and resolve them to strings only when
+results are produced.
+
+Sorted neighbours share long prefixes, so words are front-coded in blocks:
+the first word of a block is stored whole and every following word as the
+length of the prefix it shares with its predecessor plus the remaining bytes.
+Looking up an ID decodes at most one block, and recently decoded blocks are
+cached.
+
+File layout (little-endian):
+- Header: `b"WTBL\\x04\\x00\\x00\\x00"`, uint32 word count, uint32 block size, then the
+  source word list's uint64 size, int64 mtime in nanoseconds, uint32 path length and
+  UTF-8 absolute path, zero-padded to a multiple of 8 bytes.
+- uint64 offset of every block in the data section, plus a final end offset.
+- Data: per word, a uint8 shared-prefix length (at most 255), the suffix length as
+  an unsigned LEB128 varint (one byte below 128) and the suffix's UTF-8 bytes.
+
+A saved table is opened through mmap, so its pages are shared between every
+index and every process that uses it, and only the blocks actually read are
+brought into memory. Saving writes a temporary file and renames it over the
+old one, so tables already mapped by running processes are never truncated.
+When the word list's path, size or mtime no longer match the header, the
+table is rebuilt; its new mtime then makes every index rebuild too.
+
+Example Usage:
+    from utils.word_table import WordTable
+
+    table = WordTable.build(["cat", "act", "tac"])  # Or open_word_table(WordListLoader(path))
+    table.save("data/word_table.bin")
+    table = WordTable.load("data/word_table.bin")
+    table.lookup([0, 2])  # ["act", "tac"]
+"""
+
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+WORD_TABLE_PATH: str = "data/word_table.bin"
+MAGIC: bytes = b"WTBL\x04\x00\x00\x00"
+HEADER_FORMAT: str = "<IIQqI"  # Word count, block size, source size, source mtime_ns, source path length
+DEFAULT_BLOCK_SIZE: int = 8
+BLOCK_CACHE_SIZE: int = 4096
+MAX_SHARED_PREFIX: int = 255  # Longer shared prefixes are stored partly in the suffix
+
+_open_tables: Dict[str, "WordTable"] = {}
+
+# (absolute path, size, mtime_ns) of the word list a table was built from
+SourceStamp = Tuple[str, int, int]
+
+
+def source_stamp(word_list_path: str) -> SourceStamp:
+    """
+    Identify a word list file by its absolute path, size and modification time.
+
+    Args:
+        word_list_path (str): Path to the word list file.
+
+    Returns:
+        SourceStamp: The stamp recorded in tables built from the file.
+    """
+    status = os.stat(word_list_path)
+    return os.path.abspath(word_list_path), status.st_size, status.st_mtime_ns
+
+
+class WordTable:
+    """
+    Sorted words addressable by integer ID.
+
+    Attributes:
+        word_count (int): The number of words.
+        block_size (int): The number of words per front-coded block.
+        source (Optional[SourceStamp]): The word list the table was built from, if known.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        """
+        Open a table over its serialized bytes.
+
+        Args:
+            buffer (Union[bytes, mmap.mmap]): The serialized table.
+
+        Raises:
+            ValueError: If the buffer is not a word table.
+        """
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a word table: bad header.")
+        self._buffer: Union[bytes, mmap.mmap] = buffer
+        self.word_count, self.block_size, size, mtime_ns, path_length = struct.unpack_from(
+            HEADER_FORMAT, buffer, len(MAGIC)
+        )
+        path_start = len(MAGIC) + struct.calcsize(HEADER_FORMAT)
+        path = bytes(buffer[path_start:path_start + path_length]).decode()
+        self.source: Optional[SourceStamp] = (path, size, mtime_ns) if path else None
+        header_size = -(-(path_start + path_length) // 8) * 8
+        block_count = -(-self.word_count // self.block_size)
+        offsets_end = header_size + 8 * (block_count + 1)
+        self._offsets = memoryview(buffer)[header_size:offsets_end].cast("Q")
+        self._data = memoryview(buffer)[offsets_end:]
+        self._block: Callable[[int], List[str]] = lru_cache(maxsize=BLOCK_CACHE_SIZE)(self._decode_block)
+
+    @classmethod
+    def build(
+        cls, words: Iterable[str], block_size: int = DEFAULT_BLOCK_SIZE, source: Optional[SourceStamp] = None
+    ) -> "WordTable":
+        """
+        Build a table from words, sorting them and keeping repeated words.
+
+        Args:
+            words (Iterable[str]): The words.
+            block_size (int): The number of words per front-coded block.
+            source (Optional[SourceStamp]): The word list the words come from, recorded in the header.
+
+        Returns:
+            WordTable: The table.
+        """
+        encoded = sorted(word.encode() for word in words)  # UTF-8 byte order is code point order
+        offsets: List[int] = []
+        data = bytearray()
+        previous = b""
+        for position, word in enumerate(encoded):
+            if position % block_size == 0:
+                offsets.append(len(data))
+                previous = b""  # Blocks decode independently
+            shared = 0
+            limit = min(len(previous), len(word), MAX_SHARED_PREFIX)
+            while shared < limit and previous[shared] == word[shared]:
+                shared += 1
+            data.append(shared)
+            suffix_length = len(word) - shared
+            while suffix_length >= 0x80:  # LEB128: 7 bits per byte, high bit set on all but the last
+                data.append(suffix_length & 0x7F | 0x80)
+                suffix_length >>= 7
+            data.append(suffix_length)
+            data += word[shared:]
+            previous = word
+        offsets.append(len(data))
+
+        path, size, mtime_ns = source or ("", 0, 0)
+        path_bytes = path.encode()
+        header = MAGIC + struct.pack(HEADER_FORMAT, len(encoded), block_size, size, mtime_ns, len(path_bytes))
+        header += path_bytes
+        header += bytes(-len(header) % 8)
+        return cls(header + struct.pack(f"<{len(offsets)}Q", *offsets) + bytes(data))
+
+    @classmethod
+    def load(cls, file_path: str) -> "WordTable":
+        """
+        Open a saved table through a read-only memory map.
+
+        Args:
+            file_path (str): The table file.
+
+        Returns:
+            WordTable: The table.
+        """
+        with open(file_path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the table to a file, replacing any previous one atomically.
+
+        Args:
+            file_path (str): The table file.
+        """
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "wb") as f:
+                f.write(self._buffer)
+            os.replace(temporary_path, file_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def _decode_block(self, block: int) -> List[str]:
+        """
+        Decode every word of a block.
+
+        Args:
+            block (int): The block number.
+
+        Returns:
+            List[str]: The block's words in ID order.
+        """
+        data = bytes(self._data[self._offsets[block]:self._offsets[block + 1]])
+        words: List[str] = []
+        previous = b""
+        position = 0
+        while position < len(data):
+            shared, length = data[position], data[position + 1]
+            position += 2
+            if length >= 0x80:  # Suffixes of 128 bytes or more take further varint bytes
+                length &= 0x7F
+                shift = 7
+                while True:
+                    byte = data[position]
+                    position += 1
+                    length |= (byte & 0x7F) << shift
+                    if byte < 0x80:
+                        break
+                    shift += 7
+            previous = previous[:shared] + data[position:position + length]
+            words.append(previous.decode())
+            position += length
+        return words
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def __getitem__(self, word_id: int) -> str:
+        """
+        Resolve one word ID.
+
+        Args:
+            word_id (int): The word ID.
+
+        Returns:
+            str: The word.
+
+        Raises:
+            IndexError: If the ID is out of range.
+        """
+        if not 0 <= word_id < self.word_count:
+            raise IndexError(f"Word ID {word_id} is out of range.")
+        block, position = divmod(word_id, self.block_size)
+        return self._block(block)[position]
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield every word in ID order, decoding each block once without caching it."""
+        for block in range(len(self._offsets) - 1):
+            yield from self._decode_block(block)
+
+    def lookup(self, word_ids: Iterable[int]) -> List[str]:
+        """
+        Resolve word IDs to words.
+
+        Args:
+            word_ids (Iterable[int]): The word IDs.
+
+        Returns:
+            List[str]: The words, in the order of the IDs.
+        """
+        block_size = self.block_size
+        block = self._block
+        return [block(word_id // block_size)[word_id % block_size] for word_id in word_ids]
+
+
+def open_word_table(load_words: Callable[[], List[str]], file_path: str = WORD_TABLE_PATH) -> WordTable:
+    """
+    Open the shared word table, building and saving it from the word list if needed.
+
+    The table is rebuilt when it is missing, has an older format, or was built from a
+    different word list. The word list is known when `load_words` has a `file_path`
+    attribute (see WordListLoader); otherwise an existing table is trusted.
+    A word list that is named but missing is an error, even when a table exists.
+    The table is opened once per process, so every index loaded in the process shares it;
+    the cached table is reopened (or rebuilt) when the word list stamp no longer matches.
+
+    Args:
+        load_words (Callable[[], List[str]]): Loads the word list on demand.
+        file_path (str): The table file.
+
+    Returns:
+        WordTable: The memory-mapped table.
+
+    Raises:
+        FileNotFoundError: If `load_words` names a word list file that does not exist.
+    """
+    word_list_path = getattr(load_words, "file_path", None)
+    if word_list_path and not os.path.exists(word_list_path):
+        raise FileNotFoundError(f"Word list file not found at '{word_list_path}'.")
+    source = source_stamp(word_list_path) if word_list_path else None
+    table = _open_tables.get(file_path)
+    if table is not None and source is not None and table.source != source:
+        table = None  # Opened for another word list, or the word list changed since
+    if table is None:
+        if os.path.exists(file_path):
+            try:
+                table = WordTable.load(file_path)
+            except ValueError:  # Written by an older version
+                table = None
+            if table is not None and source is not None and table.source != source:
+                table = None
+        if table is None:
+            WordTable.build(load_words(), source=source).save(file_path)
+            table = WordTable.load(file_path)
+        _open_tables[file_path] = table
+    return table